@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark of a complete check of a host with many VRRP instances
+
+Runs the parse function of keepalived_vrrp once and the discovery and check
+functions of the instance and track process plug-ins for every service, like
+a check cycle of Checkmk does. Compares the section indexed by name of the
+checkout with the previous list section, which every check scanned for its
+item. Needs the Checkmk API, so run it as site user:
+
+    python3 keepalived_vrrp/benchmark/benchmark_keepalived_vrrp_host_check.py [INSTANCES] [ROUNDS]
+"""
+
+import importlib
+import json
+import sys
+import timeit
+import types
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+PLUGIN_DIR = BENCHMARK_DIR.parent / "src/cmk_addons_plugins/keepalived_vrrp"
+
+# item of the service being checked, selects the value store
+CURRENT_ITEM = [""]
+
+STATS = (
+    "advert_rcvd", "advert_sent", "become_master", "release_master", "packet_len_err",
+    "advert_interval_err", "ip_ttl_err", "invalid_type_rcvd", "addr_list_err",
+    "invalid_authtype", "authtype_mismatch", "auth_failure", "pri_zero_rcvd", "pri_zero_sent",
+)
+
+
+def load_agent_based_plugins():
+    # import the plug-ins of the checkout instead of the ones installed in the site
+    for name, path in [
+        ("cmk_addons.plugins.keepalived_vrrp", PLUGIN_DIR),
+        ("cmk_addons.plugins.keepalived_vrrp.agent_based", PLUGIN_DIR / "agent_based"),
+    ]:
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules[name] = package
+
+    prefix = "cmk_addons.plugins.keepalived_vrrp.agent_based."
+    vrrp = importlib.import_module(prefix + "keepalived_vrrp")
+    value_stores = {}
+    vrrp.get_value_store = lambda: value_stores.setdefault(CURRENT_ITEM[0], {})
+    return vrrp, importlib.import_module(prefix + "keepalived_vrrp_track_process")
+
+
+def status_string_table(instances):
+    status = {
+        "vrrp": [
+            {
+                "data": {
+                    "iname": "VI_%d" % number,
+                    "state": 2 if number % 2 else 1,
+                    "vrid": number % 255 + 1,
+                    "ifp_ifname": "eth%d" % (number // 255),
+                    "effective_priority": 100,
+                    "vips": ["10.%d.%d.1/32 dev eth0 scope global" % (number // 256, number % 256)],
+                },
+                "stats": {name: number for name in STATS},
+            }
+            for number in range(instances)
+        ],
+        "track_process": [
+            {
+                "process": "process_%d" % number,
+                "have_quorum": True,
+                "current_processes": 1,
+                "min_processes": 1,
+            }
+            for number in range(instances // 10)
+        ],
+    }
+    return [[json.dumps(status, separators=(",", ":"))]]
+
+
+def linear_plugins(vrrp, track_process):
+    """The list section and item scans used up to the indexed section"""
+
+    def parse(string_table):
+        section = json.loads(string_table[0][0])
+        if isinstance(section, list):
+            section = {"vrrp": section}
+        return section
+
+    def discover_vrrp(section):
+        for instance in section.get("vrrp", []):
+            yield vrrp.Service(item=instance["data"]["iname"])
+
+    def check_vrrp(item, params, section):
+        for instance in section.get("vrrp", []):
+            if item == instance["data"]["iname"]:
+                yield from vrrp.check_keepalived_vrrp(item, params, {"vrrp": {item: instance}})
+                return
+
+    def discover_track_process(section):
+        for instance in section.get("track_process", []):
+            yield vrrp.Service(item=instance["process"])
+
+    def check_track_process(item, params, section):
+        for instance in section.get("track_process", []):
+            if item == instance["process"]:
+                yield from track_process.check_keepalived_vrrp_track_process(
+                    item, params, {"track_process": {item: instance}}
+                )
+
+    return parse, [(discover_vrrp, check_vrrp), (discover_track_process, check_track_process)]
+
+
+def indexed_plugins(vrrp, track_process):
+    return vrrp.parse_keepalived_vrrp, [
+        (vrrp.discover_keepalived_vrrp, vrrp.check_keepalived_vrrp),
+        (
+            track_process.discover_keepalived_vrrp_track_process,
+            track_process.check_keepalived_vrrp_track_process,
+        ),
+    ]
+
+
+def check_host(parse_function, plugins, string_table, params):
+    section = parse_function(string_table)
+    for (discovery_function, check_function), plugin_params in zip(plugins, params):
+        for service in discovery_function(section):
+            CURRENT_ITEM[0] = service.item
+            for _result in check_function(service.item, plugin_params, section):
+                pass
+
+
+def main():
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    vrrp, track_process = load_agent_based_plugins()
+    params = [
+        vrrp.check_plugin_keepalived_vrrp.check_default_parameters,
+        track_process.check_plugin_keepalived_vrrp_track_process.check_default_parameters,
+    ]
+    table = status_string_table(instances)
+    print(
+        "%d instances, %d track processes, %d bytes of JSON, best of %d rounds"
+        % (instances, instances // 10, len(table[0][0]), rounds)
+    )
+
+    results = {}
+    for name, (parse_function, plugins) in [
+        ("linear scans", linear_plugins(vrrp, track_process)),
+        ("indexed section", indexed_plugins(vrrp, track_process)),
+    ]:
+        results[name] = min(
+            timeit.repeat(
+                lambda parse_function=parse_function, plugins=plugins: check_host(
+                    parse_function, plugins, table, params
+                ),
+                number=1,
+                repeat=rounds,
+            )
+        )
+        print("  %-16s host check %8.2f ms" % (name, results[name] * 1000))
+
+    print("  speedup of the host check: %.2fx" % (results["linear scans"] / results["indexed section"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""Benchmark of parse_keepalived_vrrp on a multi-megabyte keepalived status
+
+Compares the whole status in one line, printed by the former agent plug-in,
+with the lines per instance and track process printed by the agent plug-in of
+the checkout. The status has all fields keepalived writes to its JSON file,
+the agent plug-in drops the ones no check uses. Both are parsed by the parse
+function of the checkout, then the discovery, all services or a few services
+are checked. Needs the Checkmk API, so run it as site user:
+
+    python3 keepalived_vrrp/benchmark/benchmark_parse_keepalived_vrrp.py [INSTANCES] [ROUNDS]
+"""
+
+import importlib.util
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+AGENT_PLUGIN = BENCHMARK_DIR.parent / "src/agents/plugins/keepalived_vrrp.py"
+
+sys.path.insert(0, str(BENCHMARK_DIR))
+
+from benchmark_keepalived_vrrp_host_check import (  # pylint: disable=wrong-import-position
+    CURRENT_ITEM,
+    STATS,
+    load_agent_based_plugins,
+)
+
+# services checked in the scenario "few services"
+FEW_SERVICES = 10
+
+
+def load_agent_plugin():
+    spec = importlib.util.spec_from_file_location("keepalived_vrrp_agent_plugin", AGENT_PLUGIN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def instance_status(number):
+    """A VRRP instance with the fields of the JSON status of keepalived 2.2"""
+    interface = "eth%d" % (number // 255)
+    return {
+        "data": {
+            "iname": "VI_%d" % number,
+            "dont_track_primary": 0,
+            "skip_check_adv_addr": 0,
+            "strict_mode": 0,
+            "vmac_ifname": "vrrp.%d" % (number % 255 + 1),
+            "ifp_ifname": interface,
+            "master_priority": 100,
+            "last_transition": 1700000000.123456 + number,
+            "garp_delay": 5,
+            "garp_refresh": 0,
+            "garp_rep": 5,
+            "garp_refresh_rep": 1,
+            "garp_lower_prio_delay": 5,
+            "garp_lower_prio_rep": 5,
+            "lower_prio_no_advert": 0,
+            "higher_prio_send_advert": 0,
+            "vrid": number % 255 + 1,
+            "base_priority": 100,
+            "effective_priority": 100,
+            "vipset": True,
+            "promote_secondaries": False,
+            "evip": [
+                "fd00:%x::%d/64 dev %s scope global" % (number, address, interface)
+                for address in range(4)
+            ],
+            "vips": [
+                "10.%d.%d.%d/32 dev %s scope global" % (number // 256, number % 256, address, interface)
+                for address in range(4)
+            ],
+            "vroutes": [],
+            "vrules": [],
+            "track_ifp": [{"name": interface, "weight": 0}],
+            "track_script": [{"name": "chk_haproxy", "weight": -20}],
+            "smtp_alert": False,
+            "notify_deleted": False,
+            "state": 2 if number % 2 else 1,
+            "wantstate": 2 if number % 2 else 1,
+            "version": 2,
+            "adver_int": 1,
+            "master_adver_int": 1,
+            "accept": 1,
+            "nopreempt": False,
+            "preempt_delay": 0,
+            "preempt_time": 0,
+            "auth_type": 1,
+            "auth_data": "secret%d" % number,
+            "script_backup": "/etc/keepalived/notify.sh backup VI_%d" % number,
+            "script_master": "/etc/keepalived/notify.sh master VI_%d" % number,
+            "script_fault": "/etc/keepalived/notify.sh fault VI_%d" % number,
+            "script_stop": "/etc/keepalived/notify.sh stop VI_%d" % number,
+            "script_deleted": "/etc/keepalived/notify.sh deleted VI_%d" % number,
+            "script": "/etc/keepalived/notify.sh",
+            "script_master_rx_lower_pri": "",
+        },
+        "stats": {name: number * 1000 for name in STATS},
+    }
+
+
+def status(instances):
+    return {
+        "vrrp": [instance_status(number) for number in range(instances)],
+        "track_process": [
+            {
+                "process": "process_%d" % number,
+                "have_quorum": True,
+                "current_processes": 1,
+                "min_processes": 1,
+                "max_processes": 0,
+                "weight": 0,
+                "terminate_delay": 0,
+                "fork_delay": 0,
+                "full_command": False,
+                "param_match": "initial",
+                "processes": [1000 + number],
+            }
+            for number in range(instances // 10)
+        ],
+        "time": 1700003600.0,
+    }
+
+
+def check_services(vrrp, section, services):
+    params = vrrp.check_plugin_keepalived_vrrp.check_default_parameters
+    items = [service.item for service in vrrp.discover_keepalived_vrrp(section)]
+    for item in items if services is None else items[:services]:
+        CURRENT_ITEM[0] = item
+        for _result in vrrp.check_keepalived_vrrp(item, params, section):
+            pass
+
+
+def scenario(vrrp, services):
+    def run(string_table):
+        section = vrrp.parse_keepalived_vrrp(string_table)
+        check_services(vrrp, section, services)
+        return section
+
+    return run
+
+
+def measure(name, function, string_table, rounds):
+    seconds = min(timeit.repeat(lambda: function(string_table), number=1, repeat=rounds))
+    tracemalloc.start()
+    section = function(string_table)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del section
+    print(
+        "  %-34s %9.2f ms %9.1f KiB retained %9.1f KiB peak"
+        % (name, seconds * 1000, retained / 1024, peak / 1024)
+    )
+    return seconds
+
+
+def main():
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    vrrp, _track_process = load_agent_based_plugins()
+    agent = load_agent_plugin()
+
+    full_status = status(instances)
+    single_line = [[json.dumps(full_status, separators=(",", ":"))]]
+    per_line = [[line.rstrip("\n")] for line in agent.status_lines(full_status)]
+    print(
+        "%d instances, %d track processes, best of %d rounds" % (instances, instances // 10, rounds)
+    )
+    print(
+        "  agent output: %.1f MiB in one line, %.1f MiB in %d lines"
+        % (
+            len(single_line[0][0]) / 2**20,
+            sum(len(line) + 1 for (line,) in per_line) / 2**20,
+            len(per_line),
+        )
+    )
+
+    results = {}
+    for services, title in [
+        (0, "parse and discovery"),
+        (FEW_SERVICES, "%d services checked" % FEW_SERVICES),
+        (None, "all services checked"),
+    ]:
+        print(title)
+        for name, string_table in [("one line", single_line), ("one line per item", per_line)]:
+            results[name] = measure(name, scenario(vrrp, services), string_table, rounds)
+        print("  speedup: %.2fx" % (results["one line"] / results["one line per item"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,756 @@
+#!/usr/bin/env python3
+"""Checkmk agent plug-in for the VRRP instances of keepalived
+
+keepalived writes its state as JSON file when it receives the JSON signal. The
+plug-in watches the directory of the file with inotify and reads the file as
+soon as keepalived closes it. Without inotify (e.g. no ctypes or an old
+kernel) the file is polled. The file is only printed if it contains complete
+JSON, the time until it was complete is printed in the section
+keepalived_vrrp_agent.
+
+With KEEPALIVED_NOTIFY_FIFO (the notify_fifo of keepalived.conf) keepalived is
+not signalled on every run. A listener started by the plug-in keeps the states
+announced on the FIFO in $MK_VARDIR/keepalived_vrrp_fifo.state. The JSON status
+with the counters is only requested every KEEPALIVED_JSON_INTERVAL seconds, the
+instance states of the last JSON status are replaced by the ones received later
+on the FIFO.
+
+Several keepalived daemons, e.g. in network namespaces, are configured by
+their names in KEEPALIVED_DAEMONS, with KEEPALIVED_DAEMONS=auto the main
+processes of keepalived are found in /proc and named by their network
+namespace. They are collected concurrently, every daemon gets a sub-section
+[[[name]]]. The pid file, JSON status file and notify_fifo of a daemon are set
+with the name appended to the variable, the defaults are the file names of
+keepalived --namespace=<name>. The JSON status file of a detected daemon is
+read through /proc/<pid>/root, so also in the /tmp of a container.
+
+With KEEPALIVED_VERIFY_VIPS=1 the VIPs of the MASTER instances are looked up
+in the addresses of their interfaces, read with "ip -j addr" once per network
+namespace. The VIPs not configured are added as vips_missing to the instance.
+
+The IPVS virtual servers of keepalived are read from /proc/<pid>/net/ip_vs
+and ip_vs_stats of the keepalived process, so every network namespace is read
+once without running ipvsadm. Without the ip_vs module the files are missing and
+the section keepalived_vrrp_ipvs is not printed.
+
+The status is printed as one line per VRRP instance and track process, with
+the name (and VRID and interface of an instance) in front of a compact JSON
+document, e.g. "instance VI_1 51 eth0 {...}". Only the fields used by the
+checks are printed, so the check decodes just the lines of the services it
+checks.
+
+Configuration in $MK_CONFDIR/keepalived_vrrp.cfg (shell syntax):
+
+KEEPALIVED_BIN="keepalived"
+KEEPALIVED_PIDFILE="/var/run/keepalived.pid"
+KEEPALIVED_STATUS_JSON="/tmp/keepalived.json"
+KEEPALIVED_TIMEOUT=5
+KEEPALIVED_NOTIFY_FIFO="/run/keepalived/notify.fifo"
+KEEPALIVED_JSON_INTERVAL=3600
+KEEPALIVED_VERIFY_VIPS=0
+KEEPALIVED_DAEMONS="lb1 lb2"
+KEEPALIVED_PIDFILE_lb1="/run/keepalived/lb1/keepalived.pid"
+KEEPALIVED_STATUS_JSON_lb1="/tmp/keepalived_lb1.json"
+KEEPALIVED_NOTIFY_FIFO_lb1="/run/keepalived/lb1/notify.fifo"
+"""
+
+__version__ = "2.2.0p17"
+
+import ctypes
+import ctypes.util
+import ipaddress
+import json
+import os
+import select
+import shlex
+import shutil
+import stat
+import struct
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_CONFIG = {
+    "KEEPALIVED_BIN": "keepalived",
+    "KEEPALIVED_PIDFILE": "/var/run/keepalived.pid",
+    "KEEPALIVED_STATUS_JSON": "/tmp/keepalived.json",
+    "KEEPALIVED_TIMEOUT": "5",
+    "KEEPALIVED_NOTIFY_FIFO": "",
+    "KEEPALIVED_JSON_INTERVAL": "3600",
+    "KEEPALIVED_VERIFY_VIPS": "0",
+    "KEEPALIVED_DAEMONS": "",
+}
+
+# set per daemon with the name of the daemon appended, e.g. KEEPALIVED_PIDFILE_lb1
+DAEMON_OPTIONS = ("KEEPALIVED_PIDFILE", "KEEPALIVED_STATUS_JSON", "KEEPALIVED_NOTIFY_FIFO")
+
+# states announced on the notify_fifo, numbered like in the JSON status
+FIFO_STATES = {
+    "BACKUP": 1,
+    "MASTER": 2,
+    "FAULT": 3,
+    "DELETED": 97,
+    "STOP": 98,
+}
+
+# the fields of the status used by the checks, the others are not printed
+DATA_FIELDS = ("iname", "state", "vrid", "ifp_ifname", "effective_priority", "vips")
+TRACK_PROCESS_FIELDS = ("process", "have_quorum", "current_processes", "min_processes", "max_processes")
+
+# tables of IPVS in /proc/<pid>/net
+IPVS_FILES = ("ip_vs", "ip_vs_stats")
+
+# from linux/inotify.h
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def read_config(path):
+    config = dict(DEFAULT_CONFIG)
+    try:
+        with open(path, encoding="utf-8") as config_file:
+            lines = config_file.readlines()
+    except OSError:
+        return config
+    for line in lines:
+        try:
+            words = shlex.split(line, comments=True)
+        except ValueError:
+            continue
+        for word in words:
+            name, separator, value = word.partition("=")
+            if separator and (name in config or name.startswith(tuple(o + "_" for o in DAEMON_OPTIONS))):
+                config[name] = value
+    return config
+
+
+def json_signal(binary, state_file):
+    """Number of the JSON signal of keepalived, only asked once per binary"""
+    # the path of a binary without directory, like the default keepalived, is looked up in PATH
+    path = binary if os.sep in binary else shutil.which(binary)
+    try:
+        binary_mtime = os.stat(path).st_mtime if path else None
+    except OSError:
+        binary_mtime = None
+    cache_key = "%s %s" % (binary, binary_mtime)
+    try:
+        with open(state_file, encoding="utf-8") as cache:
+            cached_key, _, signum = cache.read().rstrip("\n").rpartition(" ")
+        if binary_mtime is not None and cached_key == cache_key:
+            return int(signum)
+    except (OSError, ValueError):
+        pass
+
+    signum = int(
+        subprocess.run(
+            [binary, "--signum=JSON"], check=True, stdout=subprocess.PIPE, universal_newlines=True
+        ).stdout
+    )
+    try:
+        with open(state_file, "w", encoding="utf-8") as cache:
+            cache.write("%s %d\n" % (cache_key, signum))
+    except OSError:
+        pass
+    return signum
+
+
+def load_status(path):
+    """The status, or None as long as the file is missing or not complete"""
+    try:
+        with open(path, encoding="utf-8") as status_file:
+            return json.load(status_file)
+    except (OSError, ValueError):
+        return None
+
+
+class Inotify:
+    """Minimal inotify binding, only the events of a single directory are needed"""
+
+    def __init__(self, directory, mask):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), mask) < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, "inotify_add_watch failed")
+
+    def names(self, timeout):
+        """Names of the files with events, empty after the timeout"""
+        if not select.select([self.fd], [], [], max(timeout, 0))[0]:
+            return []
+        try:
+            buffer = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return []
+        names = []
+        offset = 0
+        while offset < len(buffer):
+            _wd, _mask, _cookie, length = INOTIFY_EVENT.unpack_from(buffer, offset)
+            offset += INOTIFY_EVENT.size
+            names.append(os.fsdecode(buffer[offset : offset + length].rstrip(b"\0")))
+            offset += length
+        return names
+
+    def close(self):
+        os.close(self.fd)
+
+
+def wait_inotify(inotify, path, deadline):
+    name = os.path.basename(path)
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        if name in inotify.names(remaining):
+            # a complete JSON document, not only a closed file
+            status = load_status(path)
+            if status is not None:
+                return status
+
+
+def wait_polling(path, deadline):
+    delay = 0.005
+    while True:
+        status = load_status(path)
+        if status is not None or time.monotonic() >= deadline:
+            return status
+        time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+        delay = min(delay * 2, 0.1)
+
+
+def add_time(status, timestamp):
+    """The status as object with the time it was written, the check computes the counter rates with it"""
+    if isinstance(status, list):
+        status = {"vrrp": status}
+    status["time"] = round(timestamp, 3)
+    return status
+
+
+def daemon_pid(daemon):
+    if daemon["pid"] is None:
+        with open(daemon["pidfile"], encoding="utf-8") as pidfile:
+            daemon["pid"] = int(pidfile.read().strip())
+    return daemon["pid"]
+
+
+def collect(daemon, config, signum):
+    try:
+        pid = daemon_pid(daemon)
+    except (OSError, ValueError):
+        # keepalived is not running
+        return None, {}
+
+    path = daemon["json"]
+    timeout = float(config["KEEPALIVED_TIMEOUT"])
+    # never print an old file
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+    # watch before signalling, the file may be written before the signal call returns
+    try:
+        inotify = Inotify(os.path.dirname(path) or ".", IN_CLOSE_WRITE | IN_MOVED_TO)
+        method = "inotify"
+    except (OSError, AttributeError):
+        inotify = None
+        method = "polling"
+
+    start = time.monotonic()
+    try:
+        os.kill(pid, signum())
+        if inotify is not None:
+            status = wait_inotify(inotify, path, start + timeout)
+        else:
+            status = wait_polling(path, start + timeout)
+    finally:
+        if inotify is not None:
+            inotify.close()
+    stats = {"method": method, "latency": "%.6f" % (time.monotonic() - start)}
+
+    if status is None:
+        stats["error"] = "No complete status file %s within %g s" % (path, timeout)
+    else:
+        status = add_time(status, time.time())
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+    return status, stats
+
+
+def write_atomic(path, data):
+    with open(path + ".new", "w", encoding="utf-8") as new_file:
+        json.dump(data, new_file, separators=(",", ":"))
+    os.rename(path + ".new", path)
+
+
+def read_json(path):
+    try:
+        with open(path, encoding="utf-8") as json_file:
+            return json.load(json_file)
+    except (OSError, ValueError):
+        return None
+
+
+def parse_fifo_line(line):
+    """Instance name, state and priority of a line like 'INSTANCE "VI_1" MASTER 100'"""
+    try:
+        words = shlex.split(line)
+    except ValueError:
+        return None
+    if len(words) < 3 or words[0] != "INSTANCE" or words[2] not in FIFO_STATES:
+        return None
+    priority = int(words[3]) if len(words) > 3 and words[3].isdigit() else None
+    return words[1], FIFO_STATES[words[2]], priority
+
+
+def listen(fifo_path, state_path):
+    """Keep the instance states announced on the FIFO, runs until the plug-in is removed"""
+    states = read_json(state_path) or {}
+    fifo = None
+    pending = b""
+    while os.path.exists(__file__):
+        try:
+            reopen = fifo is None or os.stat(fifo_path).st_ino != os.fstat(fifo).st_ino
+        except OSError:
+            # keepalived removed the FIFO on stop
+            reopen = True
+        if reopen:
+            # keepalived creates the FIFO on start, it may be a new one after a restart
+            if fifo is not None:
+                os.close(fifo)
+                fifo = None
+            try:
+                if not stat.S_ISFIFO(os.stat(fifo_path).st_mode):
+                    raise OSError("%s is not a FIFO" % fifo_path)
+                # opened for writing too, so there is no end of file if keepalived closes it
+                fifo = os.open(fifo_path, os.O_RDWR | os.O_NONBLOCK)
+            except OSError:
+                time.sleep(10)
+                continue
+
+        if not select.select([fifo], [], [], 60)[0]:
+            continue
+        try:
+            pending += os.read(fifo, 65536)
+        except BlockingIOError:
+            continue
+        *lines, pending = pending.split(b"\n")
+        changed = False
+        for line in lines:
+            event = parse_fifo_line(line.decode("utf-8", "replace"))
+            if event is not None:
+                name, state, priority = event
+                states[name] = {"state": state, "priority": priority, "time": time.time()}
+                changed = True
+        if changed:
+            write_atomic(state_path, states)
+
+
+def listener_args(daemon):
+    return [os.path.abspath(__file__), "--listen"] + ([daemon["name"]] if daemon["name"] else [])
+
+
+def ensure_listener(daemon, vardir):
+    """Starts the FIFO listener unless it is still running, True if it was started"""
+    pidfile = os.path.join(vardir, "keepalived_vrrp_fifo%s.pid" % daemon["suffix"])
+    args = listener_args(daemon)
+    try:
+        with open(pidfile, encoding="utf-8") as listener_pidfile:
+            pid = int(listener_pidfile.read())
+        with open("/proc/%d/cmdline" % pid, "rb") as cmdline:
+            # the PID may have been reused since
+            if cmdline.read().rstrip(b"\0").split(b"\0")[-len(args):] == [arg.encode() for arg in args]:
+                return False
+    except (OSError, ValueError):
+        pass
+
+    with open(os.devnull, "r+b") as devnull:
+        listener = subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable] + args,
+            stdin=devnull,
+            stdout=devnull,
+            stderr=devnull,
+            close_fds=True,
+            start_new_session=True,
+        )
+    with open(pidfile, "w", encoding="utf-8") as listener_pidfile:
+        listener_pidfile.write("%d\n" % listener.pid)
+    return True
+
+
+def collect_fifo(daemon, config, vardir, signum):
+    """The last JSON status with the instance states received later on the FIFO"""
+    started = ensure_listener(daemon, vardir)
+
+    cache_path = os.path.join(vardir, "keepalived_vrrp_fifo%s.json" % daemon["suffix"])
+    cache = read_json(cache_path)
+    stats = {"method": "notify_fifo"}
+    try:
+        os.kill(daemon_pid(daemon), 0)
+    except (ProcessLookupError, FileNotFoundError, ValueError):
+        # keepalived is gone, maybe without a STOP on the FIFO: the states of the cache are not valid anymore
+        if cache is not None:
+            os.remove(cache_path)
+        cache = None
+    now = time.time()
+    # without a listener the state changes since the cache was written are lost
+    if started or cache is None or now - cache["time"] >= float(config["KEEPALIVED_JSON_INTERVAL"]):
+        status, json_stats = collect(daemon, config, signum)
+        json_stats.pop("method", None)
+        stats.update(json_stats)
+        if status is not None:
+            cache = {"time": now, "status": status}
+            write_atomic(cache_path, cache)
+    if cache is None:
+        return None, stats
+    stats["json_age"] = "%d" % (now - cache["time"])
+
+    status = cache["status"]
+    instances = status if isinstance(status, list) else status.get("vrrp", [])
+    by_name = {instance["data"]["iname"]: instance for instance in instances}
+    state_path = os.path.join(vardir, "keepalived_vrrp_fifo%s.state" % daemon["suffix"])
+    for name, fifo_state in (read_json(state_path) or {}).items():
+        if fifo_state["time"] <= cache["time"]:
+            continue
+        if name not in by_name:
+            # instance added since the last JSON status
+            by_name[name] = {"data": {"iname": name}, "stats": {}}
+            instances.append(by_name[name])
+        by_name[name]["data"]["state"] = fifo_state["state"]
+        if fifo_state["priority"] is not None:
+            by_name[name]["data"]["effective_priority"] = fifo_state["priority"]
+    return status, stats
+
+
+def daemon_config(config, name, pid=None, file_suffix=None):
+    """Files of a keepalived daemon, the daemon without name uses the options without suffix
+
+    file_suffix is the one keepalived appends to its files, if it differs from
+    the name. The default JSON file of a detected daemon is read in its mount
+    namespace, e.g. the /tmp of a container.
+    """
+    suffix = "_" + name if name else ""
+    json_file = "/tmp/keepalived%s.json" % (suffix if file_suffix is None else file_suffix)
+    if pid is not None:
+        json_file = "/proc/%d/root%s" % (pid, json_file)
+    return {
+        "name": name,
+        "suffix": suffix,
+        "pid": pid,
+        "pidfile": config.get("KEEPALIVED_PIDFILE" + suffix, "/run/keepalived/%s/keepalived.pid" % name),
+        "json": config.get("KEEPALIVED_STATUS_JSON" + suffix, json_file),
+        "fifo": config.get("KEEPALIVED_NOTIFY_FIFO" + suffix, ""),
+    }
+
+
+def option_value(args, short, long):
+    for index, arg in enumerate(args):
+        if arg in (long, short):
+            return args[index + 1] if index + 1 < len(args) else None
+        if arg.startswith(long + "="):
+            return arg[len(long) + 1 :]
+        if short and arg.startswith(short) and len(arg) > len(short) and not arg.startswith("--"):
+            return arg[len(short) :]
+    return None
+
+
+def file_name(path):
+    """'lb1' of /etc/keepalived/lb1.conf, nothing for the default names of keepalived"""
+    name = os.path.splitext(os.path.basename(path or ""))[0]
+    return "" if name == "keepalived" else name
+
+
+def network_namespaces():
+    """Names of the network namespaces created by ip netns by their inode"""
+    namespaces = {}
+    try:
+        names = os.listdir("/run/netns")
+    except OSError:
+        return namespaces
+    for name in names:
+        try:
+            namespaces[os.stat(os.path.join("/run/netns", name)).st_ino] = name
+        except OSError:
+            pass
+    return namespaces
+
+
+def detect_daemons(config):
+    """The main processes of keepalived, named by network namespace and instance
+
+    keepalived forks its VRRP and checker processes, only the parent process
+    handles the JSON signal. A daemon in the network namespace of the agent
+    has no name, the one of --namespace or net_namespace otherwise. The inode
+    of an unnamed network namespace, e.g. of a container, changes on every
+    start, such a daemon is named by --instance or the name of its
+    configuration or pid file. Only without any of them the inode is used,
+    configure such daemons by name in KEEPALIVED_DAEMONS.
+    """
+    comm = os.path.basename(config["KEEPALIVED_BIN"])[:15]
+    processes = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open("/proc/%s/stat" % entry, encoding="utf-8") as stat_file:
+                proc_stat = stat_file.read()
+        except OSError:
+            continue
+        name = proc_stat[proc_stat.index("(") + 1 : proc_stat.rindex(")")]
+        ppid = int(proc_stat[proc_stat.rindex(")") + 2 :].split()[1])
+        processes[int(entry)] = (name, ppid)
+
+    own_namespace = os.stat("/proc/self/ns/net").st_ino
+    namespaces = network_namespaces()
+    daemons = []
+    for pid, (name, ppid) in sorted(processes.items()):
+        if name != comm or processes.get(ppid, ("",))[0] == comm:
+            continue
+        try:
+            with open("/proc/%d/cmdline" % pid, "rb") as cmdline:
+                args = [os.fsdecode(arg) for arg in cmdline.read().rstrip(b"\0").split(b"\0")]
+            namespace = os.stat("/proc/%d/ns/net" % pid).st_ino
+        except OSError:
+            continue
+        instance = option_value(args, None, "--instance")
+        names = []
+        file_suffix = None
+        if namespace != own_namespace:
+            namespace_name = option_value(args, "-s", "--namespace") or namespaces.get(namespace)
+            if namespace_name is None:
+                # keepalived does not know the namespace, its files only have the instance
+                file_suffix = "_" + instance if instance else ""
+                if not instance:
+                    namespace_name = (
+                        file_name(option_value(args, "-f", "--use-file"))
+                        or file_name(option_value(args, "-p", "--pid"))
+                        or str(namespace)
+                    )
+            if namespace_name is not None:
+                names.append(namespace_name)
+        if instance is not None:
+            names.append(instance)
+        daemons.append(daemon_config(config, "_".join(names), pid, file_suffix))
+    return daemons
+
+
+def configured_daemons(config):
+    names = config["KEEPALIVED_DAEMONS"].split()
+    if names == ["auto"]:
+        return detect_daemons(config)
+    return [daemon_config(config, name) for name in names or [""]]
+
+
+def json_signal_once(binary, state_file):
+    """json_signal for the threads collecting the daemons, only called if needed"""
+    lock = threading.Lock()
+    signums = []
+
+    def signum():
+        with lock:
+            if not signums:
+                signums.append(json_signal(binary, state_file))
+            return signums[0]
+
+    return signum
+
+
+def interface_addresses(pid):
+    """Addresses by interface in the network namespace of the process"""
+    command = ["ip", "-j", "addr", "show"]
+    if os.stat("/proc/%d/ns/net" % pid).st_ino != os.stat("/proc/self/ns/net").st_ino:
+        command = ["nsenter", "--net=/proc/%d/ns/net" % pid] + command
+    links = json.loads(
+        subprocess.run(command, check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    )
+    return {
+        link["ifname"]: {ipaddress.ip_address(address["local"]) for address in link.get("addr_info", [])}
+        for link in links
+    }
+
+
+def vip_configured(vip, data, addresses):
+    """If a VIP like '10.0.0.1/32 dev eth0 scope global' is an address of its interface"""
+    words = vip.split()
+    device = words[words.index("dev") + 1] if "dev" in words[:-1] else data.get("ifp_ifname")
+    try:
+        address = ipaddress.ip_address(words[0].split("/")[0])
+    except (IndexError, ValueError):
+        # not verified
+        return True
+    return address in addresses.get(device, ())
+
+
+def verify_vips(daemons, results):
+    """Add the VIPs missing on their interface to the MASTER instances
+
+    The addresses are read once per network namespace, independent of the
+    number of instances and VIPs.
+    """
+    addresses = {}
+    for daemon, (status, stats) in zip(daemons, results):
+        if status is None:
+            continue
+        instances = status if isinstance(status, list) else status.get("vrrp", [])
+        masters = [instance for instance in instances if instance["data"].get("state") == 2]
+        if not masters:
+            continue
+        try:
+            pid = daemon_pid(daemon)
+            namespace = os.stat("/proc/%d/ns/net" % pid).st_ino
+            if namespace not in addresses:
+                addresses[namespace] = interface_addresses(pid)
+        except (OSError, ValueError, subprocess.CalledProcessError) as error:
+            stats["vips_error"] = str(error)
+            continue
+        for instance in masters:
+            instance["vips_missing"] = [
+                vip
+                for vip in instance["data"].get("vips", [])
+                if not vip_configured(vip, instance["data"], addresses[namespace])
+            ]
+
+
+def compact_json(document):
+    return json.dumps(document, separators=(",", ":"))
+
+
+def status_lines(status):
+    """One line per instance and track process with the fields used by the checks"""
+    if isinstance(status, list):
+        status = {"vrrp": status}
+    for instance in status.get("vrrp", []):
+        data = instance["data"]
+        document = {
+            "data": {field: data[field] for field in DATA_FIELDS if field in data},
+            "stats": instance.get("stats", {}),
+            "time": status.get("time"),
+        }
+        if "vips_missing" in instance:
+            document["vips_missing"] = instance["vips_missing"]
+        yield "instance %s %s %s %s\n" % (
+            data["iname"],
+            data.get("vrid", "-"),
+            data.get("ifp_ifname", "-"),
+            compact_json(document),
+        )
+    for process in status.get("track_process", []):
+        document = {field: process[field] for field in TRACK_PROCESS_FIELDS if field in process}
+        yield "track_process %s %s\n" % (process["process"], compact_json(document))
+
+
+def read_ipvs(daemons):
+    """The IPVS tables in the network namespace of every daemon
+
+    None for a daemon which is not running, without the ip_vs module or
+    sharing the network namespace with a daemon before.
+    """
+    namespaces = set()
+    tables = []
+    for daemon in daemons:
+        try:
+            pid = daemon_pid(daemon)
+            namespace = os.stat("/proc/%d/ns/net" % pid).st_ino
+            if namespace in namespaces:
+                tables.append(None)
+                continue
+            namespaces.add(namespace)
+            files = {}
+            for name in IPVS_FILES:
+                with open("/proc/%d/net/%s" % (pid, name), encoding="utf-8") as table:
+                    files[name] = table.read()
+        except (OSError, ValueError):
+            tables.append(None)
+            continue
+        tables.append(files)
+    return tables
+
+
+def collect_daemon(daemon, config, vardir, signum):
+    try:
+        if daemon["fifo"]:
+            return collect_fifo(daemon, config, vardir, signum)
+        return collect(daemon, config, signum)
+    except (OSError, ValueError, subprocess.CalledProcessError) as error:
+        return None, {"error": str(error)}
+
+
+def run_listener(config, vardir):
+    """The FIFO listener of the daemon named on the command line, started by ensure_listener"""
+    daemon = daemon_config(config, sys.argv[2] if len(sys.argv) > 2 else "")
+    listen(daemon["fifo"], os.path.join(vardir, "keepalived_vrrp_fifo%s.state" % daemon["suffix"]))
+
+
+def collect_all(config, vardir):
+    """The daemons with their status and statistics, collected concurrently"""
+    try:
+        daemons = configured_daemons(config)
+    except OSError as error:
+        return [], [(None, {"error": str(error)})]
+    if not daemons:
+        return daemons, []
+    signum = json_signal_once(config["KEEPALIVED_BIN"], os.path.join(vardir, "keepalived_vrrp.signum"))
+    with ThreadPoolExecutor(max_workers=len(daemons)) as executor:
+        results = list(
+            executor.map(lambda daemon: collect_daemon(daemon, config, vardir, signum), daemons)
+        )
+    return daemons, results
+
+
+def print_sections(headers, results, ipvs):
+    if any(status is not None for status, _stats in results):
+        sys.stdout.write("<<<keepalived_vrrp:sep(0)>>>\n")
+        for header, (status, _stats) in zip(headers, results):
+            if status is not None:
+                sys.stdout.write(header)
+                sys.stdout.writelines(status_lines(status))
+    if any(files is not None for files in ipvs):
+        sys.stdout.write("<<<keepalived_vrrp_ipvs:sep(0)>>>\n")
+        for header, files in zip(headers, ipvs):
+            if files is not None:
+                sys.stdout.write(header)
+                for name in IPVS_FILES:
+                    sys.stdout.write("[%s]\n" % name)
+                    sys.stdout.writelines(line + "\n" for line in files[name].splitlines() if line.strip())
+    if any(stats for _status, stats in results):
+        sys.stdout.write("<<<keepalived_vrrp_agent:sep(0)>>>\n")
+        for header, (_status, stats) in zip(headers, results):
+            if stats:
+                sys.stdout.write(header)
+                for key, value in sorted(stats.items()):
+                    sys.stdout.write("%s %s\n" % (key, value))
+
+
+def main():
+    config = read_config(
+        os.path.join(os.environ.get("MK_CONFDIR", "/etc/check_mk"), "keepalived_vrrp.cfg")
+    )
+    vardir = os.environ.get("MK_VARDIR", "/var/lib/check_mk_agent")
+    if sys.argv[1:2] == ["--listen"]:
+        run_listener(config, vardir)
+        return
+
+    daemons, results = collect_all(config, vardir)
+    if config["KEEPALIVED_VERIFY_VIPS"] == "1":
+        verify_vips(daemons, results)
+    ipvs = read_ipvs(daemons)
+
+    # without KEEPALIVED_DAEMONS the output of older versions, without sub-sections
+    if daemons and config["KEEPALIVED_DAEMONS"]:
+        headers = ["[[[%s]]]\n" % daemon["name"] for daemon in daemons]
+    else:
+        headers = [""] * len(results)
+    print_sections(headers, results, ipvs)
+
+
+if __name__ == "__main__":
+    main()
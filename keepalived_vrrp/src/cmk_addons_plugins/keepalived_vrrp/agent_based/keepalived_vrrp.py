@@ -1,13 +1,19 @@
 #!/usr/bin/env python3
 import json
+import time
 from collections.abc import Mapping # type: ignore
 from typing import Any # type: ignore
 from cmk.agent_based.v2 import (
     AgentSection,
+    check_levels,
     CheckPlugin,
     CheckResult,
     DiscoveryResult,
+    get_rate,
+    get_value_store,
+    GetRateError,
     Metric,
+    render,
     Result,
     Service,
     State,
@@ -28,39 +34,242 @@ vrrp_states = {
     98: { 'name': 'STOP', 'result': State.CRIT }
     }
 
+# counters with levels on their increase within the last hour, the master
+# transitions are part of the state transitions with their own levels
+counter_levels = {
+    'advert_interval_err': 'Advertisement interval errors',
+    'auth_failure': 'Authentication failures',
+    }
+
+def router_item(instance: Mapping[str, Any]) -> str | None:
+    """Item of the virtual router of an instance, the same on all nodes of a cluster"""
+    data = instance['data']
+    if 'vrid' not in data or 'ifp_ifname' not in data:
+        return None
+    return f"{ data['vrid'] } on { data['ifp_ifname'] }"
+
+class DecodedItems(Mapping[str, Any]):
+    """Items of the section, the JSON document of an item is decoded on the first access
+
+    The discovery only needs the names, a check only the document of its item.
+    The first one of duplicate names wins like before, the order of the status
+    is kept for the discovery.
+    """
+    def __init__(self) -> None:
+        self._lines: dict[str, str] = {}
+        self._decoded: dict[str, Any] = {}
+
+    def add_line(self, item: str, line: str) -> None:
+        self._lines.setdefault(item, line)
+
+    def add_decoded(self, item: str, document: Any) -> None:
+        if item not in self._lines:
+            # never decoded, only the name is used for the order
+            self._lines[item] = ''
+            self._decoded[item] = document
+
+    def __getitem__(self, item: str) -> Any:
+        if item not in self._decoded:
+            self._decoded[item] = json.loads(self._lines[item])
+        return self._decoded[item]
+
+    def __iter__(self):
+        return iter(self._lines)
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+def _parse_status(section: dict[str, Any], status: Any, suffix: str) -> None:
+    # the whole status in one line, printed by older agent plug-ins
+    if isinstance(status, list):
+        status = {'vrrp': status}
+    for instance in status.get('vrrp', []):
+        # time of the status for the counter rates
+        instance['time'] = status.get('time')
+        iname = instance['data']['iname'] + suffix
+        section['vrrp'].add_decoded(iname, instance)
+        if (item := router_item(instance)) is not None:
+            section['routers'].setdefault(item + suffix, iname)
+    for instance in status.get('track_process', []):
+        section['track_process'].add_decoded(instance['process'] + suffix, instance)
+
 def parse_keepalived_vrrp(string_table: StringTable) -> Section:
-    if len(string_table) == 0:
-        return {}
-    section = json.loads(string_table[0][0])
-    if isinstance(section, list):
-        section = {'vrrp': section}
+    """Instances by iname in 'vrrp' and track processes by process name in 'track_process'
+
+    The agent prints a line per instance "instance <iname> <vrid> <interface> <json>"
+    and per track process "track_process <process> <json>", only the names are
+    parsed here, see DecodedItems. 'routers' has the inames by virtual router id
+    and interface, see router_item. With several keepalived daemons the status
+    of every daemon follows a line [[[name]]], the items of a daemon with name
+    end with " in <name>".
+    """
+    section: dict[str, Any] = {'vrrp': DecodedItems(), 'track_process': DecodedItems(), 'routers': {}}
+    suffix = ''
+    for (line,) in string_table:
+        if line.startswith('[[[') and line.endswith(']]]'):
+            suffix = f" in { line[3:-3] }" if line[3:-3] else ''
+        elif line.startswith('instance '):
+            _kind, iname, vrid, ifname, document = line.split(' ', 4)
+            section['vrrp'].add_line(iname + suffix, document)
+            if vrid != '-' and ifname != '-':
+                section['routers'].setdefault(f"{ vrid } on { ifname }{ suffix }", iname + suffix)
+        elif line.startswith('track_process '):
+            _kind, process, document = line.split(' ', 2)
+            section['track_process'].add_line(process + suffix, document)
+        else:
+            _parse_status(section, json.loads(line), suffix)
     return section
 
 def discover_keepalived_vrrp(section: Section) -> DiscoveryResult:
-    for instance in section.get('vrrp', []):
-        yield Service(item=instance['data']['iname'])
-
-def check_keepalived_vrrp(item: str, section: Section) -> CheckResult:
-    for instance in section.get('vrrp', []):
-        if item == instance['data']['iname']:
-            vrrp_state = instance['data']['state']
-            if vrrp_state in vrrp_states:
-                state = vrrp_states[vrrp_state]['result']
-                state_pretty = vrrp_states[vrrp_state]['name']
-            else:
-                state = State.UNKNOWN
-                state_pretty = f'Unknown state { vrrp_state }'
-            # all metrics we have are simple counters
-            for metric_name, metric_value in instance['stats'].items():
-                yield Metric(f'keepalived_{ metric_name }', metric_value)
-            vips = '-' # default: empty
-            if 'vips' in instance['data']:
-                vips = ", ".join(instance['data']['vips'])
+    for iname in section.get('vrrp', {}):
+        yield Service(item=iname)
+
+def _counter_rates(stats: Mapping[str, int], timestamp: float) -> Mapping[str, float]:
+    value_store = get_value_store()
+    if value_store.get('time') == timestamp:
+        # same status as in the last check, with notify_fifo the JSON status is only
+        # requested every KEEPALIVED_JSON_INTERVAL seconds
+        return value_store.get('rates', {})
+    rates = {}
+    for name, value in stats.items():
+        try:
+            rates[name] = get_rate(value_store, name, timestamp, value, raise_overflow=True)
+        except GetRateError:
+            # first check, or the counters were reset by a restart of keepalived
+            pass
+    value_store['time'] = timestamp
+    value_store['rates'] = rates
+    return rates
+
+def _last_hour(stats: Mapping[str, int], timestamp: float) -> Mapping[str, int]:
+    """Increase of the counters with levels within the last hour
+
+    A rate per hour computed from two checks would be 60/h for a single
+    error with a check interval of a minute.
+    """
+    value_store = get_value_store()
+    values = {name: stats[name] for name in counter_levels if name in stats}
+    history = value_store.get('history', [])
+    # the newest values older than an hour are the base of the increase
+    while len(history) > 1 and history[1][0] <= timestamp - 3600:
+        history = history[1:]
+    if history and any(value < history[-1][1].get(name, 0) for name, value in values.items()):
+        # counters reset by a restart of keepalived
+        history = []
+    if not history or history[-1][0] != timestamp:
+        history.append((timestamp, values))
+    value_store['history'] = history
+    oldest = history[0][1]
+    return {name: value - oldest[name] for name, value in values.items() if name in oldest}
+
+def _check_transitions(vrrp_state: int, stats: Mapping[str, int], params: Mapping[str, Any], now: float) -> CheckResult:
+    """Transitions of the state of the instance within the last hour
+
+    Transitions between two checks are found by the become_master and
+    release_master counters. Changes from or to MASTER seen by the check are
+    not counted again when the counters follow later, with notify_fifo the
+    counters are only requested every KEEPALIVED_JSON_INTERVAL seconds.
+    """
+    value_store = get_value_store()
+    last_state = value_store.get('vrrp_state')
+    counters = (stats.get('become_master', 0), stats.get('release_master', 0))
+    last_counters = value_store.get('master_counters')
+    observed = value_store.get('observed_transitions', 0)
+    transitions = value_store.get('transitions', [])
+
+    count = 0
+    if last_state is not None and last_state != vrrp_state:
+        count += 1
+        value_store['last_transition'] = (now, last_state, vrrp_state)
+        if 2 in (last_state, vrrp_state):
+            observed += 1
+    if last_counters is not None and counters != last_counters:
+        # a smaller sum is a reset of the counters by a restart of keepalived
+        missed = sum(counters) - sum(last_counters) - observed
+        if missed > 0:
+            count += missed
+            value_store['last_transition'] = (now, last_state, vrrp_state)
+        observed = 0
+    if count:
+        transitions.append((now, count))
+
+    transitions = [entry for entry in transitions if entry[0] > now - 3600]
+    value_store['vrrp_state'] = vrrp_state
+    value_store['master_counters'] = counters
+    value_store['observed_transitions'] = observed
+    value_store['transitions'] = transitions
+
+    if last_state is None:
+        return
+    yield from check_levels(
+        sum(entry[1] for entry in transitions),
+        levels_upper = params.get('transitions_upper'),
+        metric_name = 'keepalived_state_transitions',
+        render_func = lambda value: f"{ value:.0f}",
+        label = "State transitions in the last hour",
+        notice_only = True
+    )
+    if (last_transition := value_store.get('last_transition')) is not None:
+        changed, from_state, to_state = last_transition
+        yield Result(
+            state = State.OK,
+            notice = f"Last transition { render.timespan(max(now - changed, 0.0)) } ago" + (
+                f" from { vrrp_states.get(from_state, {}).get('name', from_state) }"
+                f" to { vrrp_states.get(to_state, {}).get('name', to_state) }"
+                if from_state != to_state else ""
+            )
+        )
+
+def check_keepalived_vrrp(item: str, params: Mapping[str, Any], section: Section) -> CheckResult:
+    instance = section.get('vrrp', {}).get(item)
+    if instance is None:
+        return
+    vrrp_state = instance['data']['state']
+    if vrrp_state in vrrp_states:
+        state = vrrp_states[vrrp_state]['result']
+        state_pretty = vrrp_states[vrrp_state]['name']
+    else:
+        state = State.UNKNOWN
+        state_pretty = f'Unknown state { vrrp_state }'
+    vips = '-' # default: empty
+    if 'vips' in instance['data']:
+        vips = ", ".join(instance['data']['vips'])
+    yield Result(
+        state = state,
+        summary = f"State: { state_pretty }, VIPs: { vips  }"
+    )
+    if (expected := params.get('expected_state')) is not None and \
+            vrrp_state in (1, 2) and vrrp_states[vrrp_state]['name'] != expected.upper():
+        yield Result(
+            state = State(params.get('unexpected_state', State.WARN)),
+            summary = f"Expected { expected.upper() }"
+        )
+    # only for MASTER instances, with KEEPALIVED_VERIFY_VIPS=1
+    if (vips_missing := instance.get('vips_missing')) is not None:
+        if vips_missing:
             yield Result(
-                state = state,
-                summary = f"State: { state_pretty }, VIPs: { vips  }"
+                state = State(params.get('vips_missing_state', State.CRIT)),
+                summary = f"VIPs not configured on the interface: { ', '.join(vips_missing) }"
+            )
+        else:
+            yield Result(state = State.OK, notice = "All VIPs configured on the interface")
+    yield from _check_transitions(vrrp_state, instance['stats'], params, time.time())
+
+    # all stats are counters since the start of keepalived
+    timestamp = instance.get('time') or time.time()
+    last_hour = _last_hour(instance['stats'], timestamp)
+    for name, label in counter_levels.items():
+        if name in last_hour:
+            yield from check_levels(
+                last_hour[name],
+                levels_upper = params.get(f'{ name }_upper'),
+                render_func = lambda value: f"{ value:.0f}",
+                label = f"{ label } in the last hour",
+                notice_only = True
             )
-            return
+    rates = _counter_rates(instance['stats'], timestamp)
+    for name, rate in rates.items():
+        yield Metric(f'keepalived_{ name }_rate', rate)
 
 agent_section_keepalived_vrrp = AgentSection(
     name = "keepalived_vrrp",
@@ -72,4 +281,10 @@ check_plugin_keepalived_vrrp = CheckPlugin(
     service_name = "Keepalived VRRP instance %s",
     discovery_function = discover_keepalived_vrrp,
     check_function = check_keepalived_vrrp,
+    check_default_parameters = {
+        'advert_interval_err_upper': ('fixed', (1.0, 60.0)),
+        'auth_failure_upper': ('fixed', (1.0, 60.0)),
+        'transitions_upper': ('fixed', (4.0, 10.0)),
+    },
+    check_ruleset_name = "keepalived_vrrp"
 )
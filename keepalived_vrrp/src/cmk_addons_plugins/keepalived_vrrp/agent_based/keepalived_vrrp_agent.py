@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+from collections.abc import Mapping
+from typing import Any
+from cmk.agent_based.v2 import (
+    AgentSection,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    Metric,
+    Result,
+    Service,
+    State,
+    StringTable,
+    render
+)
+
+# <<<keepalived_vrrp_agent:sep(0)>>>
+# latency 0.004182
+# method inotify
+#
+# latency: seconds from signalling keepalived until its status file was complete
+# method: inotify, or polling if inotify is not available, notify_fifo if the
+#         states are received by the listener on the notify_fifo
+# json_age: with notify_fifo, age of the JSON status in seconds
+# vips_error: the addresses of the interfaces could not be read to verify the VIPs
+#
+# With several keepalived daemons the lines of every daemon follow a line [[[name]]].
+# error: the status file was not written in time, or keepalived could not be signalled
+
+Section = Mapping[str, Any]
+
+def parse_keepalived_vrrp_agent(string_table: StringTable) -> Section:
+    """The collection of every daemon by its name, the daemon of older plug-ins has no name"""
+    section: dict[str, dict[str, str]] = {}
+    daemon = section.setdefault('', {})
+    for (line,) in string_table:
+        if line.startswith('[[[') and line.endswith(']]]'):
+            daemon = section.setdefault(line[3:-3], {})
+            continue
+        key, _, value = line.partition(' ')
+        daemon[key] = value
+    return {name: daemon for name, daemon in section.items() if daemon}
+
+def discover_keepalived_vrrp_agent(section: Section) -> DiscoveryResult: # pylint: disable=unused-argument
+    yield Service()
+
+def check_keepalived_vrrp_agent(section: Section) -> CheckResult:
+    latencies = []
+    for name, daemon in section.items():
+        prefix = f"{ name }: " if name else ''
+        if 'error' in daemon:
+            yield Result(
+                state = State.WARN,
+                summary = f"{ prefix }Error: { daemon['error'] }"
+            )
+        if 'vips_error' in daemon:
+            yield Result(
+                state = State.WARN,
+                summary = f"{ prefix }VIPs not verified: { daemon['vips_error'] }"
+            )
+        if 'latency' in daemon:
+            latency = float(daemon['latency'])
+            latencies.append(latency)
+            if 'error' not in daemon:
+                yield Result(
+                    state = State.OK,
+                    summary = f"{ prefix }Status file written after { render.timespan(latency) }"
+                )
+        if 'method' in daemon:
+            yield Result(
+                state = State.OK,
+                notice = f"{ prefix }Waiting method: { daemon['method'] }"
+            )
+        if 'json_age' in daemon:
+            yield Result(
+                state = State.OK,
+                summary = f"{ prefix }Counters of the JSON status from { render.timespan(float(daemon['json_age'])) } ago"
+            )
+    if latencies:
+        # the slowest daemon, they are collected concurrently
+        yield Metric('keepalived_status_latency', max(latencies))
+
+agent_section_keepalived_vrrp_agent = AgentSection(
+    name = "keepalived_vrrp_agent",
+    parse_function = parse_keepalived_vrrp_agent,
+)
+
+check_plugin_keepalived_vrrp_agent = CheckPlugin(
+    name = "keepalived_vrrp_agent",
+    service_name = "Keepalived VRRP status collection",
+    discovery_function = discover_keepalived_vrrp_agent,
+    check_function = check_keepalived_vrrp_agent,
+)
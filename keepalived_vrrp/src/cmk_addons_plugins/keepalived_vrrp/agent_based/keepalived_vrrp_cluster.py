@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+from collections.abc import Mapping
+from typing import Any
+from cmk.agent_based.v2 import (
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    Result,
+    Service,
+    State
+)
+from cmk.rulesets.v1.form_specs import ServiceState
+from cmk_addons.plugins.keepalived_vrrp.agent_based.keepalived_vrrp import Section, vrrp_states
+
+# One service per virtual router (VRID and interface). Assigned to a cluster
+# host by the rule "Clustered services", the nodes are compared: exactly one
+# of them has to be MASTER, and it should have the highest priority.
+
+def _priority(instance: Mapping[str, Any]) -> int | None:
+    data = instance['data']
+    return data.get('effective_priority', data.get('priority'))
+
+def _router_instance(section: Section, item: str) -> Mapping[str, Any] | None:
+    # 'routers' has the iname of the instance, see parse_keepalived_vrrp
+    if (iname := section.get('routers', {}).get(item)) is None:
+        return None
+    return section['vrrp'][iname]
+
+def _state_name(vrrp_state: int) -> str:
+    return vrrp_states.get(vrrp_state, {}).get('name', f'Unknown state { vrrp_state }')
+
+def discover_keepalived_vrrp_cluster(section: Section) -> DiscoveryResult:
+    for item in section.get('routers', {}):
+        yield Service(item=item)
+
+def check_keepalived_vrrp_cluster(item: str, params: Mapping[str, Any], section: Section) -> CheckResult: # pylint: disable=unused-argument
+    # the view of a single host, the nodes are compared by the cluster check
+    instance = _router_instance(section, item)
+    if instance is None:
+        return
+    yield Result(
+        state = State.OK,
+        summary = f"{ _state_name(instance['data']['state']) }, instance { instance['data']['iname'] }, " +
+                  f"priority { _priority(instance) }"
+    )
+
+def cluster_check_keepalived_vrrp_cluster(
+    item: str,
+    params: Mapping[str, Any],
+    section: Mapping[str, Section | None]
+) -> CheckResult:
+    # one lookup per node in the routers indexed by the parse function
+    nodes = {}
+    for node, node_section in section.items():
+        if node_section is not None and (instance := _router_instance(node_section, item)) is not None:
+            nodes[node] = instance
+    if not nodes:
+        return
+
+    masters = [node for node, instance in nodes.items() if instance['data']['state'] == 2]
+    if not masters:
+        yield Result(state = State(params['no_master']), summary = "No MASTER")
+    elif len(masters) > 1:
+        yield Result(
+            state = State(params['multiple_masters']),
+            summary = f"Split brain, MASTER on { ', '.join(masters) }"
+        )
+    else:
+        yield Result(state = State.OK, summary = f"MASTER on { masters[0] }")
+
+    # with preemption the BACKUP with a higher priority takes over
+    master_priorities = [_priority(nodes[node]) for node in masters]
+    for node, instance in nodes.items():
+        priority = _priority(instance)
+        if node in masters or instance['data']['state'] != 1 or priority is None:
+            continue
+        if any(master_priority is not None and master_priority < priority for master_priority in master_priorities):
+            yield Result(
+                state = State(params['priority_mismatch']),
+                summary = f"BACKUP { node } has a higher priority ({ priority }) than the MASTER"
+            )
+
+    for node, instance in nodes.items():
+        yield Result(
+            state = State.OK,
+            notice = f"{ node }: { _state_name(instance['data']['state']) }, " +
+                     f"instance { instance['data']['iname'] }, priority { _priority(instance) }"
+        )
+
+check_plugin_keepalived_vrrp_cluster = CheckPlugin(
+    name = "keepalived_vrrp_cluster",
+    sections = ["keepalived_vrrp"],
+    service_name = "Keepalived VRRP router VRID %s",
+    discovery_function = discover_keepalived_vrrp_cluster,
+    check_function = check_keepalived_vrrp_cluster,
+    cluster_check_function = cluster_check_keepalived_vrrp_cluster,
+    check_default_parameters = {
+        'no_master': ServiceState.CRIT,
+        'multiple_masters': ServiceState.CRIT,
+        'priority_mismatch': ServiceState.WARN
+    },
+    check_ruleset_name = "keepalived_vrrp_cluster"
+)
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+import ipaddress
+import time
+from collections.abc import Mapping
+from typing import Any
+from cmk.agent_based.v2 import (
+    AgentSection,
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    get_rate,
+    get_value_store,
+    GetRateError,
+    IgnoreResultsError,
+    Metric,
+    render,
+    Result,
+    Service,
+    State,
+    StringTable
+)
+from cmk.rulesets.v1.form_specs import ServiceState
+
+# <<<keepalived_vrrp_ipvs:sep(0)>>>
+# [ip_vs]
+# IP Virtual Server version 1.2.1 (size=4096)
+# Prot LocalAddress:Port Scheduler Flags
+#   -> RemoteAddress:Port Forward Weight ActiveConn InActConn
+# TCP  0A000001:0050 wlc
+#   -> 0A000002:0050      Route   1      12         40
+#   -> 0A000003:0050      Route   0      0          3
+# [ip_vs_stats]
+#    Total Incoming Outgoing         Incoming         Outgoing
+#    Conns  Packets  Packets            Bytes            Bytes
+#      16F    3A5B2        0          2C0A1B3                0
+#  Conns/s   Pkts/s   Pkts/s          Bytes/s          Bytes/s
+#        0        3        0              1F4                0
+#
+# The tables of /proc/net of the network namespace of keepalived. The kernel
+# has no counters per virtual server in /proc, the counters of ip_vs_stats are
+# the sum of all virtual servers of the namespace.
+# With several keepalived daemons the tables of every daemon follow a line [[[name]]].
+
+Section = Mapping[str, Any]
+
+PROTOCOLS = ('TCP', 'UDP', 'SCTP', 'FWM')
+
+# the counters of ip_vs_stats in their order
+ipvs_counters = {
+    'conns': 'New connections',
+    'inpkts': 'Incoming packets',
+    'outpkts': 'Outgoing packets',
+    'inbytes': 'Incoming bytes',
+    'outbytes': 'Outgoing bytes',
+    }
+
+def _endpoint(value: str) -> str:
+    """Address and port of /proc/net/ip_vs, hex IPv4 address or IPv6 address in brackets"""
+    address, _, port = value.rpartition(':')
+    if address.startswith('['):
+        return f"[{ ipaddress.IPv6Address(address[1:-1]) }]:{ int(port, 16) }"
+    return f"{ ipaddress.IPv4Address(int(address, 16)) }:{ int(port, 16) }"
+
+def _parse_virtual_server(fields: list[str]) -> tuple[str, dict[str, Any]]:
+    if fields[0] == 'FWM':
+        item = f"FWM { int(fields[1], 16) }"
+    else:
+        item = f"{ fields[0] } { _endpoint(fields[1]) }"
+    virtual_server: dict[str, Any] = {'scheduler': fields[2], 'persistent': None, 'real_servers': []}
+    if 'persistent' in fields:
+        virtual_server['persistent'] = int(fields[fields.index('persistent') + 1])
+    return item, virtual_server
+
+def parse_keepalived_vrrp_ipvs(string_table: StringTable) -> Section:
+    """Virtual servers by protocol and address in 'virtual_servers', the counters of every daemon in 'stats'
+
+    The items of a daemon with name end with " in <name>", like the VRRP instances.
+    """
+    section: dict[str, dict] = {'virtual_servers': {}, 'stats': {}}
+    daemon = ''
+    suffix = ''
+    table = ''
+    virtual_server: dict[str, Any] = {'real_servers': []}
+    for (line,) in string_table:
+        if line.startswith('[[[') and line.endswith(']]]'):
+            daemon = line[3:-3]
+            suffix = f" in { daemon }" if daemon else ''
+            continue
+        if line.startswith('[') and line.endswith(']'):
+            table = line[1:-1]
+            continue
+        fields = line.split()
+        if not fields:
+            continue
+        if table == 'ip_vs':
+            if fields[0] in PROTOCOLS:
+                item, virtual_server = _parse_virtual_server(fields)
+                section['virtual_servers'].setdefault(item + suffix, virtual_server)
+            elif fields[0] == '->' and fields[1] != 'RemoteAddress:Port':
+                virtual_server['real_servers'].append({
+                    'address': _endpoint(fields[1]),
+                    'forward': fields[2],
+                    'weight': int(fields[3]),
+                    'active': int(fields[4]),
+                    'inactive': int(fields[5]),
+                })
+        elif table == 'ip_vs_stats' and daemon not in section['stats']:
+            # the first row of numbers has the counters, the second one the rates
+            # estimated by the kernel
+            try:
+                values = [int(field, 16) for field in fields]
+            except ValueError:
+                continue
+            if len(values) == len(ipvs_counters):
+                section['stats'][daemon] = dict(zip(ipvs_counters, values))
+    return section
+
+def discover_keepalived_vrrp_ipvs(section: Section) -> DiscoveryResult:
+    for item in section.get('virtual_servers', {}):
+        yield Service(item=item)
+
+def check_keepalived_vrrp_ipvs(item: str, params: Mapping[str, Any], section: Section) -> CheckResult:
+    virtual_server = section.get('virtual_servers', {}).get(item)
+    if virtual_server is None:
+        return
+    real_servers = virtual_server['real_servers']
+    # keepalived removes failed real servers, or sets their weight to 0 with inhibit_on_failure
+    quiesced = [real_server['address'] for real_server in real_servers if real_server['weight'] <= 0]
+    available = len(real_servers) - len(quiesced)
+    summary = f"Real servers: { available } of { len(real_servers) } with weight > 0"
+    if not available:
+        state = State(params['no_real_server'])
+    elif quiesced:
+        state = State(params['weight_zero'])
+        summary += f", weight 0: { ', '.join(quiesced) }"
+    else:
+        state = State.OK
+    yield Result(state = state, summary = summary)
+    yield Metric('keepalived_ipvs_real_servers', available)
+
+    yield from check_levels(
+        sum(real_server['active'] for real_server in real_servers),
+        levels_upper = params.get('active_connections_upper'),
+        metric_name = 'keepalived_ipvs_active_connections',
+        render_func = lambda value: f"{ value:.0f}",
+        label = "Active connections"
+    )
+    yield from check_levels(
+        sum(real_server['inactive'] for real_server in real_servers),
+        levels_upper = params.get('inactive_connections_upper'),
+        metric_name = 'keepalived_ipvs_inactive_connections',
+        render_func = lambda value: f"{ value:.0f}",
+        label = "Inactive connections",
+        notice_only = True
+    )
+    persistent = virtual_server['persistent']
+    yield Result(
+        state = State.OK,
+        notice = f"Scheduler: { virtual_server['scheduler'] }" + (
+            f", persistent for { render.timespan(persistent) }" if persistent is not None else ""
+        )
+    )
+    for real_server in real_servers:
+        yield Result(
+            state = State.OK,
+            notice = f"{ real_server['address'] }: { real_server['forward'] }, weight { real_server['weight'] }, " +
+                     f"{ real_server['active'] } active, { real_server['inactive'] } inactive connections"
+        )
+
+def discover_keepalived_vrrp_ipvs_stats(section: Section) -> DiscoveryResult:
+    if section.get('virtual_servers') and section.get('stats'):
+        yield Service()
+
+def check_keepalived_vrrp_ipvs_stats(params: Mapping[str, Any], section: Section) -> CheckResult:
+    # the sum of the network namespaces of all keepalived daemons
+    value_store = get_value_store()
+    now = time.time()
+    rates = dict.fromkeys(ipvs_counters, 0.0)
+    initializing = []
+    for daemon, counters in section.get('stats', {}).items():
+        daemon_rates = {}
+        for name, value in counters.items():
+            try:
+                daemon_rates[name] = get_rate(value_store, f"{ daemon }.{ name }", now, value, raise_overflow=True)
+            except GetRateError:
+                # first check, or the counters were reset by a reload of the ip_vs module
+                pass
+        if len(daemon_rates) < len(counters):
+            initializing.append(daemon)
+            continue
+        for name, rate in daemon_rates.items():
+            rates[name] += rate
+    if initializing and len(initializing) == len(section.get('stats', {})):
+        raise IgnoreResultsError("Initializing counters")
+    if initializing:
+        # the totals of the other daemons
+        yield Result(
+            state = State.OK,
+            summary = f"Initializing counters of { ', '.join(initializing) }"
+        )
+    for name, label in ipvs_counters.items():
+        yield from check_levels(
+            rates[name],
+            levels_upper = params.get(f'{ name }_upper'),
+            metric_name = f'keepalived_ipvs_{ name }_rate',
+            render_func = render.iobandwidth if name.endswith('bytes') else lambda value: f"{ value:.2f}/s",
+            label = label
+        )
+
+agent_section_keepalived_vrrp_ipvs = AgentSection(
+    name = "keepalived_vrrp_ipvs",
+    parse_function = parse_keepalived_vrrp_ipvs,
+)
+
+check_plugin_keepalived_vrrp_ipvs = CheckPlugin(
+    name = "keepalived_vrrp_ipvs",
+    service_name = "Keepalived IPVS virtual server %s",
+    discovery_function = discover_keepalived_vrrp_ipvs,
+    check_function = check_keepalived_vrrp_ipvs,
+    check_default_parameters = {
+        'no_real_server': ServiceState.CRIT,
+        'weight_zero': ServiceState.WARN,
+    },
+    check_ruleset_name = "keepalived_vrrp_ipvs"
+)
+
+check_plugin_keepalived_vrrp_ipvs_stats = CheckPlugin(
+    name = "keepalived_vrrp_ipvs_stats",
+    sections = ["keepalived_vrrp_ipvs"],
+    service_name = "Keepalived IPVS throughput",
+    discovery_function = discover_keepalived_vrrp_ipvs_stats,
+    check_function = check_keepalived_vrrp_ipvs_stats,
+    check_default_parameters = {},
+    check_ruleset_name = "keepalived_vrrp_ipvs_stats"
+)
@@ -2,116 +2,228 @@
 
 from cmk.graphing.v1 import Title
 from cmk.graphing.v1.graphs import Graph, MinimalRange
-from cmk.graphing.v1.metrics import Color, DecimalNotation, Metric, Unit, StrictPrecision
+from cmk.graphing.v1.metrics import Color, DecimalNotation, IECNotation, Metric, Unit, AutoPrecision, StrictPrecision, TimeNotation
 
-metric_keepalived_vrrp_advert_rcvd = Metric(
-    name = "keepalived_advert_rcvd",
+metric_keepalived_vrrp_advert_rcvd_rate = Metric(
+    name = "keepalived_advert_rcvd_rate",
     title = Title("Advertisements received"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.YELLOW,
 )
 
-metric_keepalived_vrrp_advert_sent = Metric(
-    name = "keepalived_advert_sent",
+metric_keepalived_vrrp_advert_sent_rate = Metric(
+    name = "keepalived_advert_sent_rate",
     title = Title("Advertisements sent"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.ORANGE,
 )
 
-metric_keepalived_vrrp_advert_interval_err = Metric(
-    name = "keepalived_advert_interval_err",
+metric_keepalived_vrrp_advert_interval_err_rate = Metric(
+    name = "keepalived_advert_interval_err_rate",
     title = Title("Advertisement interval errors"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.RED,
 )
 
 graph_keepalived_vrrp_advert_combined = Graph(
     name = "keepalived_advert_combined",
     title = Title("Advertisements sent, received and interval errors"),
-    simple_lines = [ "keepalived_advert_sent", "keepalived_advert_rcvd", "keepalived_advert_interval_err"],
+    simple_lines = [ "keepalived_advert_sent_rate", "keepalived_advert_rcvd_rate", "keepalived_advert_interval_err_rate"],
     minimal_range = MinimalRange(0,1)
 )
 
-metric_keepalived_vrrp_addr_list_err = Metric(
-    name = "keepalived_addr_list_err",
+metric_keepalived_vrrp_addr_list_err_rate = Metric(
+    name = "keepalived_addr_list_err_rate",
     title = Title("Address list errors"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.ORANGE,
 )
 
-metric_keepalived_vrrp_become_master = Metric(
-    name = "keepalived_become_master",
-    title = Title("Become master count"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+metric_keepalived_vrrp_become_master_rate = Metric(
+    name = "keepalived_become_master_rate",
+    title = Title("Master transitions"),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.LIGHT_YELLOW,
 )
 
-metric_keepalived_vrrp_release_master = Metric(
-    name = "keepalived_release_master",
-    title = Title("Release master count"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+metric_keepalived_vrrp_release_master_rate = Metric(
+    name = "keepalived_release_master_rate",
+    title = Title("Master releases"),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.DARK_YELLOW,
 )
 
-metric_keepalived_vrrp_packet_len_err = Metric(
-    name = "keepalived_packet_len_err",
+metric_keepalived_vrrp_packet_len_err_rate = Metric(
+    name = "keepalived_packet_len_err_rate",
     title = Title("Packet length errors"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.LIGHT_GREEN,
 )
 
-metric_keepalived_vrrp_ip_ttl_err = Metric(
-    name = "keepalived_ip_ttl_err",
+metric_keepalived_vrrp_ip_ttl_err_rate = Metric(
+    name = "keepalived_ip_ttl_err_rate",
     title = Title("IP TTL errors"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.GREEN,
 )
 
-metric_keepalived_vrrp_invalid_type_rcvd = Metric(
-    name = "keepalived_invalid_type_rcvd",
-    title = Title("Invalid type received count"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+metric_keepalived_vrrp_invalid_type_rcvd_rate = Metric(
+    name = "keepalived_invalid_type_rcvd_rate",
+    title = Title("Invalid type received"),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.BLUE,
 )
 
-metric_keepalived_vrrp_invalid_authtype = Metric(
-    name = "keepalived_invalid_authtype",
-    title = Title("Invalid authtype count"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+metric_keepalived_vrrp_invalid_authtype_rate = Metric(
+    name = "keepalived_invalid_authtype_rate",
+    title = Title("Invalid authtype"),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.LIGHT_PURPLE,
 )
 
-metric_keepalived_vrrp_authtype_mismatch = Metric(
-    name = "keepalived_authtype_mismatch",
-    title = Title("Authtype mismatch count"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+metric_keepalived_vrrp_authtype_mismatch_rate = Metric(
+    name = "keepalived_authtype_mismatch_rate",
+    title = Title("Authtype mismatches"),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.PURPLE,
 )
 
-metric_keepalived_vrrp_auth_failure = Metric(
-    name = "keepalived_auth_failure",
+metric_keepalived_vrrp_auth_failure_rate = Metric(
+    name = "keepalived_auth_failure_rate",
     title = Title("Authentication failures"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.DARK_PURPLE,
 )
 
-metric_keepalived_vrrp_pri_zero_rcvd = Metric(
-    name = "keepalived_pri_zero_rcvd",
+graph_keepalived_vrrp_master_combined = Graph(
+    name = "keepalived_master_combined",
+    title = Title("Master transitions and releases"),
+    simple_lines = [ "keepalived_become_master_rate", "keepalived_release_master_rate"],
+    minimal_range = MinimalRange(0,1)
+)
+
+graph_keepalived_vrrp_auth_combined = Graph(
+    name = "keepalived_auth_combined",
+    title = Title("Authentication failures, authtype mismatches and invalid authtypes"),
+    simple_lines = [ "keepalived_auth_failure_rate", "keepalived_authtype_mismatch_rate", "keepalived_invalid_authtype_rate"],
+    minimal_range = MinimalRange(0,1)
+)
+
+graph_keepalived_vrrp_packet_err_combined = Graph(
+    name = "keepalived_packet_err_combined",
+    title = Title("Packet length, IP TTL, invalid type and address list errors"),
+    simple_lines = [ "keepalived_packet_len_err_rate", "keepalived_ip_ttl_err_rate", "keepalived_invalid_type_rcvd_rate", "keepalived_addr_list_err_rate"],
+    minimal_range = MinimalRange(0,1)
+)
+
+metric_keepalived_vrrp_pri_zero_rcvd_rate = Metric(
+    name = "keepalived_pri_zero_rcvd_rate",
     title = Title("Priority zero received"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.CYAN,
 )
 
-metric_keepalived_vrrp_pri_zero_sent = Metric(
-    name = "keepalived_pri_zero_sent",
+metric_keepalived_vrrp_pri_zero_sent_rate = Metric(
+    name = "keepalived_pri_zero_sent_rate",
     title = Title("Priority zero sent"),
-    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
     color = Color.DARK_CYAN,
 )
 
 graph_keepalived_vrrp_pri_zero_combined = Graph(
     name = "keepalived_pri_zero_combined",
     title = Title("Priority zero sent and received"),
-    simple_lines = [ "keepalived_pri_zero_sent", "keepalived_pri_zero_rcvd"],
+    simple_lines = [ "keepalived_pri_zero_sent_rate", "keepalived_pri_zero_rcvd_rate"],
+    minimal_range = MinimalRange(0,1)
+)
+
+metric_keepalived_state_transitions = Metric(
+    name = "keepalived_state_transitions",
+    title = Title("State transitions in the last hour"),
+    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    color = Color.DARK_RED,
+)
+
+metric_keepalived_status_latency = Metric(
+    name = "keepalived_status_latency",
+    title = Title("Time until the status file is written"),
+    unit = Unit(TimeNotation()),
+    color = Color.BLUE,
+)
+
+metric_keepalived_ipvs_real_servers = Metric(
+    name = "keepalived_ipvs_real_servers",
+    title = Title("Real servers with weight above 0"),
+    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    color = Color.GREEN,
+)
+
+metric_keepalived_ipvs_active_connections = Metric(
+    name = "keepalived_ipvs_active_connections",
+    title = Title("Active connections"),
+    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    color = Color.BLUE,
+)
+
+metric_keepalived_ipvs_inactive_connections = Metric(
+    name = "keepalived_ipvs_inactive_connections",
+    title = Title("Inactive connections"),
+    unit = Unit(DecimalNotation(""), StrictPrecision(0)),
+    color = Color.LIGHT_BLUE,
+)
+
+graph_keepalived_ipvs_connections = Graph(
+    name = "keepalived_ipvs_connections",
+    title = Title("Active and inactive connections"),
+    compound_lines = [ "keepalived_ipvs_active_connections", "keepalived_ipvs_inactive_connections"],
+    minimal_range = MinimalRange(0,1)
+)
+
+metric_keepalived_ipvs_conns_rate = Metric(
+    name = "keepalived_ipvs_conns_rate",
+    title = Title("New connections"),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
+    color = Color.DARK_BLUE,
+)
+
+metric_keepalived_ipvs_inpkts_rate = Metric(
+    name = "keepalived_ipvs_inpkts_rate",
+    title = Title("Incoming packets"),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
+    color = Color.GREEN,
+)
+
+metric_keepalived_ipvs_outpkts_rate = Metric(
+    name = "keepalived_ipvs_outpkts_rate",
+    title = Title("Outgoing packets"),
+    unit = Unit(DecimalNotation("/s"), AutoPrecision(2)),
+    color = Color.BLUE,
+)
+
+graph_keepalived_ipvs_packets = Graph(
+    name = "keepalived_ipvs_packets",
+    title = Title("Incoming and outgoing packets"),
+    simple_lines = [ "keepalived_ipvs_inpkts_rate", "keepalived_ipvs_outpkts_rate"],
+    minimal_range = MinimalRange(0,1)
+)
+
+metric_keepalived_ipvs_inbytes_rate = Metric(
+    name = "keepalived_ipvs_inbytes_rate",
+    title = Title("Incoming bytes"),
+    unit = Unit(IECNotation("B/s")),
+    color = Color.GREEN,
+)
+
+metric_keepalived_ipvs_outbytes_rate = Metric(
+    name = "keepalived_ipvs_outbytes_rate",
+    title = Title("Outgoing bytes"),
+    unit = Unit(IECNotation("B/s")),
+    color = Color.BLUE,
+)
+
+graph_keepalived_ipvs_bytes = Graph(
+    name = "keepalived_ipvs_bytes",
+    title = Title("Incoming and outgoing bytes"),
+    simple_lines = [ "keepalived_ipvs_inbytes_rate", "keepalived_ipvs_outbytes_rate"],
     minimal_range = MinimalRange(0,1)
 )
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+from cmk.rulesets.v1 import Help, Title
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    Float,
+    LevelDirection,
+    ServiceState,
+    SimpleLevels,
+    SingleChoice,
+    SingleChoiceElement
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+def _levels_per_hour(title: Title, warn: float, crit: float) -> DictElement:
+    return DictElement(
+        parameter_form = SimpleLevels(
+            title = title,
+            form_spec_template = Float(unit_symbol = "/h"),
+            level_direction = LevelDirection.UPPER,
+            prefill_fixed_levels = DefaultValue((warn, crit))
+        )
+    )
+
+def _parameter_form_keepalived_vrrp() -> Dictionary:
+    return Dictionary(
+        help_text = Help("The levels per hour apply to the increase of the counters of keepalived "
+                         "within the last hour. A restart of keepalived resets the counters."),
+        elements = {
+            "advert_interval_err_upper": _levels_per_hour(
+                Title("Advertisement interval errors per hour"), 1.0, 60.0
+            ),
+            "auth_failure_upper": _levels_per_hour(
+                Title("Authentication failures per hour"), 1.0, 60.0
+            ),
+            "transitions_upper": _levels_per_hour(
+                Title("State transitions per hour (flapping)"), 4.0, 10.0
+            ),
+            "expected_state": DictElement(
+                parameter_form = SingleChoice(
+                    title = Title("Expected role of the instance on this host"),
+                    elements = [
+                        SingleChoiceElement(name = "master", title = Title("MASTER")),
+                        SingleChoiceElement(name = "backup", title = Title("BACKUP")),
+                    ],
+                    prefill = DefaultValue("backup")
+                )
+            ),
+            "vips_missing_state": DictElement(
+                parameter_form = ServiceState(
+                    title = Title("State if VIPs of a MASTER are not configured on the interface"),
+                    help_text = Help("Needs the verification of the VIPs in the agent plug-in."),
+                    prefill = DefaultValue(ServiceState.CRIT)
+                )
+            ),
+            "unexpected_state": DictElement(
+                parameter_form = ServiceState(
+                    title = Title("State if the instance is not in the expected role"),
+                    help_text = Help("Only MASTER and BACKUP are compared, FAULT and STOP are always CRIT."),
+                    prefill = DefaultValue(ServiceState.WARN)
+                )
+            )
+        }
+    )
+
+rule_spec_keepalived_vrrp = CheckParameters(
+    name = "keepalived_vrrp",
+    title = Title("Keepalived VRRP instance (Linux)"),
+    topic = Topic.GENERAL,
+    parameter_form = _parameter_form_keepalived_vrrp,
+    condition = HostAndItemCondition(item_title=Title("VRRP instance"))
+)
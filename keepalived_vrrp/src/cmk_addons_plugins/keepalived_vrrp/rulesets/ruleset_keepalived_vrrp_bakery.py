@@ -1,16 +1,55 @@
 #!/usr/bin/env python3
 
-from cmk.rulesets.v1 import Label, Title
+from cmk.rulesets.v1 import Help, Label, Message, Title
 from cmk.rulesets.v1.form_specs import (
+    BooleanChoice,
+    CascadingDropdown,
+    CascadingDropdownElement,
     DefaultValue,
     DictElement,
     Dictionary,
+    FixedValue,
+    List,
     String,
     TimeSpan,
     TimeMagnitude
 )
+from cmk.rulesets.v1.form_specs.validators import MatchRegex
 from cmk.rulesets.v1.rule_specs import AgentConfig, Topic
 
+def _daemon_form() -> Dictionary:
+    return Dictionary(
+        elements = {
+            "name": DictElement(
+                required = True,
+                parameter_form = String(
+                    title = Title("Name, e.g. the network namespace"),
+                    custom_validate = (
+                        MatchRegex(
+                            regex = "^[A-Za-z0-9_]+$",
+                            error_msg = Message("Only letters, digits and underscores are allowed"),
+                        ),
+                    )
+                )
+            ),
+            "pidfile": DictElement(
+                parameter_form = String(
+                    title = Title("Pidfile (Default: /run/keepalived/<name>/keepalived.pid)"),
+                )
+            ),
+            "jsonfile": DictElement(
+                parameter_form = String(
+                    title = Title("JSON status file (Default: /tmp/keepalived_<name>.json)"),
+                )
+            ),
+            "notify_fifo": DictElement(
+                parameter_form = String(
+                    title = Title("notify_fifo"),
+                )
+            )
+        }
+    )
+
 def _parameter_form_keepalived_vrrp_bakery():
     return Dictionary(
         #help=_("This will deploy the keepalived_vrrp plugin."),
@@ -30,6 +69,56 @@ def _parameter_form_keepalived_vrrp_bakery():
                     title = Title("Keepalived JSON status file (Default: /tmp/keepalived.json)"),
                 )
             ),
+            "timeout": DictElement(
+                parameter_form = TimeSpan(
+                    title = Title("Maximal time to wait for the JSON status file (Default: 5 seconds)"),
+                    displayed_magnitudes = [TimeMagnitude.SECOND],
+                    prefill = DefaultValue(5.0)
+                )
+            ),
+            "notify_fifo": DictElement(
+                parameter_form = String(
+                    title = Title("Keepalived notify_fifo, receive the states instead of signalling keepalived every run"),
+                )
+            ),
+            "json_interval": DictElement(
+                parameter_form = TimeSpan(
+                    title = Title("Interval for requesting the JSON status with notify_fifo (Default: 1 hour)"),
+                    displayed_magnitudes = [TimeMagnitude.HOUR, TimeMagnitude.MINUTE],
+                    prefill = DefaultValue(3600.0)
+                )
+            ),
+            "verify_vips": DictElement(
+                parameter_form = BooleanChoice(
+                    title = Title("Verify the VIPs of MASTER instances"),
+                    label = Label("Look up the VIPs in the addresses of the interfaces (ip -j addr)"),
+                    prefill = DefaultValue(True)
+                )
+            ),
+            "daemons": DictElement(
+                parameter_form = CascadingDropdown(
+                    title = Title("Several keepalived daemons"),
+                    help_text = Help("Every daemon gets its own services, the items end with \" in <name>\"."),
+                    elements = [
+                        CascadingDropdownElement(
+                            name = "auto",
+                            parameter_form = FixedValue(
+                                value = None,
+                                title = Title("Find the running daemons, named by network namespace"),
+                                label = Label("The daemon in the namespace of the agent has no name"),
+                            )
+                        ),
+                        CascadingDropdownElement(
+                            name = "list",
+                            parameter_form = List(
+                                title = Title("Configured daemons"),
+                                element_template = _daemon_form(),
+                            )
+                        )
+                    ],
+                    prefill = DefaultValue("auto")
+                )
+            ),
             "interval": DictElement(
                 parameter_form = TimeSpan(
                     title = Title("Run asynchronously"),
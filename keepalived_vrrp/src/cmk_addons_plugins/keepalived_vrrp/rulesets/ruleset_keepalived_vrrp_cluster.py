@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+from cmk.rulesets.v1 import Title
+from cmk.rulesets.v1.form_specs import DefaultValue, DictElement, Dictionary, ServiceState
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+def _parameter_form_keepalived_vrrp_cluster() -> Dictionary:
+    return Dictionary(
+        elements = {
+            "no_master": DictElement(
+                parameter_form = ServiceState(
+                    title = Title("State if no node is MASTER"),
+                    prefill = DefaultValue(ServiceState.CRIT)
+                )
+            ),
+            "multiple_masters": DictElement(
+                parameter_form = ServiceState(
+                    title = Title("State if more than one node is MASTER (split brain)"),
+                    prefill = DefaultValue(ServiceState.CRIT)
+                )
+            ),
+            "priority_mismatch": DictElement(
+                parameter_form = ServiceState(
+                    title = Title("State if a BACKUP has a higher priority than the MASTER"),
+                    prefill = DefaultValue(ServiceState.WARN)
+                )
+            )
+        }
+    )
+
+rule_spec_keepalived_vrrp_cluster = CheckParameters(
+    name = "keepalived_vrrp_cluster",
+    title = Title("Keepalived VRRP router of a cluster (Linux)"),
+    topic = Topic.GENERAL,
+    parameter_form = _parameter_form_keepalived_vrrp_cluster,
+    condition = HostAndItemCondition(item_title=Title("VRID on interface"))
+)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+from cmk.rulesets.v1 import Help, Title
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    Integer,
+    LevelDirection,
+    ServiceState,
+    SimpleLevels
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+def _levels_connections(title: Title, warn: int, crit: int) -> DictElement:
+    return DictElement(
+        parameter_form = SimpleLevels(
+            title = title,
+            form_spec_template = Integer(),
+            level_direction = LevelDirection.UPPER,
+            prefill_fixed_levels = DefaultValue((warn, crit))
+        )
+    )
+
+def _parameter_form_keepalived_vrrp_ipvs() -> Dictionary:
+    return Dictionary(
+        elements = {
+            "no_real_server": DictElement(
+                parameter_form = ServiceState(
+                    title = Title("State if no real server has a weight above 0"),
+                    prefill = DefaultValue(ServiceState.CRIT)
+                )
+            ),
+            "weight_zero": DictElement(
+                parameter_form = ServiceState(
+                    title = Title("State if some real servers have the weight 0"),
+                    help_text = Help("keepalived sets the weight of a failed real server to 0 with inhibit_on_failure, "
+                                     "otherwise it removes the real server."),
+                    prefill = DefaultValue(ServiceState.WARN)
+                )
+            ),
+            "active_connections_upper": _levels_connections(
+                Title("Active connections of all real servers"), 10000, 20000
+            ),
+            "inactive_connections_upper": _levels_connections(
+                Title("Inactive connections of all real servers"), 50000, 100000
+            )
+        }
+    )
+
+rule_spec_keepalived_vrrp_ipvs = CheckParameters(
+    name = "keepalived_vrrp_ipvs",
+    title = Title("Keepalived IPVS virtual server (Linux)"),
+    topic = Topic.GENERAL,
+    parameter_form = _parameter_form_keepalived_vrrp_ipvs,
+    condition = HostAndItemCondition(item_title=Title("Protocol and address of the virtual server"))
+)
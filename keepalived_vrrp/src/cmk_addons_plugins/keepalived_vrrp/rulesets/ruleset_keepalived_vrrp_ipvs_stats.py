@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+from cmk.rulesets.v1 import Help, Title
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    Float,
+    LevelDirection,
+    SimpleLevels
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostCondition, Topic
+
+def _levels_per_second(title: Title, unit_symbol: str, warn: float, crit: float) -> DictElement:
+    return DictElement(
+        parameter_form = SimpleLevels(
+            title = title,
+            form_spec_template = Float(unit_symbol = unit_symbol),
+            level_direction = LevelDirection.UPPER,
+            prefill_fixed_levels = DefaultValue((warn, crit))
+        )
+    )
+
+def _parameter_form_keepalived_vrrp_ipvs_stats() -> Dictionary:
+    return Dictionary(
+        help_text = Help("The kernel counts the connections, packets and bytes of all virtual servers "
+                         "of a network namespace, with several keepalived daemons the rates are summed up."),
+        elements = {
+            "conns_upper": _levels_per_second(
+                Title("New connections per second"), "/s", 1000.0, 5000.0
+            ),
+            "inpkts_upper": _levels_per_second(
+                Title("Incoming packets per second"), "/s", 100000.0, 500000.0
+            ),
+            "outpkts_upper": _levels_per_second(
+                Title("Outgoing packets per second"), "/s", 100000.0, 500000.0
+            ),
+            "inbytes_upper": _levels_per_second(
+                Title("Incoming bytes per second"), "B/s", 100000000.0, 500000000.0
+            ),
+            "outbytes_upper": _levels_per_second(
+                Title("Outgoing bytes per second"), "B/s", 100000000.0, 500000000.0
+            )
+        }
+    )
+
+rule_spec_keepalived_vrrp_ipvs_stats = CheckParameters(
+    name = "keepalived_vrrp_ipvs_stats",
+    title = Title("Keepalived IPVS throughput (Linux)"),
+    topic = Topic.GENERAL,
+    parameter_form = _parameter_form_keepalived_vrrp_ipvs_stats,
+    condition = HostCondition()
+)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 
 from pathlib import Path
-from typing import TypedDict, List
+from typing import Literal, Optional, TypedDict, List, Tuple, Union
 
 from .bakery_api.v1 import (
     OS,
@@ -19,10 +19,22 @@ from .bakery_api.v1 import (
 # Create a class that holds our config. This corresponds to the parameters set
 # in the setup GUI and defines in web/plugins/wato/keepalived_vrrp_bakery.py
 
+class keepalived_vrrpDaemon(TypedDict, total=False):
+    name: str
+    pidfile: str
+    jsonfile: str
+    notify_fifo: str
+
 class keepalived_vrrpBakeryConfig(TypedDict, total=False):
     interval: int
+    binary: str
     pidfile: str
     jsonfile: str
+    timeout: int
+    notify_fifo: str
+    json_interval: int
+    verify_vips: bool
+    daemons: Union[Tuple[Literal['auto'], None], Tuple[Literal['list'], List[keepalived_vrrpDaemon]]]
 
 def get_keepalived_vrrp_plugin_files(conf: keepalived_vrrpBakeryConfig) -> FileGenerator:
     # In some cases you may want to override user input here to ensure a minimal
@@ -37,7 +49,7 @@ def get_keepalived_vrrp_plugin_files(conf: keepalived_vrrpBakeryConfig) -> FileG
     # will be reused as target name
     yield Plugin(
         base_os=OS.LINUX,
-        source=Path('keepalived_vrrp.sh'),
+        source=Path('keepalived_vrrp.py'),
         interval=interval,
     )
 
@@ -47,18 +59,45 @@ def get_keepalived_vrrp_plugin_files(conf: keepalived_vrrpBakeryConfig) -> FileG
                       include_header=True)
 
 def _get_linux_cfg_lines(cfg: dict) -> List[str]:
+    # quote_shell_string() already adds the quotes
     lines = []
     if 'binary' in cfg and cfg['binary'] != '':
-        lines.append('KEEPALIVED_BIN="%s"' % quote_shell_string(cfg['binary']))
+        lines.append('KEEPALIVED_BIN=%s' % quote_shell_string(cfg['binary']))
     if 'pidfile' in cfg and cfg['pidfile'] != '':
-        lines.append('KEEPALIVED_PIDFILE="%s"' % quote_shell_string(cfg['pidfile']))
+        lines.append('KEEPALIVED_PIDFILE=%s' % quote_shell_string(cfg['pidfile']))
     if 'jsonfile' in cfg and cfg['jsonfile'] != '':
-        lines.append('KEEPALIVED_STATUS_JSON="%s"' % quote_shell_string(cfg['jsonfile']))
+        lines.append('KEEPALIVED_STATUS_JSON=%s' % quote_shell_string(cfg['jsonfile']))
+    if 'timeout' in cfg:
+        lines.append('KEEPALIVED_TIMEOUT=%d' % cfg['timeout'])
+    if 'notify_fifo' in cfg and cfg['notify_fifo'] != '':
+        lines.append('KEEPALIVED_NOTIFY_FIFO=%s' % quote_shell_string(cfg['notify_fifo']))
+    if 'json_interval' in cfg:
+        lines.append('KEEPALIVED_JSON_INTERVAL=%d' % cfg['json_interval'])
+    if 'verify_vips' in cfg:
+        lines.append('KEEPALIVED_VERIFY_VIPS=%d' % cfg['verify_vips'])
+    if 'daemons' in cfg:
+        lines += _get_daemons_cfg_lines(*cfg['daemons'])
+    return lines
+
+def _get_daemons_cfg_lines(kind: str, daemons: Optional[List[keepalived_vrrpDaemon]]) -> List[str]:
+    if kind == 'auto':
+        return ['KEEPALIVED_DAEMONS=auto']
+    daemons = daemons or []
+    lines = ['KEEPALIVED_DAEMONS=%s' % quote_shell_string(' '.join(daemon['name'] for daemon in daemons))]
+    # the options of a daemon have its name appended
+    for daemon in daemons:
+        for key, option in [
+            ('pidfile', 'KEEPALIVED_PIDFILE'),
+            ('jsonfile', 'KEEPALIVED_STATUS_JSON'),
+            ('notify_fifo', 'KEEPALIVED_NOTIFY_FIFO'),
+        ]:
+            if daemon.get(key, '') != '':
+                lines.append('%s_%s=%s' % (option, daemon['name'], quote_shell_string(daemon[key])))
     return lines
 
 def get_keepalived_vrrp_scriptlets(conf: keepalived_vrrpBakeryConfig) -> ScriptletGenerator: # pylint: disable=unused-argument
-    installed_lines = ['logger "Installed keepalived_vrrp.sh"']
-    uninstalled_lines = ['logger "Uninstalled keepalived_vrrp.sh"']
+    installed_lines = ['logger "Installed keepalived_vrrp.py"']
+    uninstalled_lines = ['logger "Uninstalled keepalived_vrrp.py"']
 
     yield Scriptlet(step=DebStep.POSTINST, lines=installed_lines)
     yield Scriptlet(step=DebStep.POSTRM, lines=uninstalled_lines)
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Benchmark of parse_valkey_info on large synthetic INFO outputs
+
+Compares the current parser of the checkout with the parser of the baseline
+(commit c840e62), which tried int() and float() for every value and re-joined
+the colon split lines. The baseline kept compound values like
+"keys=3,expires=1" as strings, the current parser decodes them into mappings.
+The speedup is computed against the baseline with the compound values decoded
+too, the baseline alone is printed for reference. The current parser decodes
+the INFO sections lazily, for a fair comparison all sections are decoded. Both
+store the decoded sections as dicts, so the retained memory is about the same.
+Needs the Checkmk API, so run it as site user:
+
+    python3 valkey/benchmark/benchmark_parse_valkey_info.py [INSTANCES] [ROUNDS]
+"""
+
+import importlib.util
+import random
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+VALKEY_BASE = (
+    Path(__file__).resolve().parent.parent
+    / "src/cmk_addons_plugins/valkey/agent_based/valkey_base.py"
+)
+
+
+def load_valkey_base():
+    spec = importlib.util.spec_from_file_location("valkey_base", VALKEY_BASE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def parse_valkey_info_baseline(string_table):
+    """parse_valkey_info of the baseline, commit c840e62"""
+    parsed: dict = {}
+    instance = {}
+    inst_section = {}
+    for line in string_table:
+        if line[0].startswith("[[[") and line[0].endswith("]]]"):
+            name, host, port = line[0][3:-3].split("|")
+            instance = parsed.setdefault(
+                name.replace(";", ":"),
+                {
+                    "host": host,
+                    "port": port,
+                },
+            )
+            continue
+
+        if not instance:
+            continue
+
+        if line[0] == "error":
+            instance[line[0]] = ": ".join(line[1:])
+            continue
+
+        if line[0].startswith("#"):
+            inst_section = instance.setdefault(line[0].split()[-1], {})
+            continue
+
+        raw_value = ":".join(line[1:])
+        try:
+            value: int | float = int(raw_value)
+        except ValueError:
+            pass
+        else:
+            inst_section[line[0]] = value
+            continue
+
+        try:
+            value = float(raw_value)
+        except ValueError:
+            pass
+        else:
+            inst_section[line[0]] = value
+            continue
+
+        inst_section[line[0]] = raw_value
+
+    return parsed
+
+
+def decode_compound_values(valkey_base, parsed):
+    """The result of the baseline with the compound values decoded like the current parser"""
+    parse_value = valkey_base._parse_value  # pylint: disable=protected-access
+    return {
+        item: {
+            key: (
+                {
+                    name: parse_value(value) if isinstance(value, str) else value
+                    for name, value in fields.items()
+                }
+                if isinstance(fields, dict)
+                else fields
+            )
+            for key, fields in instance.items()
+        }
+        for item, instance in parsed.items()
+    }
+
+
+COMMANDS = [
+    "get", "set", "del", "exists", "expire", "ttl", "incr", "decr", "mget", "mset",
+    "hget", "hset", "hdel", "hgetall", "hmget", "lpush", "rpush", "lpop", "rpop", "lrange",
+    "sadd", "srem", "smembers", "sismember", "zadd", "zrem", "zrange", "zrangebyscore",
+    "zscore", "publish", "subscribe", "ping", "info", "scan", "type", "unlink", "eval",
+    "evalsha", "multi", "exec", "watch", "client|list", "client|setname", "config|get",
+    "slowlog|get", "latency|latest", "memory|usage", "cluster|info", "xadd", "xread",
+]
+
+
+def instance_lines(index, rng):
+    port = 6379 + index
+    yield "[[[127.0.0.1;%d|127.0.0.1|%d]]]" % (port, port)
+    yield "# Server"
+    for key, value in [
+        ("valkey_version", "8.1.1"),
+        ("redis_git_sha1", "00000000"),
+        ("server_mode", "standalone"),
+        ("os", "Linux 6.1.0-37-amd64 x86_64"),
+        ("arch_bits", "64"),
+        ("multiplexing_api", "epoll"),
+        ("gcc_version", "14.2.0"),
+        ("process_id", str(1000 + index)),
+        ("run_id", "%040x" % rng.getrandbits(160)),
+        ("tcp_port", str(port)),
+        ("uptime_in_seconds", str(rng.randint(0, 10**7))),
+        ("hz", "10"),
+        ("executable", "/usr/bin/valkey-server"),
+        ("config_file", "/etc/valkey/valkey%d.conf" % index),
+    ]:
+        yield "%s:%s" % (key, value)
+    yield ""
+    yield "# Clients"
+    for key in ["connected_clients", "cluster_connections", "maxclients", "blocked_clients"]:
+        yield "%s:%d" % (key, rng.randint(0, 10000))
+    yield ""
+    yield "# Memory"
+    for number in range(40):
+        yield "memory_field_%d:%d" % (number, rng.randint(0, 10**10))
+    yield "used_memory_human:%.2fM" % rng.uniform(1, 1000)
+    yield "mem_fragmentation_ratio:%.2f" % rng.uniform(0.5, 3)
+    yield ""
+    yield "# Persistence"
+    for number in range(25):
+        yield "persistence_field_%d:%d" % (number, rng.randint(-1, 10**6))
+    yield "rdb_last_bgsave_status:ok"
+    yield ""
+    yield "# Stats"
+    for number in range(50):
+        yield "stats_field_%d:%d" % (number, rng.randint(0, 10**9))
+    yield "instantaneous_input_kbps:%.2f" % rng.uniform(0, 1000)
+    yield ""
+    yield "# Replication"
+    yield "role:master"
+    yield "connected_slaves:2"
+    for replica in range(2):
+        yield "slave%d:ip=10.0.0.%d,port=6379,state=online,offset=%d,lag=0" % (
+            replica,
+            replica + 2,
+            rng.randint(0, 10**9),
+        )
+    yield "master_repl_offset:%d" % rng.randint(0, 10**9)
+    yield ""
+    yield "# CPU"
+    for key in ["used_cpu_sys", "used_cpu_user", "used_cpu_sys_children", "used_cpu_user_children"]:
+        yield "%s:%.6f" % (key, rng.uniform(0, 10**5))
+    yield ""
+    yield "# Commandstats"
+    for command in COMMANDS:
+        calls = rng.randint(1, 10**9)
+        usec = calls * rng.randint(1, 20)
+        yield "cmdstat_%s:calls=%d,usec=%d,usec_per_call=%.2f,rejected_calls=0,failed_calls=0" % (
+            command,
+            calls,
+            usec,
+            usec / calls,
+        )
+    yield ""
+    yield "# Keyspace"
+    for db in range(16):
+        yield "db%d:keys=%d,expires=%d,avg_ttl=%d" % (
+            db,
+            rng.randint(0, 10**7),
+            rng.randint(0, 10**5),
+            rng.randint(0, 10**8),
+        )
+
+
+def string_tables(instances):
+    rng = random.Random(42)
+    lines = [line for index in range(instances) for line in instance_lines(index, rng)]
+    # Checkmk drops empty lines
+    lines = [line for line in lines if line]
+    return [[line] for line in lines], [line.split(":") for line in lines]
+
+
+def decode_all(parse_function):
+    def parse(string_table):
+        return {item: dict(instance) for item, instance in parse_function(string_table).items()}
+
+    return parse
+
+
+def measure(name, parse_function, string_table, rounds):
+    seconds = min(timeit.repeat(lambda: parse_function(string_table), number=1, repeat=rounds))
+    tracemalloc.start()
+    parsed = parse_function(string_table)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    print(
+        "%-32s %9.2f ms %9.0f lines/ms %9.1f KiB retained %9.1f KiB peak"
+        % (name, seconds * 1000, len(string_table) / seconds / 1000, retained / 1024, peak / 1024)
+    )
+    return seconds
+
+
+def main():
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    valkey_base = load_valkey_base()
+    full_lines, colon_split = string_tables(instances)
+    print("%d instances, %d lines, best of %d rounds" % (instances, len(full_lines), rounds))
+    assert valkey_base.parse_valkey_info(full_lines) == decode_compound_values(
+        valkey_base, parse_valkey_info_baseline(colon_split)
+    )
+
+    current_parser = decode_all(valkey_base.parse_valkey_info)
+    measure("baseline parser (sep(58))", parse_valkey_info_baseline, colon_split, rounds)
+    baseline = measure(
+        "baseline, compound decoded",
+        lambda string_table: decode_compound_values(
+            valkey_base, parse_valkey_info_baseline(string_table)
+        ),
+        colon_split,
+        rounds,
+    )
+    current = measure("current parser (sep(58))", current_parser, colon_split, rounds)
+    current_full = measure("current parser (sep(0))", current_parser, full_lines, rounds)
+    print("speedup sep(58): %.2fx, sep(0): %.2fx" % (baseline / current, baseline / current_full))
+
+
+if __name__ == "__main__":
+    main()
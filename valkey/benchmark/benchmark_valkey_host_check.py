@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Benchmark of a complete check of a host with many Valkey instances
+
+Runs the parse function of valkey_info once and the discovery and check
+functions of the plug-ins using the section for every instance, like a check
+cycle of Checkmk does. This is done for all plug-ins and for valkey_info only.
+Compares the lazily decoded section of the checkout with a section decoding all
+INFO sections in advance. The check plug-ins of the checkout are used, the value
+store is kept in memory. Needs the Checkmk API, so run it as site user:
+
+    python3 valkey/benchmark/benchmark_valkey_host_check.py [INSTANCES] [ROUNDS]
+"""
+
+import importlib
+import inspect
+import sys
+import timeit
+import types
+from pathlib import Path
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+PLUGIN_DIR = BENCHMARK_DIR.parent / "src/cmk_addons_plugins/valkey"
+
+sys.path.insert(0, str(BENCHMARK_DIR))
+
+from benchmark_parse_valkey_info import (  # pylint: disable=wrong-import-position
+    decode_all,
+    string_tables,
+)
+
+# plug-in name and item of the service being checked, selects the value store
+CURRENT_SERVICE = [("", "")]
+
+
+def load_agent_based_plugins():
+    # import the plug-ins of the checkout instead of the ones installed in the site
+    for name, path in [
+        ("cmk_addons.plugins.valkey", PLUGIN_DIR),
+        ("cmk_addons.plugins.valkey.agent_based", PLUGIN_DIR / "agent_based"),
+    ]:
+        package = types.ModuleType(name)
+        package.__path__ = [str(path)]
+        sys.modules[name] = package
+
+    value_stores = {}
+    modules = []
+    for path in sorted((PLUGIN_DIR / "agent_based").glob("valkey_*.py")):
+        module = importlib.import_module(f"cmk_addons.plugins.valkey.agent_based.{path.stem}")
+        if hasattr(module, "get_value_store"):
+            module.get_value_store = lambda: value_stores.setdefault(CURRENT_SERVICE[0], {})
+        modules.append(module)
+    return modules
+
+
+def info_check_plugins(modules):
+    plugins = []
+    for module in modules:
+        for name, plugin in vars(module).items():
+            if not name.startswith("check_plugin_"):
+                continue
+            # without explicit sections a plug-in subscribes to the section of its name
+            if list(plugin.sections or [plugin.name]) == ["valkey_info"]:
+                plugins.append(plugin)
+    return plugins
+
+
+def check_host(plugins, parse_function, string_table):
+    section = parse_function(string_table)
+    for plugin in plugins:
+        with_params = "params" in inspect.signature(plugin.check_function).parameters
+        for service in plugin.discovery_function(section):
+            CURRENT_SERVICE[0] = (plugin.name, service.item)
+            if with_params:
+                kwargs = {"params": plugin.check_default_parameters or {}}
+            else:
+                kwargs = {}
+            for _result in plugin.check_function(item=service.item, section=section, **kwargs):
+                pass
+
+
+def main():
+    instances = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    modules = load_agent_based_plugins()
+    valkey_base = sys.modules["cmk_addons.plugins.valkey.agent_based.valkey_base"]
+    plugins = info_check_plugins(modules)
+    string_table, _colon_split = string_tables(instances)
+    print(
+        "%d instances, %d lines, %d check plug-ins, best of %d rounds"
+        % (instances, len(string_table), len(plugins), rounds)
+    )
+
+    # services of the other plug-ins may be disabled, e.g. on hosts with many instances
+    for title, selected_plugins in [
+        ("all plug-ins", plugins),
+        ("valkey_info only", [plugin for plugin in plugins if plugin.name == "valkey_info"]),
+    ]:
+        print(title)
+        results = {}
+        for name, parse_function in [
+            ("all sections decoded", decode_all(valkey_base.parse_valkey_info)),
+            ("lazily decoded sections", valkey_base.parse_valkey_info),
+        ]:
+            # the first check cycle only initializes the counters in the value store
+            check_host(selected_plugins, parse_function, string_table)
+            results[name] = min(
+                timeit.repeat(
+                    lambda selected_plugins=selected_plugins, parse_function=parse_function: (
+                        check_host(selected_plugins, parse_function, string_table)
+                    ),
+                    number=1,
+                    repeat=rounds,
+                )
+            )
+            print("  %-26s host check %8.2f ms" % (name, results[name] * 1000))
+
+        print(
+            "  speedup of the host check: %.2fx"
+            % (results["all sections decoded"] / results["lazily decoded sections"])
+        )
+
+
+if __name__ == "__main__":
+    main()
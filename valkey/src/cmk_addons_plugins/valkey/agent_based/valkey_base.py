@@ -5,59 +5,214 @@
 
 # mypy: disable-error-code="type-arg"
 
-from collections.abc import Mapping
+import sys
+import time
+from collections.abc import Iterator, Mapping, MutableMapping
 from typing import Any
 
-from cmk.agent_based.v2 import AgentSection, StringTable
+from cmk.agent_based.v2 import AgentSection, get_rate, GetRateError, StringTable
 
 Section = Mapping[str, Mapping[str, Any]]
 
 
+def _parse_scalar(raw_value: str) -> int | float | str:
+    """Classify a value without trying (and failing) int() and float() first
+
+    >>> _parse_scalar("-1")
+    -1
+    >>> _parse_scalar("1.93")
+    1.93
+    >>> _parse_scalar("8.1.1")
+    '8.1.1'
+    """
+    if raw_value.isdecimal():
+        return int(raw_value)
+    unsigned = raw_value[1:] if raw_value[:1] == "-" else raw_value
+    if unsigned.isdecimal():
+        return int(raw_value)
+    if unsigned.replace(".", "", 1).isdecimal():
+        return float(raw_value)
+    return raw_value
+
+
+def _parse_value(raw_value: str) -> int | float | str | Mapping[str, int | float | str]:
+    """Decode a single INFO value
+
+    Compound values like the ones of the Keyspace or Replication section are
+    decoded into a mapping of their fields.
+
+    >>> _parse_value("42")
+    42
+    >>> _parse_value("keys=3,expires=1,avg_ttl=1200")
+    {'keys': 3, 'expires': 1, 'avg_ttl': 1200}
+    >>> _parse_value("Linux 6.1.0-37-amd64 x86_64")
+    'Linux 6.1.0-37-amd64 x86_64'
+    """
+    if "=" not in raw_value:
+        return _parse_scalar(raw_value)
+
+    if raw_value.count("=") != raw_value.count(",") + 1:
+        return raw_value
+
+    return {
+        sys.intern(key): _parse_scalar(value)
+        for key, _separator, value in (field.partition("=") for field in raw_value.split(","))
+    }
+
+
+def _decode_section(lines: list[str]) -> Mapping[str, Any]:
+    decoded = {}
+    for line in lines:
+        key, separator, raw_value = line.partition(":")
+        if separator:
+            decoded[sys.intern(key)] = _parse_value(raw_value.rstrip("\r"))
+    return decoded
+
+
+class ValkeyInstance(Mapping[str, Any]):
+    """INFO of one instance
+
+    The lines of every INFO section are kept as they are and only decoded on the first
+    access of the section. The parsed section is shared by all plug-ins of the host, so
+    sections without a check plug-in are never decoded.
+
+    >>> instance = ValkeyInstance("127.0.0.1", "6379")
+    >>> instance.section_lines("Clients").append("connected_clients:1")
+    >>> "Clients" in instance, sorted(instance)
+    (True, ['Clients', 'host', 'port'])
+    >>> instance["Clients"]
+    {'connected_clients': 1}
+    """
+
+    __slots__ = ("_fields", "_raw", "_decoded")
+
+    def __init__(self, host: str, port: str) -> None:
+        self._fields: dict[str, Any] = {"host": host, "port": port}
+        self._raw: dict[str, list[str]] = {}
+        self._decoded: dict[str, Mapping[str, Any]] = {}
+
+    def section_lines(self, inst_section: str) -> list[str]:
+        return self._raw.setdefault(inst_section, [])
+
+    def set_error(self, error: str) -> None:
+        self._fields["error"] = error
+
+    def set_cached(self, timestamp: int, interval: int) -> None:
+        self._fields["cached"] = (timestamp, interval)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # checks look up missing keys like "error" a lot, avoid raising KeyError for them
+        if (value := self._fields.get(key)) is not None:
+            return value
+        if (decoded := self._decoded.get(key)) is not None:
+            return decoded
+        if (lines := self._raw.get(key)) is None:
+            return default
+        decoded = self._decoded[key] = _decode_section(lines)
+        return decoded
+
+    def __getitem__(self, key: str) -> Any:
+        if (value := self.get(key)) is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._fields or key in self._raw
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._fields
+        yield from self._raw
+
+    def __len__(self) -> int:
+        return len(self._fields) + len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+
+def query_time(instance: Mapping[str, Any]) -> float:
+    """Time of the query of an instance
+
+    In cached mode the agent plug-in sends the same output until the cache is refreshed,
+    the time of the query tells the checks whether they have seen the counters already.
+    """
+    if (cached := instance.get("cached")) is not None:
+        return float(cached[0])
+    return time.time()
+
+
+def get_query_rate(
+    value_store: MutableMapping[str, Any],
+    key: str,
+    timestamp: float,
+    value: float,
+    *,
+    raise_overflow: bool = False,
+) -> float:
+    """get_rate of a counter at the time of the query
+
+    Checking the output of the same (cached) query again gives the same rate, instead of 0
+    and a spike once the next query arrives.
+    """
+    if (last_query := value_store.get(f"{key}.query")) is not None and last_query[0] == timestamp:
+        if last_query[1] is None:
+            raise GetRateError(f"Counter {key!r} is initializing")
+        return last_query[1]
+    try:
+        rate = get_rate(value_store, key, timestamp, value, raise_overflow=raise_overflow)
+    except GetRateError:
+        value_store[f"{key}.query"] = (timestamp, None)
+        raise
+    value_store[f"{key}.query"] = (timestamp, rate)
+    return rate
+
+
 def parse_valkey_info(string_table: StringTable) -> Section:
-    parsed: dict = {}
-    instance = {}
-    inst_section = {}
-    for line in string_table:
-        if line[0].startswith("[[[") and line[0].endswith("]]]"):
-            name, host, port = line[0][3:-3].split("|")
-            instance = parsed.setdefault(
-                name.replace(";", ":"),
-                {
-                    "host": host,
-                    "port": port,
-                },
-            )
+    """Parse the output of INFO of all instances
+
+    The agent plug-in sends complete lines (sep(0)), older versions split the
+    lines at every colon (sep(58)). Field names are interned, as the same few
+    hundred names are repeated for every instance on the host.
+    """
+    parsed: dict[str, ValkeyInstance] = {}
+    instance: ValkeyInstance | None = None
+    lines: list[str] | None = None
+    for row in string_table:
+        line = row[0] if len(row) == 1 else ":".join(row)
+        if not line:
             continue
 
-        if not instance:
+        if line[0] == "[" and line.startswith("[[[") and line.endswith("]]]"):
+            name, host, port = line[3:-3].split("|")
+            item = name.replace(";", ":")
+            if (instance := parsed.get(item)) is None:
+                instance = parsed[item] = ValkeyInstance(host, port)
+            # lines before the first section header do not belong to any section
+            lines = None
             continue
 
-        if line[0] == "error":
-            instance[line[0]] = ": ".join(line[1:])
+        if instance is None:
             continue
 
-        if line[0].startswith("#"):
-            inst_section = instance.setdefault(line[0].split()[-1], {})
+        if line[0] == "#":
+            lines = instance.section_lines(sys.intern(line.split()[-1]))
             continue
 
-        raw_value = ":".join(line[1:])
-        try:
-            value: int | float = int(raw_value)
-        except ValueError:
-            pass
-        else:
-            inst_section[line[0]] = value
+        if line.startswith("error:"):
+            instance.set_error(line[6:].strip())
             continue
 
-        try:
-            value = float(raw_value)
-        except ValueError:
-            pass
-        else:
-            inst_section[line[0]] = value
+        if line.startswith("cached:"):
+            # time of the query and cache age of asynchronously queried instances
+            timestamp, _, interval = line[7:].partition(",")
+            try:
+                instance.set_cached(int(timestamp), int(interval))
+            except ValueError:
+                pass
             continue
 
-        inst_section[line[0]] = raw_value
+        if lines is not None:
+            lines.append(line)
 
     return parsed
 
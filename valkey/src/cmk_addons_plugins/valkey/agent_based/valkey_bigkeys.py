@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="type-arg"
+
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from cmk.agent_based.v2 import (
+    AgentSection,
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    render,
+    Result,
+    Service,
+    State,
+    StringTable,
+)
+
+# <<<valkey_bigkeys:sep(0)>>>
+# [[[MY_FIRST_VALKEY|127.0.0.1|6380]]]
+# cursor 0
+# started 1760000000
+# last_run 1760000010
+# scanned 25210
+# key 104857688 session:blob
+# key 5000 user:7
+# prefix 105068712 25000 session
+# prefix 20984 150 user
+# prefix 1000105 60 (other)
+# finished 1760000010
+# scan_started 1760000300
+# scan_scanned 10000
+
+# cursor/started/last_run - State of the scan, written by the agent plug-in
+# scanned - Number of keys sampled with MEMORY USAGE by the last complete scan
+# key - Memory usage in bytes and name of the biggest keys
+# prefix - Memory usage in bytes and number of keys per key prefix, keys without
+#          separator are counted as "-", the prefixes with less memory are summed
+#          up as "(other)"
+# finished - Time the last complete scan finished
+# scan_started/scan_scanned - Progress of the scan in progress
+# error - Error of SCAN, the scan is retried by the next run of the agent plug-in
+
+Section = Mapping[str, Mapping[str, Any]]
+
+
+def parse_valkey_bigkeys(string_table: StringTable) -> Section:
+    parsed: dict = {}
+    instance: dict = {}
+    for (line,) in string_table:
+        if line.startswith("[[[") and line.endswith("]]]"):
+            name = line[3:-3].split("|")[0]
+            instance = parsed.setdefault(name.replace(";", ":"), {"keys": [], "prefixes": []})
+            continue
+
+        if not instance:
+            continue
+
+        key, _, value = line.partition(" ")
+        try:
+            if key == "key":
+                size, _, key_name = value.partition(" ")
+                instance["keys"].append((key_name, int(size)))
+            elif key == "prefix":
+                size, count, prefix = value.split(" ", 2)
+                instance["prefixes"].append((prefix, int(size), int(count)))
+            elif key == "error":
+                instance["error"] = value
+            elif key in ("scanned", "finished", "scan_started", "scan_scanned"):
+                instance[key] = int(value)
+        except ValueError:
+            continue
+
+    return parsed
+
+
+agent_section_valkey_bigkeys = AgentSection(
+    name="valkey_bigkeys",
+    parse_function=parse_valkey_bigkeys,
+)
+
+
+def discover_valkey_bigkeys(section: Section) -> DiscoveryResult:
+    yield from (Service(item=item) for item in section)
+
+
+def check_valkey_bigkeys(
+    item: str,
+    params: Mapping[str, Any],
+    section: Section,
+) -> CheckResult:
+    if (data := section.get(item)) is None:
+        return
+
+    if (error := data.get("error")) is not None:
+        yield Result(state=State.WARN, summary=f"Scan failed: {error}")
+
+    now = time.time()
+    if (finished := data.get("finished")) is None:
+        yield Result(state=State.OK, summary="No complete scan yet")
+    else:
+        if data["keys"]:
+            key_name, size = data["keys"][0]
+            yield from check_levels(
+                size,
+                metric_name="valkey_bigkeys_largest",
+                levels_upper=params.get("key_size_upper"),
+                render_func=render.bytes,
+                label=f"Largest key {key_name}",
+            )
+        yield from check_levels(
+            data.get("scanned", 0),
+            metric_name="valkey_bigkeys_scanned",
+            render_func=lambda x: str(int(x)),
+            label="Keys sampled",
+        )
+        yield from check_levels(
+            max(now - finished, 0.0),
+            levels_upper=params.get("scan_age_upper"),
+            render_func=render.timespan,
+            label="Last complete scan",
+            notice_only=True,
+        )
+
+    if (scan_started := data.get("scan_started")) is not None:
+        yield Result(
+            state=State.OK,
+            notice=(
+                f"Scan in progress since {render.timespan(max(now - scan_started, 0.0))},"
+                f" {data.get('scan_scanned', 0)} keys sampled"
+            ),
+        )
+
+    if data["keys"]:
+        yield Result(
+            state=State.OK,
+            notice="Biggest keys:\n"
+            + "\n".join(f"{key_name}: {render.bytes(size)}" for key_name, size in data["keys"]),
+        )
+    if data["prefixes"]:
+        yield Result(
+            state=State.OK,
+            notice="Memory per key prefix:\n"
+            + "\n".join(
+                f"{prefix}: {render.bytes(size)} in {count} keys"
+                for prefix, size, count in data["prefixes"]
+            ),
+        )
+
+
+check_plugin_valkey_bigkeys = CheckPlugin(
+    name="valkey_bigkeys",
+    service_name="Valkey %s Big Keys",
+    discovery_function=discover_valkey_bigkeys,
+    check_function=check_valkey_bigkeys,
+    check_ruleset_name="valkey_bigkeys",
+    check_default_parameters={},
+)
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="type-arg"
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from cmk.agent_based.v2 import (
+    AgentSection,
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    render,
+    Result,
+    Service,
+    State,
+    StringTable,
+)
+
+# <<<valkey_client_list:sep(0)>>>
+# [[[MY_FIRST_VALKEY|127.0.0.1|6380]]]
+# total 1203
+# pubsub 12
+# blocked 3
+# omem_total 21430272
+# omem_max 20971520
+# idle_histogram 1:800 10:150 60:100 300:50 1800:40 3600:30 inf:33
+# omem_histogram 0:1190 65536:10 1048576:2 16777216:1 268435456:0 inf:0
+# group 10.0.0.12 web 640 12 0
+# group 10.0.0.13 worker 500 4000 458752
+# group - (other) 63 86000 20971520
+
+# total - Number of client connections in the output of CLIENT LIST
+# pubsub - Connections subscribed to at least one (pattern or shard) channel
+# blocked - Connections blocked by a blocking command
+# omem_total/omem_max - Sum and maximum of the memory used by the output buffers
+# idle_histogram - Connections per idle time in seconds, the bucket key is the upper bound
+# omem_histogram - Connections per output buffer size in bytes, the bucket key is the upper bound
+# group - Connections grouped by client address and name: number of connections, longest
+#         idle time and memory of the output buffers. Only the groups with the most
+#         connections are sent, the rest is summed up as "- (other)".
+
+Histogram = Sequence[tuple[float, int]]
+Section = Mapping[str, Mapping[str, Any]]
+
+
+def _parse_histogram(fields: Sequence[str]) -> Histogram:
+    """
+    >>> _parse_histogram(["1:3", "10:0", "inf:2"])
+    [(1.0, 3), (10.0, 0), (inf, 2)]
+    """
+    histogram = []
+    for field in fields:
+        bound, _, count = field.partition(":")
+        histogram.append((float(bound), int(count)))
+    return histogram
+
+
+def parse_valkey_client_list(string_table: StringTable) -> Section:
+    parsed: dict = {}
+    instance: dict = {}
+    for (line,) in string_table:
+        if line.startswith("[[[") and line.endswith("]]]"):
+            name = line[3:-3].split("|")[0]
+            instance = parsed.setdefault(name.replace(";", ":"), {"groups": []})
+            continue
+
+        if not instance:
+            continue
+
+        key, *fields = line.split()
+        try:
+            if key == "group":
+                address, client_name, count, idle, omem = line.split(" ", 1)[1].rsplit(" ", 4)
+                instance["groups"].append(
+                    {
+                        "address": address,
+                        "name": client_name,
+                        "count": int(count),
+                        "idle_max": int(idle),
+                        "omem": int(omem),
+                    }
+                )
+            elif key.endswith("_histogram"):
+                instance[key] = _parse_histogram(fields)
+            elif len(fields) == 1:
+                instance[key] = int(fields[0])
+        except ValueError:
+            continue
+
+    return parsed
+
+
+agent_section_valkey_client_list = AgentSection(
+    name="valkey_client_list",
+    parse_function=parse_valkey_client_list,
+)
+
+
+def _idle_connections(histogram: Histogram, idle_time: float) -> tuple[float, int]:
+    """Connections idle for longer than the bucket bound next to the idle time
+
+    >>> _idle_connections([(1.0, 3), (60.0, 2), (300.0, 4), (float("inf"), 5)], 200)
+    (300.0, 5)
+    """
+    lower = 0.0
+    for bound, _count in histogram:
+        lower = bound
+        if bound >= idle_time:
+            break
+    return lower, sum(count for bound, count in histogram if bound > lower)
+
+
+def _render_group(group: Mapping[str, Any]) -> str:
+    if group["address"] == "-":
+        client = "Other clients"
+    elif group["name"] == "-":
+        client = group["address"]
+    else:
+        client = f"{group['address']} ({group['name']})"
+    return (
+        f"{client}: {group['count']} connections,"
+        f" idle up to {render.timespan(group['idle_max'])},"
+        f" output buffers {render.bytes(group['omem'])}"
+    )
+
+
+def discover_valkey_client_list(section: Section) -> DiscoveryResult:
+    yield from (Service(item=item) for item, data in section.items() if "total" in data)
+
+
+def check_valkey_client_list(
+    item: str,
+    params: Mapping[str, Any],
+    section: Section,
+) -> CheckResult:
+    if (data := section.get(item)) is None or "total" not in data:
+        return
+
+    yield from check_levels(
+        data["total"],
+        metric_name="valkey_client_connections",
+        render_func=lambda x: str(int(x)),
+        label="Connections",
+    )
+
+    if (idle_histogram := data.get("idle_histogram")) is not None:
+        idle_time, idle = _idle_connections(idle_histogram, params["idle_time"])
+        yield from check_levels(
+            idle,
+            metric_name="valkey_client_connections_idle",
+            levels_upper=params.get("idle_upper"),
+            render_func=lambda x: str(int(x)),
+            label=f"Idle longer than {render.timespan(idle_time)}",
+        )
+
+    for key, label in (("pubsub", "Pub/Sub"), ("blocked", "Blocked")):
+        if (value := data.get(key)) is not None:
+            yield from check_levels(
+                value,
+                metric_name=f"valkey_client_connections_{key}",
+                levels_upper=params.get(f"{key}_upper"),
+                render_func=lambda x: str(int(x)),
+                label=label,
+                notice_only=True,
+            )
+
+    for key, label in (
+        ("omem_total", "Output buffers"),
+        ("omem_max", "Largest output buffer"),
+    ):
+        if (value := data.get(key)) is not None:
+            yield from check_levels(
+                value,
+                metric_name=f"valkey_client_{key}",
+                levels_upper=params.get(f"{key}_upper"),
+                render_func=render.bytes,
+                label=label,
+            )
+
+    groups = data["groups"]
+    if not groups:
+        return
+
+    named_groups = [group for group in groups if group["address"] != "-"]
+    if named_groups and (largest := max(named_groups, key=lambda group: group["omem"]))["omem"]:
+        yield Result(state=State.OK, notice=f"Largest output buffers: {_render_group(largest)}")
+    yield Result(
+        state=State.OK,
+        notice="Clients:\n"
+        + "\n".join(
+            _render_group(group)
+            for group in sorted(groups, key=lambda group: group["count"], reverse=True)
+        ),
+    )
+
+
+check_plugin_valkey_client_list = CheckPlugin(
+    name="valkey_client_list",
+    service_name="Valkey %s Client Connections",
+    discovery_function=discover_valkey_client_list,
+    check_function=check_valkey_client_list,
+    check_ruleset_name="valkey_client_list",
+    check_default_parameters={
+        "idle_time": 300.0,
+        "omem_max_upper": ("fixed", (16777216, 67108864)),
+    },
+)
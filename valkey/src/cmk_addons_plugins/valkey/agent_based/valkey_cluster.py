@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="type-arg"
+
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from cmk.agent_based.v2 import (
+    AgentSection,
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    render,
+    Result,
+    Service,
+    State,
+    StringTable,
+)
+
+# <<<valkey_cluster:sep(0)>>>
+# [[[MY_FIRST_VALKEY|127.0.0.1|7000]]]
+# # Info
+# cluster_state:ok
+# cluster_slots_assigned:16384
+# cluster_slots_ok:16384
+# cluster_slots_pfail:0
+# cluster_slots_fail:0
+# cluster_known_nodes:6
+# cluster_size:3
+# myself:e7d1eecce10fd6bb5eb35b9f99a514335d9ba9ca
+# cluster_id:07c37dfeb235213a872192d90877d0cd55635b91
+# # Nodes
+# e7d1eecce10fd6bb5eb35b9f99a514335d9ba9ca 127.0.0.1:7000@17000 myself,master - 0 0 1 connected 0-5460
+# 07c37dfeb235213a872192d90877d0cd55635b91 127.0.0.1:7004@17004 slave e7d1eecce10fd6bb5eb35b9f99a514335d9ba9ca 0 1426238317239 4 connected
+# # Balance
+# 127.0.0.1:7000 (e7d1eecc...) -> 100 keys | 5461 slots | 1 slaves.
+# [OK] 100 keys in 1 masters.
+
+# Info - Output of CLUSTER INFO
+# myself - ID of the node of the instance
+# cluster_id - Smallest node ID of the cluster. Nodes are only sent once per cluster and
+#              are shared by all instances with the same cluster_id. Balance is only sent
+#              by the node with the smallest ID, on one host of the cluster.
+# Nodes - Output of CLUSTER NODES: ID, address, flags, ID of the master, last ping sent and
+#         pong received, config epoch, link state and the slots served by the node
+# Balance - Output of valkey-cli --cluster info: keys, slots and replicas per master
+
+CLUSTER_SLOTS = 16384
+
+_BALANCE_LINE = re.compile(
+    r"^(\S+) \((\w+)\.\.\.\) -> (\d+) keys \| (\d+) slots \| (\d+) (?:slaves|replicas)\.$"
+)
+
+Section = Mapping[str, Mapping[str, Any]]
+
+
+def _count_slots(slot_fields: Sequence[str]) -> int:
+    """
+    >>> _count_slots(["0-5460", "5462", "[5461->-67ed2db8d677e59ec4a4cefb06858cf2a1a89fa1]"])
+    5462
+    """
+    slots = 0
+    for field in slot_fields:
+        if field.startswith("["):
+            # slot in migration, still served by the node listed above
+            continue
+        first, _, last = field.partition("-")
+        slots += int(last or first) - int(first) + 1
+    return slots
+
+
+def _parse_nodes(lines: Sequence[str]) -> Mapping[str, Mapping[str, Any]]:
+    nodes = {}
+    for line in lines:
+        fields = line.split()
+        if len(fields) < 8:
+            continue
+        flags = set(fields[2].split(","))
+        flags.discard("myself")
+        nodes[fields[0]] = {
+            "address": fields[1].split("@")[0],
+            "flags": flags,
+            "master": None if fields[3] == "-" else fields[3],
+            "link_state": fields[7],
+            "slots": _count_slots(fields[8:]),
+        }
+    return nodes
+
+
+def _deviation(values: Sequence[int]) -> float | None:
+    """Largest deviation from the average in percent
+
+    >>> _deviation([100, 120, 30])
+    64.0
+    """
+    if not values or not (average := sum(values) / len(values)):
+        return None
+    return 100.0 * max(abs(value - average) for value in values) / average
+
+
+def _build_topology(nodes_lines: Sequence[str], balance_lines: Sequence[str]) -> Mapping[str, Any]:
+    nodes = _parse_nodes(nodes_lines)
+    masters = {
+        node_id: node
+        for node_id, node in nodes.items()
+        if "master" in node["flags"] and node["slots"]
+    }
+
+    balance = {}
+    for line in balance_lines:
+        if match := _BALANCE_LINE.match(line):
+            address, id_prefix, keys, slots, replicas = match.groups()
+            balance[address] = {
+                "id_prefix": id_prefix,
+                "keys": int(keys),
+                "slots": int(slots),
+                "replicas": int(replicas),
+            }
+
+    return {
+        "nodes": nodes,
+        "balance": balance,
+        "slots_deviation": _deviation([node["slots"] for node in masters.values()]),
+        "keys_deviation": _deviation([entry["keys"] for entry in balance.values()]),
+    }
+
+
+def parse_valkey_cluster(string_table: StringTable) -> Section:
+    """Parse the cluster state of all instances
+
+    The node table of a cluster is only parsed once, all instances of the same cluster
+    reference the same topology.
+    """
+    parsed: dict = {}
+    raw_clusters: dict = {}
+    instance: dict = {}
+    item = ""
+    block = "Info"
+    for (line,) in string_table:
+        line = line.rstrip("\r")
+        if line.startswith("[[[") and line.endswith("]]]"):
+            name = line[3:-3].split("|")[0]
+            item = name.replace(";", ":")
+            instance = parsed.setdefault(item, {"info": {}})
+            block = "Info"
+            continue
+
+        if not instance or not line:
+            continue
+
+        if line.startswith("# "):
+            block = line[2:].strip()
+            continue
+
+        if block != "Info":
+            cluster = raw_clusters.setdefault(instance.get("cluster_id"), {})
+            cluster.setdefault(block, []).append(line)
+            continue
+
+        key, separator, value = line.partition(":")
+        if not separator:
+            continue
+        if key in ("myself", "cluster_id", "error"):
+            instance[key] = value.strip()
+        else:
+            instance["info"][key] = int(value) if value.isdecimal() else value
+
+    topologies = {
+        cluster_id: _build_topology(cluster.get("Nodes", []), cluster.get("Balance", []))
+        for cluster_id, cluster in raw_clusters.items()
+        if cluster_id is not None
+    }
+    for instance in parsed.values():
+        instance["topology"] = topologies.get(instance.get("cluster_id"))
+
+    return parsed
+
+
+agent_section_valkey_cluster = AgentSection(
+    name="valkey_cluster",
+    parse_function=parse_valkey_cluster,
+)
+
+
+def discover_valkey_cluster(section: Section) -> DiscoveryResult:
+    yield from (Service(item=item) for item, data in section.items() if data.get("myself"))
+
+
+def _check_nodes(params: Mapping[str, Any], topology: Mapping[str, Any]) -> CheckResult:
+    nodes = topology["nodes"]
+    failed = sorted(node["address"] for node in nodes.values() if "fail" in node["flags"])
+    pfail = sorted(node["address"] for node in nodes.values() if "fail?" in node["flags"])
+    disconnected = sorted(
+        node["address"]
+        for node in nodes.values()
+        if node["link_state"] != "connected" and "fail" not in node["flags"]
+    )
+
+    yield from check_levels(
+        len(failed),
+        metric_name="valkey_cluster_nodes_failed",
+        levels_upper=params.get("nodes_failed_upper"),
+        render_func=lambda x: str(int(x)),
+        label="Failed nodes",
+    )
+    if failed:
+        yield Result(state=State.OK, notice=f"Failed: {', '.join(failed)}")
+    if pfail:
+        yield Result(
+            state=State(params.get("pfail_state", 1)),
+            summary=f"Possibly failing: {', '.join(pfail)}",
+        )
+    if disconnected:
+        yield Result(state=State.OK, notice=f"Disconnected: {', '.join(disconnected)}")
+
+    masters_without_replicas = sorted(
+        node["address"]
+        for node_id, node in nodes.items()
+        if "master" in node["flags"]
+        and node["slots"]
+        and not any(
+            other["master"] == node_id and "fail" not in other["flags"]
+            for other in nodes.values()
+        )
+    )
+    if masters_without_replicas:
+        yield Result(
+            state=State(params.get("no_replica_state", 1)),
+            summary=f"Masters without working replica: {', '.join(masters_without_replicas)}",
+        )
+
+
+def check_valkey_cluster(item: str, params: Mapping[str, Any], section: Section) -> CheckResult:
+    if (data := section.get(item)) is None:
+        return
+
+    if (error := data.get("error")) is not None:
+        yield Result(state=State.CRIT, summary=f"Error: {error}")
+        return
+
+    info = data["info"]
+    cluster_state = info.get("cluster_state", "unknown")
+    yield Result(
+        state=State.OK if cluster_state == "ok" else State.CRIT,
+        summary=f"State: {cluster_state}",
+    )
+
+    if (slots_ok := info.get("cluster_slots_ok")) is not None:
+        yield from check_levels(
+            100.0 * slots_ok / CLUSTER_SLOTS,
+            metric_name="valkey_cluster_slots_ok",
+            levels_lower=params.get("slots_ok_lower"),
+            render_func=render.percent,
+            label="Slots served",
+        )
+    for key, label in (
+        ("cluster_slots_pfail", "possibly failing"),
+        ("cluster_slots_fail", "failing"),
+    ):
+        if slots := info.get(key):
+            yield Result(state=State.WARN, summary=f"Slots {label}: {slots}")
+
+    if (known_nodes := info.get("cluster_known_nodes")) is not None:
+        yield from check_levels(
+            known_nodes,
+            metric_name="valkey_cluster_known_nodes",
+            levels_lower=params.get("known_nodes_lower"),
+            render_func=lambda x: str(int(x)),
+            label="Known nodes",
+            notice_only=True,
+        )
+
+    if (topology := data["topology"]) is None:
+        return
+
+    if (myself := topology["nodes"].get(data["myself"])) is not None:
+        role = "master" if "master" in myself["flags"] else "replica"
+        yield Result(
+            state=State.OK,
+            summary=f"Role: {role}",
+            details=f"Role: {role}, slots: {myself['slots']}, node ID: {data['myself']}",
+        )
+
+    yield from _check_nodes(params, topology)
+
+
+check_plugin_valkey_cluster = CheckPlugin(
+    name="valkey_cluster",
+    service_name="Valkey %s Cluster",
+    sections=["valkey_cluster"],
+    discovery_function=discover_valkey_cluster,
+    check_function=check_valkey_cluster,
+    check_ruleset_name="valkey_cluster",
+    check_default_parameters={
+        "slots_ok_lower": ("fixed", (100.0, 100.0)),
+        "nodes_failed_upper": ("fixed", (1, 2)),
+    },
+)
+
+
+def discover_valkey_cluster_balance(section: Section) -> DiscoveryResult:
+    # the balance is the same for all nodes, it is only discovered for the node with the
+    # smallest ID, so the service stays on one instance of one host
+    yield from (
+        Service(item=item)
+        for item, data in section.items()
+        if data.get("topology") and data.get("myself") == data.get("cluster_id")
+    )
+
+
+def check_valkey_cluster_balance(
+    item: str, params: Mapping[str, Any], section: Section
+) -> CheckResult:
+    if (data := section.get(item)) is None or (topology := data.get("topology")) is None:
+        return
+
+    if (slots_deviation := topology["slots_deviation"]) is not None:
+        yield from check_levels(
+            slots_deviation,
+            metric_name="valkey_cluster_slots_deviation",
+            levels_upper=params.get("slots_deviation_upper"),
+            render_func=render.percent,
+            label="Slot deviation",
+        )
+    if (keys_deviation := topology["keys_deviation"]) is not None:
+        yield from check_levels(
+            keys_deviation,
+            metric_name="valkey_cluster_keys_deviation",
+            levels_upper=params.get("keys_deviation_upper"),
+            render_func=render.percent,
+            label="Key deviation",
+        )
+
+    for address, entry in sorted(topology["balance"].items()):
+        yield Result(
+            state=State.OK,
+            notice=(
+                f"{address}: {entry['keys']} keys, {entry['slots']} slots,"
+                f" {entry['replicas']} replicas"
+            ),
+        )
+
+
+check_plugin_valkey_cluster_balance = CheckPlugin(
+    name="valkey_cluster_balance",
+    service_name="Valkey %s Cluster Balance",
+    sections=["valkey_cluster"],
+    discovery_function=discover_valkey_cluster_balance,
+    check_function=check_valkey_cluster_balance,
+    check_ruleset_name="valkey_cluster_balance",
+    check_default_parameters={
+        "slots_deviation_upper": ("fixed", (10.0, 25.0)),
+        "keys_deviation_upper": ("fixed", (50.0, 100.0)),
+    },
+)
@@ -3,19 +3,30 @@
 # This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
 # conditions defined in the file COPYING, which is part of this source code package.
 
-
+import time
 from collections.abc import Mapping
 from typing import Any
 
-from cmk.agent_based.v2 import CheckPlugin, CheckResult, DiscoveryResult, Result, Service, State
+from cmk.agent_based.v2 import (
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    render,
+    Result,
+    Service,
+    State,
+)
 from cmk.plugins.lib.uptime import check as check_uptime_seconds
 from cmk.plugins.lib.uptime import Section as UptimeSection
 from cmk_addons.plugins.valkey.agent_based.valkey_base import Section
 
 # <<<valkey_info>>>
 # [[[MY_FIRST_VALKEY|127.0.0.1|6380]]]
+# cached:1760000000,300
 # ...
 
+# cached: Time of the query and cache age if the instance is queried asynchronously
+
 #   .--Server--------------------------------------------------------------.
 #   |                   ____                                               |
 #   |                  / ___|  ___ _ ____   _____ _ __                     |
@@ -73,6 +84,28 @@ def discover_valkey_info(section: Section) -> DiscoveryResult:
     yield from (Service(item=item) for item in section)
 
 
+def _check_cached(params: Mapping[str, Any], timestamp: int, interval: int) -> CheckResult:
+    # the cache is refreshed by the agent plug-in once it is older than the interval,
+    # a refresh taking longer than another interval is considered to be stuck
+    age = max(time.time() - timestamp, 0.0)
+    if age <= 2 * interval:
+        yield Result(
+            state=State.OK,
+            notice=(
+                f"Data collected {render.timespan(age)} ago"
+                f" (cache age: {render.timespan(interval)})"
+            ),
+        )
+        return
+    yield Result(
+        state=State(params.get("stale_state", 1)),
+        summary=(
+            f"Data is outdated: collected {render.timespan(age)} ago"
+            f" (cache age: {render.timespan(interval)})"
+        ),
+    )
+
+
 def check_valkey_info(item: str, params: Mapping[str, Any], section: Section) -> CheckResult:
     if not (item_data := section.get(item)):
         return
@@ -80,6 +113,9 @@ def check_valkey_info(item: str, params: Mapping[str, Any], section: Section) ->
     if (error := item_data.get("error")) is not None:
         yield Result(state=State.CRIT, summary=f"Error: {error}")
 
+    if (cached := item_data.get("cached")) is not None:
+        yield from _check_cached(params, *cached)
+
     server_data = item_data.get("Server")
     if server_data is None:
         return
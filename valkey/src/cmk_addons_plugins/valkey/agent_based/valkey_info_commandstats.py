@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+
+import re
+from collections.abc import Mapping
+from typing import Any
+
+from cmk.agent_based.v2 import (
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    get_value_store,
+    Metric,
+    Result,
+    Service,
+    State,
+)
+from cmk_addons.plugins.valkey.agent_based.valkey_base import query_time, Section
+
+# .
+#   .--Commandstats--------------------------------------------------------.
+#   |   ____                                          _     _        _     |
+#   |  / ___|___  _ __ ___  _ __ ___   __ _ _ __   __| |___| |_ __ _| |_   |
+#   | | |   / _ \| '_ ` _ \| '_ ` _ \ / _` | '_ \ / _` / __| __/ _` | __|  |
+#   | | |__| (_) | | | | | | | | | | | (_| | | | | (_| \__ \ || (_| | |_   |
+#   |  \____\___/|_| |_| |_|_| |_| |_|\__,_|_| |_|\__,_|___/\__\__,_|\__|  |
+#   |                                                                      |
+#   +----------------------------------------------------------------------+
+#   |                                                                      |
+#   '----------------------------------------------------------------------'
+
+# ...
+# Commandstats
+# cmdstat_get:calls=1503,usec=2905,usec_per_call=1.93,rejected_calls=0,failed_calls=0
+# cmdstat_set:calls=512,usec=1812,usec_per_call=3.54,rejected_calls=0,failed_calls=0
+# cmdstat_config|get:calls=4,usec=40,usec_per_call=10.00,rejected_calls=0,failed_calls=0
+
+# Description of possible output:
+# calls - Number of calls of the command
+# usec - Total CPU time consumed by the command in microseconds
+# usec_per_call - Average CPU time per call since the start of the server
+# rejected_calls - Number of calls rejected before execution
+# failed_calls - Number of calls failed during execution
+
+_METRIC_NAME_INVALID = re.compile("[^a-z0-9_]")
+
+
+def _render_usec(value: float) -> str:
+    return "%.2f µs" % value
+
+
+def _render_calls_rate(value: float) -> str:
+    return "%.2f/s" % value
+
+
+def discover_valkey_info_commandstats(section: Section) -> DiscoveryResult:
+    yield from (Service(item=item) for item, data in section.items() if "Commandstats" in data)
+
+
+def check_valkey_info_commandstats(
+    item: str,
+    params: Mapping[str, Any],
+    section: Section,
+) -> CheckResult:
+    item_data = section.get(item, {})
+    commandstats_data = item_data.get("Commandstats")
+    if not commandstats_data:
+        return
+
+    commands = {
+        key[len("cmdstat_") :]: (int(value.get("calls", 0)), int(value.get("usec", 0)))
+        for key, value in commandstats_data.items()
+        if key.startswith("cmdstat_") and isinstance(value, Mapping)
+    }
+
+    # only the counters of the last two queries are kept, so commands which are
+    # not reported anymore do not pile up in the value store
+    value_store = get_value_store()
+    now = query_time(item_data)
+    if (last_query := value_store.get("commands")) is not None and last_query[0] == now:
+        # the same cached query again, compared with the query before like the last time
+        last_time, last_commands = value_store.get("previous_commands", (None, {}))
+    else:
+        last_time, last_commands = last_query or (None, {})
+        value_store["previous_commands"] = (last_time, last_commands)
+        value_store["commands"] = (now, commands)
+
+    if last_time is None or now <= last_time:
+        yield Result(state=State.OK, summary="Initializing counters")
+        return
+
+    rates: dict[str, tuple[float, float | None]] = {}
+    for command, (calls, usec) in commands.items():
+        last_calls, last_usec = last_commands.get(command, (0, 0))
+        if calls < last_calls:
+            # counters were reset by a restart or CONFIG RESETSTAT
+            last_calls, last_usec = 0, 0
+        delta_calls = calls - last_calls
+        rates[command] = (
+            delta_calls / (now - last_time),
+            (usec - last_usec) / delta_calls if delta_calls else None,
+        )
+
+    yield from check_levels(
+        sum(rate for rate, _latency in rates.values()),
+        metric_name="valkey_commands_rate",
+        levels_upper=params.get("calls_upper"),
+        render_func=_render_calls_rate,
+        label="Commands",
+    )
+
+    top_commands = sorted(rates.items(), key=lambda entry: entry[1][0], reverse=True)
+    for command, (rate, latency) in top_commands[: params["top_n"]]:
+        if not rate:
+            break
+        metric_command = _METRIC_NAME_INVALID.sub("_", command.lower())
+        yield Result(
+            state=State.OK,
+            notice="%s: %s, %s per call"
+            % (command, _render_calls_rate(rate), _render_usec(latency or 0.0)),
+        )
+        yield Metric(f"valkey_cmd_{metric_command}_rate", rate)
+        if latency is not None:
+            yield Metric(f"valkey_cmd_{metric_command}_usec_per_call", latency)
+
+    for command_levels in params.get("command_levels", []):
+        command = command_levels["command"]
+        if command not in commands:
+            continue
+        latency = rates.get(command, (0.0, None))[1]
+        if latency is None:
+            # no calls since the last check cycle, fall back to the lifetime average
+            latency = float(commandstats_data[f"cmdstat_{command}"].get("usec_per_call", 0.0))
+        yield from check_levels(
+            latency,
+            levels_upper=command_levels["usec_per_call"],
+            render_func=_render_usec,
+            label=f"Average time per call of {command}",
+        )
+
+
+check_plugin_valkey_info_commandstats = CheckPlugin(
+    name="valkey_info_commandstats",
+    service_name="Valkey %s Commands",
+    sections=["valkey_info"],
+    discovery_function=discover_valkey_info_commandstats,
+    check_function=check_valkey_info_commandstats,
+    check_ruleset_name="valkey_info_commandstats",
+    check_default_parameters={"top_n": 5},
+)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+
+from collections.abc import Mapping
+from typing import Any
+
+from cmk.agent_based.v2 import (
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    get_value_store,
+    GetRateError,
+    render,
+    Result,
+    Service,
+    State,
+)
+from cmk_addons.plugins.valkey.agent_based.valkey_base import get_query_rate, query_time, Section
+
+# .
+#   .--CPU-----------------------------------------------------------------.
+#   |                           ____ ____  _   _                           |
+#   |                          / ___|  _ \| | | |                          |
+#   |                         | |   | |_) | | | |                          |
+#   |                         | |___|  __/| |_| |                          |
+#   |                          \____|_|    \___/                           |
+#   |                                                                      |
+#   +----------------------------------------------------------------------+
+#   |                                                                      |
+#   '----------------------------------------------------------------------'
+
+# ...
+# CPU
+# used_cpu_sys:12.034519
+# used_cpu_user:30.118327
+# used_cpu_sys_children:0.004312
+# used_cpu_user_children:0.010021
+# used_cpu_sys_main_thread:11.872011
+# used_cpu_user_main_thread:29.764218
+
+# Description of possible output:
+# used_cpu_sys - System CPU consumed by the Valkey server, which is the sum of system CPU
+#                consumed by all threads of the server process
+# used_cpu_user - User CPU consumed by the Valkey server
+# used_cpu_sys_children - System CPU consumed by the background processes
+# used_cpu_user_children - User CPU consumed by the background processes
+# used_cpu_sys_main_thread - System CPU consumed by the Valkey server main thread
+# used_cpu_user_main_thread - User CPU consumed by the Valkey server main thread
+
+
+def discover_valkey_info_cpu(section: Section) -> DiscoveryResult:
+    yield from (Service(item=item) for item, data in section.items() if "CPU" in data)
+
+
+def _cpu_utilization(
+    value_store: Any, now: float, cpu_data: Mapping[str, Any], suffix: str
+) -> float | None:
+    sys_value = cpu_data.get(f"used_cpu_sys{suffix}")
+    user_value = cpu_data.get(f"used_cpu_user{suffix}")
+    if sys_value is None or user_value is None:
+        return None
+
+    try:
+        # CPU seconds per second, the counters are reset when the server restarts
+        return 100.0 * get_query_rate(
+            value_store,
+            f"cpu{suffix}",
+            now,
+            float(sys_value) + float(user_value),
+            raise_overflow=True,
+        )
+    except GetRateError:
+        return None
+
+
+def check_valkey_info_cpu(
+    item: str,
+    params: Mapping[str, Any],
+    section: Section,
+) -> CheckResult:
+    item_data = section.get(item, {})
+    cpu_data = item_data.get("CPU")
+    if not cpu_data:
+        return
+
+    value_store = get_value_store()
+    now = query_time(item_data)
+    counters_initialized = False
+
+    for suffix, metric_name, param_key, infotext in [
+        ("", "valkey_cpu_util", "util_upper", "CPU utilization"),
+        (
+            "_main_thread",
+            "valkey_cpu_main_thread_util",
+            "main_thread_util_upper",
+            "Main thread CPU utilization",
+        ),
+        ("_children", "valkey_cpu_children_util", "children_util_upper", "Background processes"),
+    ]:
+        utilization = _cpu_utilization(value_store, now, cpu_data, suffix)
+        if utilization is None:
+            continue
+
+        counters_initialized = True
+        yield from check_levels(
+            utilization,
+            metric_name=metric_name,
+            levels_upper=params.get(param_key),
+            render_func=render.percent,
+            label=infotext,
+            boundaries=(0.0, None),
+        )
+
+    if not counters_initialized:
+        yield Result(state=State.OK, summary="Initializing counters")
+
+
+check_plugin_valkey_info_cpu = CheckPlugin(
+    name="valkey_info_cpu",
+    service_name="Valkey %s CPU",
+    sections=["valkey_info"],
+    discovery_function=discover_valkey_info_cpu,
+    check_function=check_valkey_info_cpu,
+    check_ruleset_name="valkey_info_cpu",
+    check_default_parameters={},
+)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+
+from collections.abc import Mapping
+from typing import Any
+
+from cmk.agent_based.v2 import (
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    get_value_store,
+    GetRateError,
+    render,
+    Result,
+    Service,
+    State,
+)
+from cmk_addons.plugins.valkey.agent_based.valkey_base import get_query_rate, query_time, Section
+
+# .
+#   .--Keyspace------------------------------------------------------------.
+#   |            _  __                                                     |
+#   |           | |/ /___ _   _ ___ _ __   __ _  ___ ___                   |
+#   |           | ' // _ \ | | / __| '_ \ / _` |/ __/ _ \                  |
+#   |           | . \  __/ |_| \__ \ |_) | (_| | (_|  __/                  |
+#   |           |_|\_\___|\__, |___/ .__/ \__,_|\___\___|                  |
+#   |                     |___/    |_|                                     |
+#   +----------------------------------------------------------------------+
+#   |                                                                      |
+#   '----------------------------------------------------------------------'
+
+# ...
+# Keyspace
+# db0:keys=1043,expires=12,avg_ttl=86137
+# db3:keys=7,expires=0,avg_ttl=0
+
+# Description of possible output:
+# keys - Number of keys in the database
+# expires - Number of keys with an expiration
+# avg_ttl - Estimated average time to live of the keys with an expiration in milliseconds
+
+# A database without any keys is not listed by the server at all.
+
+
+def discover_valkey_info_keyspace(section: Section) -> DiscoveryResult:
+    for item, data in section.items():
+        for db in data.get("Keyspace", {}):
+            yield Service(item=f"{item} {db}")
+
+
+def check_valkey_info_keyspace(
+    item: str,
+    params: Mapping[str, Any],
+    section: Section,
+) -> CheckResult:
+    instance, _, db = item.rpartition(" ")
+    instance_data = section.get(instance, {})
+    keyspace_data = instance_data.get("Keyspace")
+    if keyspace_data is None:
+        return
+
+    db_data = keyspace_data.get(db)
+    if not isinstance(db_data, Mapping):
+        # the server omits empty databases
+        db_data = {"keys": 0, "expires": 0, "avg_ttl": 0}
+
+    keys = int(db_data.get("keys", 0))
+    expires = int(db_data.get("expires", 0))
+
+    yield from check_levels(
+        keys,
+        metric_name="valkey_keys",
+        levels_upper=params.get("keys_upper"),
+        render_func=lambda x: str(int(x)),
+        label="Keys",
+    )
+
+    yield from check_levels(
+        expires,
+        metric_name="valkey_expires",
+        render_func=lambda x: str(int(x)),
+        label="Keys with expiration",
+    )
+
+    if keys:
+        yield from check_levels(
+            100.0 * expires / keys,
+            metric_name="valkey_expires_ratio",
+            levels_lower=params.get("expires_ratio_lower"),
+            render_func=render.percent,
+            label="Expiring keys",
+        )
+
+    if (avg_ttl := db_data.get("avg_ttl")) is not None and expires:
+        yield from check_levels(
+            int(avg_ttl) / 1000.0,
+            metric_name="valkey_avg_ttl",
+            render_func=render.timespan,
+            label="Average TTL",
+        )
+
+    try:
+        keys_rate = get_query_rate(get_value_store(), "keys", query_time(instance_data), keys)
+    except GetRateError:
+        yield Result(state=State.OK, notice="Key growth: initializing counter")
+        return
+
+    yield from check_levels(
+        keys_rate * 3600,
+        metric_name="valkey_keys_growth",
+        levels_upper=params.get("growth_upper"),
+        render_func=lambda x: "%+.1f/h" % x,
+        label="Key growth",
+    )
+
+
+check_plugin_valkey_info_keyspace = CheckPlugin(
+    name="valkey_info_keyspace",
+    service_name="Valkey %s Keyspace",
+    sections=["valkey_info"],
+    discovery_function=discover_valkey_info_keyspace,
+    check_function=check_valkey_info_keyspace,
+    check_ruleset_name="valkey_info_keyspace",
+    check_default_parameters={},
+)
@@ -4,16 +4,16 @@
 # conditions defined in the file COPYING, which is part of this source code package.
 
 
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping
 from typing import Any
 
-from cmk.agent_based.v1 import (
-    check_levels as check_levels_v1,  # we can only use v2 after migrating the ruleset!
-)
 from cmk.agent_based.v2 import (
+    check_levels,
     CheckPlugin,
     CheckResult,
     DiscoveryResult,
+    get_value_store,
+    Metric,
     render,
     Result,
     Service,
@@ -51,6 +51,11 @@ from cmk_addons.plugins.valkey.agent_based.valkey_base import Section
 # aof_last_bgrewrite_status:ok
 # aof_last_write_status:ok
 # aof_last_cow_size:0
+# rdb_saves:12
+# aof_rewrites:0
+# ...
+# Stats
+# latest_fork_usec:1200
 
 # Description of possible output:
 # loading - Flag indicating if the load of a dump file is on-going
@@ -69,12 +74,112 @@ from cmk_addons.plugins.valkey.agent_based.valkey_base import Section
 # aof_last_bgrewrite_status - Status of last AOF rewrite operation
 # aof_last_write_status - Status of the last write operation to the AOF
 # aof_last_cow_size - The size in bytes of copy-on-write allocations during the last AOF rewrite operation
+# rdb_saves - Number of RDB snapshots performed since startup
+# aof_rewrites - Number of AOF rewrites performed since startup
+# latest_fork_usec - Duration of the latest fork operation in microseconds (Stats section)
+
+# The duration of every RDB save and AOF rewrite is kept in the value store. The growth of
+# the duration of the latest operation compared to the average of the previous ones shows
+# a growing dataset before the fork stalls get critical.
+
+_DURATION_HISTORY = 10
+
+
+def _duration_growth(
+    value_store: MutableMapping[str, Any],
+    kind: str,
+    marker: object,
+    duration: float,
+) -> float | None:
+    """Growth of the latest duration in percent of the average of the previous ones
+
+    A new duration is only recorded if the marker (number of saves) changed.
+
+    >>> store = {}
+    >>> [_duration_growth(store, "rdb", count, duration) for count, duration in
+    ...     [(1, 10), (1, 10), (2, 10), (3, 12)]]
+    [None, None, None, 20.0]
+    """
+    history = value_store.get(f"{kind}_durations", [])
+    if marker != value_store.get(f"{kind}_marker"):
+        history = (history + [duration])[-_DURATION_HISTORY:]
+        value_store[f"{kind}_durations"] = history
+        value_store[f"{kind}_marker"] = marker
+
+    if len(history) < 3:
+        return None
+    average = sum(history[:-1]) / (len(history) - 1)
+    # durations are only reported in seconds, short saves do not give a useful trend
+    if average < 1:
+        return None
+    return 100.0 * (history[-1] - average) / average
 
 
 def discover_valkey_info_persistence(section: Any) -> DiscoveryResult:
     yield from (Service(item=item) for item, data in section.items() if "Persistence" in data)
 
 
+def _check_fork_children(
+    params: Mapping[str, Any],
+    value_store: MutableMapping[str, Any],
+    persistence_data: Mapping[str, Any],
+) -> CheckResult:
+    for kind, operation, last_duration_key, current_duration_key, marker_keys in [
+        (
+            "rdb",
+            "RDB save",
+            "rdb_last_bgsave_time_sec",
+            "rdb_current_bgsave_time_sec",
+            # older servers only report the time of the last successful save
+            ("rdb_saves", "rdb_last_save_time"),
+        ),
+        (
+            "aof",
+            "AOF rewrite",
+            "aof_last_rewrite_time_sec",
+            "aof_current_rewrite_time_sec",
+            ("aof_rewrites",),
+        ),
+    ]:
+        if (cow_size := persistence_data.get(f"{kind}_last_cow_size")) is not None:
+            yield from check_levels(
+                cow_size,
+                metric_name=f"valkey_{kind}_cow_size",
+                levels_upper=params.get("cow_size_upper"),
+                render_func=render.bytes,
+                label=f"Copy-on-write of last {operation}",
+                notice_only=not cow_size,
+            )
+
+        current_duration = persistence_data.get(current_duration_key, -1)
+        if current_duration != -1:
+            yield from check_levels(
+                current_duration,
+                metric_name=f"valkey_{kind}_current_duration",
+                levels_upper=params.get(f"{kind}_current_duration_upper"),
+                render_func=render.timespan,
+                label=f"{operation} running for",
+            )
+        else:
+            yield Metric(f"valkey_{kind}_current_duration", 0)
+
+        last_duration = persistence_data.get(last_duration_key, -1)
+        marker = next((persistence_data[key] for key in marker_keys if key in persistence_data), None)
+        if last_duration == -1 or marker is None:
+            continue
+        yield Metric(f"valkey_{kind}_duration", last_duration)
+        growth = _duration_growth(value_store, kind, marker, last_duration)
+        if growth is not None:
+            yield from check_levels(
+                growth,
+                metric_name=f"valkey_{kind}_duration_growth",
+                levels_upper=params.get("duration_growth_upper"),
+                render_func=lambda x: "%+.1f%%" % x,
+                label=f"Duration of last {operation} compared to average",
+                notice_only=True,
+            )
+
+
 def check_valkey_info_persistence(
     item: str,
     params: Mapping[str, Any],
@@ -110,7 +215,7 @@ def check_valkey_info_persistence(
 
     rdb_changes = persistence_data.get("rdb_changes_since_last_save")
     if rdb_changes is not None:
-        yield from check_levels_v1(
+        yield from check_levels(
             int(rdb_changes),
             metric_name="changes_sld",
             levels_upper=params.get("rdb_changes_count"),
@@ -118,6 +223,18 @@ def check_valkey_info_persistence(
             label="Number of changes since last dump",
         )
 
+    stats_data = section.get(item, {}).get("Stats", {})
+    if (fork_usec := stats_data.get("latest_fork_usec")) is not None:
+        yield from check_levels(
+            fork_usec / 1000000.0,
+            metric_name="valkey_fork_latency",
+            levels_upper=params.get("fork_latency_upper"),
+            render_func=render.timespan,
+            label="Latest fork",
+        )
+
+    yield from _check_fork_children(params, get_value_store(), persistence_data)
+
 
 check_plugin_valkey_info_persistence = CheckPlugin(
     name="valkey_info_persistence",
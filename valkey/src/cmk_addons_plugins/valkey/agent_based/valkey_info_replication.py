@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+
+from collections.abc import Mapping
+from typing import Any
+
+from cmk.agent_based.v2 import (
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    get_value_store,
+    GetRateError,
+    render,
+    Result,
+    Service,
+    State,
+)
+from cmk_addons.plugins.valkey.agent_based.valkey_base import get_query_rate, query_time, Section
+
+# .
+#   .--Replication---------------------------------------------------------.
+#   |        ____            _ _           _   _                           |
+#   |       |  _ \ ___ _ __ | (_) ___ __ _| |_(_) ___  _ __                |
+#   |       | |_) / _ \ '_ \| | |/ __/ _` | __| |/ _ \| '_ \               |
+#   |       |  _ <  __/ |_) | | | (_| (_| | |_| | (_) | | | |              |
+#   |       |_| \_\___| .__/|_|_|\___\__,_|\__|_|\___/|_| |_|              |
+#   |                 |_|                                                  |
+#   +----------------------------------------------------------------------+
+#   |                                                                      |
+#   '----------------------------------------------------------------------'
+
+# ...
+# Replication
+# role:master
+# connected_slaves:1
+# slave0:ip=10.0.0.2,port=6379,state=online,offset=5723,lag=0
+# master_failover_state:no-failover
+# master_replid:5fd3c9fbc1c2d2a4c3ed0d3ea1f0a6e4b09fd0d5
+# master_replid2:0000000000000000000000000000000000000000
+# master_repl_offset:5723
+# second_repl_offset:-1
+# repl_backlog_active:1
+# repl_backlog_size:1048576
+# repl_backlog_first_byte_offset:1
+# repl_backlog_histlen:5723
+
+# Description of possible output:
+# role - Value is "master" if the instance is replica of no one, or "slave" if the
+#        instance is a replica of some master instance
+# connected_slaves - Number of connected replicas
+# slaveN - ip, port, state, replication offset and seconds since the last
+#          acknowledgement of the N-th connected replica
+# master_repl_offset - The server's current replication offset
+# repl_backlog_size - Total size in bytes of the replication backlog buffer
+#
+# Additional fields if the instance is a replica:
+# master_host - Host or IP address of the master
+# master_port - Master listening TCP port
+# master_link_status - Status of the link (up/down)
+# master_last_io_seconds_ago - Number of seconds since the last interaction with master
+# master_sync_in_progress - Indicate the master is syncing to the replica
+# slave_repl_offset - The replication offset of the replica instance
+# master_link_down_since_seconds - Number of seconds since the link is down
+
+
+def discover_valkey_info_replication(section: Section) -> DiscoveryResult:
+    yield from (Service(item=item) for item, data in section.items() if "Replication" in data)
+
+
+def _replicas(replication_data: Mapping[str, Any]) -> list[Mapping[str, Any]]:
+    return [
+        replica
+        for index in range(int(replication_data.get("connected_slaves", 0)))
+        if isinstance(replica := replication_data.get(f"slave{index}"), Mapping)
+    ]
+
+
+def _check_master(params: Mapping[str, Any], replication_data: Mapping[str, Any]) -> CheckResult:
+    replicas = _replicas(replication_data)
+    yield from check_levels(
+        len(replicas),
+        metric_name="valkey_connected_replicas",
+        levels_lower=params.get("replicas_lower"),
+        render_func=lambda x: str(int(x)),
+        label="Connected replicas",
+    )
+    if not replicas:
+        return
+
+    master_offset = int(replication_data.get("master_repl_offset", 0))
+    backlog_size = int(replication_data.get("repl_backlog_size", 0))
+
+    offline = [
+        f"{replica.get('ip')}:{replica.get('port')}"
+        for replica in replicas
+        if replica.get("state") != "online"
+    ]
+    if offline:
+        yield Result(
+            state=State(params["replica_offline_state"]),
+            summary="Replicas not online: %s" % ", ".join(offline),
+        )
+
+    lag_bytes = {}
+    for replica in replicas:
+        address = f"{replica.get('ip')}:{replica.get('port')}"
+        if replica.get("state") != "online":
+            # the offset of a replica which is still synchronizing is meaningless
+            continue
+        lag_bytes[address] = max(0, master_offset - int(replica.get("offset", 0)))
+        yield Result(
+            state=State.OK,
+            notice="Replica %s: offset lag %s, last acknowledgement %s ago"
+            % (
+                address,
+                render.bytes(lag_bytes[address]),
+                render.timespan(int(replica.get("lag", 0))),
+            ),
+        )
+
+    if not lag_bytes:
+        return
+
+    max_lag_bytes = max(lag_bytes.values())
+    yield from check_levels(
+        max_lag_bytes,
+        metric_name="valkey_repl_lag_bytes",
+        levels_upper=params.get("lag_bytes_upper"),
+        render_func=render.bytes,
+        label="Maximum replica offset lag",
+    )
+
+    if backlog_size:
+        yield from check_levels(
+            100.0 * max_lag_bytes / backlog_size,
+            metric_name="valkey_repl_backlog_usage",
+            levels_upper=params.get("backlog_usage_upper"),
+            render_func=render.percent,
+            label="Offset lag in percent of backlog",
+        )
+
+    yield from check_levels(
+        max(int(r.get("lag", 0)) for r in replicas if r.get("state") == "online"),
+        metric_name="valkey_repl_lag_seconds",
+        levels_upper=params.get("lag_seconds_upper"),
+        render_func=render.timespan,
+        label="Maximum replica lag",
+    )
+
+
+def _check_replica(params: Mapping[str, Any], replication_data: Mapping[str, Any]) -> CheckResult:
+    yield Result(
+        state=State.OK,
+        summary="Master: %s:%s"
+        % (replication_data.get("master_host"), replication_data.get("master_port")),
+    )
+
+    if replication_data.get("master_link_status") == "up":
+        yield Result(state=State.OK, summary="Link: up")
+        if (last_io := replication_data.get("master_last_io_seconds_ago")) is not None:
+            yield from check_levels(
+                max(0, int(last_io)),
+                metric_name="valkey_master_last_io",
+                levels_upper=params.get("last_io_upper"),
+                render_func=render.timespan,
+                label="Last interaction with master",
+            )
+    else:
+        yield Result(state=State(params["master_link_down_state"]), summary="Link: down")
+        if (down_since := replication_data.get("master_link_down_since_seconds")) is not None:
+            yield from check_levels(
+                max(0, int(down_since)),
+                metric_name="valkey_master_link_down",
+                levels_upper=params.get("link_down_upper"),
+                render_func=render.timespan,
+                label="Link down for",
+            )
+
+    if replication_data.get("master_sync_in_progress") == 1:
+        yield Result(state=State.OK, summary="Synchronization with master in progress")
+
+
+def check_valkey_info_replication(
+    item: str,
+    params: Mapping[str, Any],
+    section: Section,
+) -> CheckResult:
+    item_data = section.get(item, {})
+    replication_data = item_data.get("Replication")
+    if not replication_data:
+        return
+
+    role = replication_data.get("role")
+    yield Result(state=State.OK, summary="Role: %s" % ("replica" if role == "slave" else role))
+
+    if role == "slave":
+        yield from _check_replica(params, replication_data)
+        offset = replication_data.get("slave_repl_offset")
+    else:
+        yield from _check_master(params, replication_data)
+        offset = replication_data.get("master_repl_offset")
+
+    if offset is None:
+        return
+
+    try:
+        throughput = get_query_rate(
+            get_value_store(),
+            "repl_offset",
+            query_time(item_data),
+            int(offset),
+            raise_overflow=True,
+        )
+    except GetRateError:
+        # first check cycle, or the offset was reset by a restart or a full resync
+        return
+
+    yield from check_levels(
+        throughput,
+        metric_name="valkey_repl_throughput",
+        render_func=render.iobandwidth,
+        label="Replication throughput",
+    )
+
+
+check_plugin_valkey_info_replication = CheckPlugin(
+    name="valkey_info_replication",
+    service_name="Valkey %s Replication",
+    sections=["valkey_info"],
+    discovery_function=discover_valkey_info_replication,
+    check_function=check_valkey_info_replication,
+    check_ruleset_name="valkey_info_replication",
+    check_default_parameters={
+        "replica_offline_state": 1,
+        "master_link_down_state": 2,
+    },
+)
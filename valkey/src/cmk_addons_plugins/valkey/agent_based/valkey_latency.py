@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="type-arg"
+
+import json
+import time
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from cmk.agent_based.v2 import (
+    AgentSection,
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    get_value_store,
+    render,
+    Result,
+    Service,
+    State,
+    StringTable,
+)
+
+# <<<valkey_latency:sep(0)>>>
+# [[[MY_FIRST_VALKEY|127.0.0.1|6380]]]
+# latest [["command",1700000000,250,300]]
+# histogram {"get":{"calls":100,"histogram_usec":{"1":50,"2":90,"4":99,"8":100}}}
+# slowlog_len 3
+# slowlog 12 1700000100 15000 KEYS
+# slowlog 11 1700000090 12000 HGETALL
+# cached 1700000100
+
+# latest - Output of LATENCY LATEST: event name, timestamp of the latest spike, latest and
+#          maximum latency in milliseconds. Only filled if the latency monitor is enabled.
+# histogram - Output of LATENCY HISTOGRAM: calls and cumulative latency buckets per command,
+#             the bucket key is the upper bound in microseconds. Depending on the protocol
+#             version maps are returned as JSON objects or as flat lists of keys and values.
+# slowlog_len - Current number of entries in the slowlog
+# slowlog - Entries added since the last run of the agent plug-in: ID, timestamp,
+#           execution time in microseconds and command
+# cached - Time of the query if the instance is queried asynchronously, the same
+#          output is sent until the cache is refreshed
+
+Histogram = Sequence[tuple[int, int]]
+Section = Mapping[str, Mapping[str, Any]]
+
+
+def _as_mapping(value: Any) -> Mapping:
+    """
+    >>> _as_mapping(["calls", 3, "histogram_usec", [1, 2, 4, 3]])
+    {'calls': 3, 'histogram_usec': [1, 2, 4, 3]}
+    """
+    if isinstance(value, Mapping):
+        return value
+    return dict(zip(value[::2], value[1::2]))
+
+
+def _parse_histograms(raw: Any) -> Mapping[str, Histogram]:
+    histograms = {}
+    for command, data in _as_mapping(raw).items():
+        buckets = _as_mapping(_as_mapping(data).get("histogram_usec", {}))
+        histograms[command] = sorted((int(bound), int(count)) for bound, count in buckets.items())
+    return histograms
+
+
+def parse_valkey_latency(string_table: StringTable) -> Section:
+    parsed: dict = {}
+    instance: dict = {}
+    for (line,) in string_table:
+        if line.startswith("[[[") and line.endswith("]]]"):
+            name = line[3:-3].split("|")[0]
+            instance = parsed.setdefault(
+                name.replace(";", ":"), {"latest": [], "histograms": {}, "slowlog": []}
+            )
+            continue
+
+        if not instance:
+            continue
+
+        key, _, value = line.partition(" ")
+        try:
+            if key == "latest":
+                instance["latest"] = [
+                    (event, int(timestamp), int(latest), int(maximum))
+                    for event, timestamp, latest, maximum, *_rest in json.loads(value)
+                ]
+            elif key == "histogram":
+                instance["histograms"] = _parse_histograms(json.loads(value))
+            elif key == "cached":
+                instance["cached"] = int(value)
+            elif key == "slowlog_len":
+                instance["slowlog_len"] = int(value)
+            elif key == "slowlog":
+                entry_id, timestamp, duration, command = (value.split(" ", 3) + [""])[:4]
+                instance["slowlog"].append((int(entry_id), int(timestamp), int(duration), command))
+        except (ValueError, TypeError, AttributeError):
+            # e.g. an error message of the server instead of the expected reply
+            continue
+
+    return parsed
+
+
+agent_section_valkey_latency = AgentSection(
+    name="valkey_latency",
+    parse_function=parse_valkey_latency,
+)
+
+
+def _render_usec(value: float) -> str:
+    return "%d µs" % value
+
+
+def _cumulative_at(histogram: Histogram, bound: int) -> int:
+    count = 0
+    for bucket_bound, bucket_count in histogram:
+        if bucket_bound > bound:
+            break
+        count = bucket_count
+    return count
+
+
+def _percentile(current: Histogram, previous: Histogram, percentile: float) -> int | None:
+    """Upper bound of the bucket containing the percentile of the calls since the previous sample
+
+    Empty buckets are omitted by the server, so the counts of the previous sample are looked up
+    by bound.
+
+    >>> _percentile([(1, 50), (2, 90), (4, 99), (8, 100)], [], 0.5)
+    1
+    >>> _percentile([(1, 50), (2, 90), (4, 99), (8, 100)], [], 0.99)
+    4
+    >>> _percentile([(1, 50), (2, 90), (16, 120)], [(1, 50), (2, 90), (8, 100)], 0.5)
+    16
+    """
+    deltas = [(bound, count - _cumulative_at(previous, bound)) for bound, count in current]
+    if not deltas or (calls := deltas[-1][1]) <= 0:
+        return None
+    for bound, count in deltas:
+        if count >= percentile * calls:
+            return bound
+    return deltas[-1][0]
+
+
+def discover_valkey_latency(section: Section) -> DiscoveryResult:
+    yield from (Service(item=item) for item in section)
+
+
+def _check_histograms(
+    params: Mapping[str, Any],
+    histograms: Mapping[str, Histogram],
+    last_histograms: Mapping[str, Histogram],
+) -> CheckResult:
+    percentiles = {}
+    for command, histogram in histograms.items():
+        previous = last_histograms.get(command, [])
+        if previous and previous[-1][1] > histogram[-1][1]:
+            # counters were reset by a restart or CONFIG RESETSTAT
+            previous = []
+        p50 = _percentile(histogram, previous, 0.5)
+        p99 = _percentile(histogram, previous, 0.99)
+        if p50 is not None and p99 is not None:
+            percentiles[command] = (p50, p99)
+
+    if not percentiles:
+        yield Result(state=State.OK, summary="No commands executed")
+        return
+
+    for command, (p50, p99) in sorted(percentiles.items()):
+        yield from check_levels(
+            p50,
+            levels_upper=params.get("p50_upper"),
+            render_func=_render_usec,
+            label=f"{command} p50",
+            notice_only=True,
+        )
+        yield from check_levels(
+            p99,
+            levels_upper=params.get("p99_upper"),
+            render_func=_render_usec,
+            label=f"{command} p99",
+            notice_only=True,
+        )
+
+    worst_command, (_p50, worst_p99) = max(percentiles.items(), key=lambda entry: entry[1][1])
+    yield from check_levels(
+        worst_p99,
+        metric_name="valkey_latency_p99_max",
+        render_func=_render_usec,
+        label=f"Highest p99 ({worst_command})",
+    )
+    yield from check_levels(
+        max(p50 for p50, _p99 in percentiles.values()),
+        metric_name="valkey_latency_p50_max",
+        render_func=_render_usec,
+        label="Highest p50",
+        notice_only=True,
+    )
+
+
+def _check_slowlog(
+    params: Mapping[str, Any],
+    latency_data: Mapping[str, Any],
+    elapsed: float | None,
+) -> CheckResult:
+    if (slowlog_len := latency_data.get("slowlog_len")) is not None:
+        yield from check_levels(
+            slowlog_len,
+            metric_name="valkey_slowlog_len",
+            render_func=lambda x: str(int(x)),
+            label="Slowlog entries",
+            notice_only=True,
+        )
+
+    entries = latency_data["slowlog"]
+    if elapsed is not None:
+        yield from check_levels(
+            60.0 * len(entries) / elapsed,
+            metric_name="valkey_slowlog_rate",
+            levels_upper=params.get("slowlog_rate_upper"),
+            render_func=lambda x: "%.2f/min" % x,
+            label="New slowlog entries",
+        )
+
+    if entries:
+        _entry_id, _timestamp, duration, command = max(entries, key=lambda entry: entry[2])
+        yield from check_levels(
+            duration / 1000000.0,
+            metric_name="valkey_slowlog_duration_max",
+            levels_upper=params.get("slowlog_duration_upper"),
+            render_func=render.timespan,
+            label=f"Slowest new entry ({command})",
+        )
+
+
+def check_valkey_latency(item: str, params: Mapping[str, Any], section: Section) -> CheckResult:
+    if (latency_data := section.get(item)) is None:
+        return
+
+    value_store = get_value_store()
+    now = float(latency_data.get("cached", time.time()))
+    if value_store.get("last_check") == now:
+        # the same cached query again, compared with the query before like the last time,
+        # so the slowlog entries and deltas of the query are not counted twice
+        last_check, last_histograms = value_store.get("previous", (None, {}))
+    else:
+        last_check = value_store.get("last_check")
+        last_histograms = value_store.get("histograms", {})
+        value_store["previous"] = (last_check, last_histograms)
+        value_store["last_check"] = now
+        value_store["histograms"] = latency_data["histograms"]
+
+    if latency_data["histograms"]:
+        yield from _check_histograms(params, latency_data["histograms"], last_histograms)
+
+    for event, timestamp, latest, maximum in latency_data["latest"]:
+        if last_check is not None and timestamp < last_check:
+            # spike was already reported by a previous check cycle
+            continue
+        yield from check_levels(
+            latest / 1000.0,
+            levels_upper=params.get("event_upper"),
+            render_func=render.timespan,
+            label=f"Latency spike of {event} (maximum: {render.timespan(maximum / 1000.0)})",
+        )
+
+    yield from _check_slowlog(
+        params,
+        latency_data,
+        now - last_check if last_check is not None and now > last_check else None,
+    )
+
+
+check_plugin_valkey_latency = CheckPlugin(
+    name="valkey_latency",
+    service_name="Valkey %s Latency",
+    discovery_function=discover_valkey_latency,
+    check_function=check_valkey_latency,
+    check_ruleset_name="valkey_latency",
+    check_default_parameters={},
+)
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="type-arg"
+
+import json
+import time
+from collections.abc import Mapping, MutableMapping
+from typing import Any
+
+from cmk.agent_based.v2 import (
+    AgentSection,
+    check_levels,
+    CheckPlugin,
+    CheckResult,
+    DiscoveryResult,
+    get_value_store,
+    render,
+    Result,
+    Service,
+    State,
+    StringTable,
+)
+
+# <<<valkey_sentinel:sep(0)>>>
+# [[[MY_SENTINEL|127.0.0.1|26379]]]
+# masters [["name","mymaster","ip","10.0.0.5","port","6379","runid","8f1c...","flags","master","num-slaves","2","num-other-sentinels","2","quorum","2"]]
+# replicas mymaster [["name","10.0.0.6:6379","ip","10.0.0.6","port","6379","flags","slave"]]
+
+# masters - Output of SENTINEL MASTERS: the masters monitored by the sentinel with their
+#           address, run ID, flags (e.g. s_down, o_down, disconnected), number of replicas
+#           and other sentinels and the quorum
+# replicas - Output of SENTINEL REPLICAS for every master
+# Depending on the protocol version maps are returned as JSON objects or as flat lists of
+# keys and values.
+
+Section = Mapping[str, Mapping[str, Any]]
+
+_REPLICA_DOWN_FLAGS = {"s_down", "o_down", "disconnected"}
+
+
+def _as_mapping(value: Any) -> Mapping:
+    """
+    >>> _as_mapping(["name", "mymaster", "quorum", "2"])
+    {'name': 'mymaster', 'quorum': '2'}
+    """
+    if isinstance(value, Mapping):
+        return value
+    return dict(zip(value[::2], value[1::2]))
+
+
+def parse_valkey_sentinel(string_table: StringTable) -> Section:
+    parsed: dict = {}
+    instance: dict = {}
+    for (line,) in string_table:
+        if line.startswith("[[[") and line.endswith("]]]"):
+            name = line[3:-3].split("|")[0]
+            instance = parsed.setdefault(name.replace(";", ":"), {"masters": {}, "replicas": {}})
+            continue
+
+        if not instance:
+            continue
+
+        key, _, value = line.partition(" ")
+        try:
+            if key == "masters":
+                for raw_master in json.loads(value):
+                    master = _as_mapping(raw_master)
+                    instance["masters"][master["name"]] = master
+            elif key == "replicas":
+                master_name, _, value = value.partition(" ")
+                instance["replicas"][master_name] = [
+                    _as_mapping(replica) for replica in json.loads(value)
+                ]
+        except (ValueError, TypeError, KeyError):
+            # e.g. an error message of the server instead of the expected reply
+            continue
+
+    return parsed
+
+
+agent_section_valkey_sentinel = AgentSection(
+    name="valkey_sentinel",
+    parse_function=parse_valkey_sentinel,
+)
+
+
+def discover_valkey_sentinel(section: Section) -> DiscoveryResult:
+    for item, data in section.items():
+        for master_name in data["masters"]:
+            yield Service(item=f"{item} {master_name}")
+
+
+def _check_failover(
+    params: Mapping[str, Any],
+    value_store: MutableMapping[str, Any],
+    address: str,
+    run_id: str,
+    now: float,
+) -> CheckResult:
+    # the run ID is unknown as long as the master is not reachable
+    last_master = value_store.get("master")
+    if run_id:
+        value_store["master"] = (address, run_id)
+    if run_id and last_master is not None and last_master != (address, run_id):
+        last_address, _last_run_id = last_master
+        event = (
+            f"failover from {last_address} to {address}"
+            if last_address != address
+            else f"restart of {address} (run ID changed)"
+        )
+        value_store["last_failover"] = (now, event)
+
+    if (last_failover := value_store.get("last_failover")) is None:
+        return
+
+    timestamp, event = last_failover
+    age = max(now - timestamp, 0.0)
+    if age < params["failover_age"]:
+        yield Result(
+            state=State(params["failover_state"]),
+            summary=f"Master changed {render.timespan(age)} ago: {event}",
+        )
+    else:
+        yield Result(
+            state=State.OK,
+            notice=f"Last master change {render.timespan(age)} ago: {event}",
+        )
+
+
+def _check_replicas(params: Mapping[str, Any], replicas: list) -> CheckResult:
+    down = sorted(
+        replica.get("name", "")
+        for replica in replicas
+        if _REPLICA_DOWN_FLAGS & set(str(replica.get("flags", "")).split(","))
+    )
+    yield from check_levels(
+        len(replicas) - len(down),
+        metric_name="valkey_sentinel_replicas",
+        levels_lower=params.get("replicas_lower"),
+        render_func=lambda x: str(int(x)),
+        label="Replicas up",
+    )
+    if down:
+        yield Result(
+            state=State(params["replica_down_state"]),
+            summary=f"Replicas down: {', '.join(down)}",
+        )
+
+
+def check_valkey_sentinel(
+    item: str,
+    params: Mapping[str, Any],
+    section: Section,
+) -> CheckResult:
+    instance, _, master_name = item.rpartition(" ")
+    if (sentinel_data := section.get(instance)) is None:
+        return
+    if (master := sentinel_data["masters"].get(master_name)) is None:
+        yield Result(state=State.CRIT, summary="Master is not monitored by the sentinel")
+        return
+
+    flags = set(str(master.get("flags", "")).split(","))
+    address = f"{master.get('ip')}:{master.get('port')}"
+    if "o_down" in flags:
+        state, status = State(params["odown_state"]), "objectively down"
+    elif "s_down" in flags:
+        state, status = State(params["sdown_state"]), "subjectively down"
+    else:
+        state, status = State.OK, "up"
+    yield Result(state=state, summary=f"Master {address} {status}")
+    if "failover_in_progress" in flags:
+        yield Result(state=State(params["failover_state"]), summary="Failover in progress")
+
+    quorum = int(master.get("quorum", 0))
+    # the sentinels known to this one, known sentinels are not necessarily reachable
+    sentinels = int(master.get("num-other-sentinels", 0)) + 1
+    yield from check_levels(
+        sentinels,
+        metric_name="valkey_sentinel_sentinels",
+        levels_lower=params.get("sentinels_lower"),
+        render_func=lambda x: str(int(x)),
+        label="Sentinels",
+    )
+    yield Result(
+        state=State.CRIT if sentinels < quorum else State.OK,
+        summary=f"Quorum: {quorum}"
+        + (" (not enough sentinels known)" if sentinels < quorum else ""),
+    )
+
+    if (replicas := sentinel_data["replicas"].get(master_name)) is not None:
+        yield from _check_replicas(params, replicas)
+
+    yield from _check_failover(
+        params,
+        get_value_store(),
+        address,
+        str(master.get("runid", "")),
+        time.time(),
+    )
+
+
+check_plugin_valkey_sentinel = CheckPlugin(
+    name="valkey_sentinel",
+    service_name="Valkey %s Sentinel",
+    discovery_function=discover_valkey_sentinel,
+    check_function=check_valkey_sentinel,
+    check_ruleset_name="valkey_sentinel",
+    check_default_parameters={
+        "sdown_state": 1,
+        "odown_state": 2,
+        "replica_down_state": 1,
+        "failover_state": 1,
+        "failover_age": 3600.0,
+    },
+)
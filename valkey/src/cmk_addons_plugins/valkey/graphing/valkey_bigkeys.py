@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.metrics import (
+    Color,
+    DecimalNotation,
+    IECNotation,
+    Metric,
+    StrictPrecision,
+    Unit,
+)
+
+metric_valkey_bigkeys_largest = Metric(
+    name="valkey_bigkeys_largest",
+    title=Title("Memory usage of the biggest key"),
+    unit=Unit(IECNotation("B")),
+    color=Color.PURPLE,
+)
+
+metric_valkey_bigkeys_scanned = Metric(
+    name="valkey_bigkeys_scanned",
+    title=Title("Keys sampled by the last complete scan"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.BLUE,
+)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.graphs import Graph, MinimalRange
+from cmk.graphing.v1.metrics import (
+    Color,
+    DecimalNotation,
+    IECNotation,
+    Metric,
+    StrictPrecision,
+    Unit,
+)
+
+metric_valkey_client_connections = Metric(
+    name="valkey_client_connections",
+    title=Title("Client connections"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.BLUE,
+)
+
+metric_valkey_client_connections_idle = Metric(
+    name="valkey_client_connections_idle",
+    title=Title("Idle client connections"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.GRAY,
+)
+
+metric_valkey_client_connections_pubsub = Metric(
+    name="valkey_client_connections_pubsub",
+    title=Title("Pub/Sub client connections"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.GREEN,
+)
+
+metric_valkey_client_connections_blocked = Metric(
+    name="valkey_client_connections_blocked",
+    title=Title("Blocked client connections"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.ORANGE,
+)
+
+graph_valkey_client_connections = Graph(
+    name="valkey_client_connections",
+    title=Title("Client connections"),
+    simple_lines=[
+        "valkey_client_connections",
+        "valkey_client_connections_idle",
+        "valkey_client_connections_pubsub",
+        "valkey_client_connections_blocked",
+    ],
+    minimal_range=MinimalRange(0, 10),
+)
+
+metric_valkey_client_omem_total = Metric(
+    name="valkey_client_omem_total",
+    title=Title("Memory of all client output buffers"),
+    unit=Unit(IECNotation("B")),
+    color=Color.PURPLE,
+)
+
+metric_valkey_client_omem_max = Metric(
+    name="valkey_client_omem_max",
+    title=Title("Largest client output buffer"),
+    unit=Unit(IECNotation("B")),
+    color=Color.RED,
+)
+
+graph_valkey_client_output_buffers = Graph(
+    name="valkey_client_output_buffers",
+    title=Title("Client output buffers"),
+    simple_lines=["valkey_client_omem_total", "valkey_client_omem_max"],
+)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.graphs import Graph, MinimalRange
+from cmk.graphing.v1.metrics import (
+    AutoPrecision,
+    Color,
+    DecimalNotation,
+    Metric,
+    StrictPrecision,
+    Unit,
+)
+
+metric_valkey_cluster_slots_ok = Metric(
+    name="valkey_cluster_slots_ok",
+    title=Title("Hash slots served"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(2)),
+    color=Color.GREEN,
+)
+
+metric_valkey_cluster_known_nodes = Metric(
+    name="valkey_cluster_known_nodes",
+    title=Title("Known cluster nodes"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.BLUE,
+)
+
+metric_valkey_cluster_nodes_failed = Metric(
+    name="valkey_cluster_nodes_failed",
+    title=Title("Failed cluster nodes"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.RED,
+)
+
+metric_valkey_cluster_slots_deviation = Metric(
+    name="valkey_cluster_slots_deviation",
+    title=Title("Deviation of the hash slots of a master"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(2)),
+    color=Color.PURPLE,
+)
+
+metric_valkey_cluster_keys_deviation = Metric(
+    name="valkey_cluster_keys_deviation",
+    title=Title("Deviation of the keys of a master"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(2)),
+    color=Color.ORANGE,
+)
+
+graph_valkey_cluster_balance = Graph(
+    name="valkey_cluster_balance",
+    title=Title("Cluster balance"),
+    simple_lines=["valkey_cluster_keys_deviation", "valkey_cluster_slots_deviation"],
+    minimal_range=MinimalRange(0, 10),
+)
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.metrics import AutoPrecision, Color, DecimalNotation, Metric, Unit
+
+# The per command metrics valkey_cmd_<command>_rate and valkey_cmd_<command>_usec_per_call
+# are only created for the busiest commands and use the default rendering.
+
+metric_valkey_commands_rate = Metric(
+    name="valkey_commands_rate",
+    title=Title("Commands per second"),
+    unit=Unit(DecimalNotation("/s"), AutoPrecision(2)),
+    color=Color.BLUE,
+)
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.graphs import Graph, MinimalRange
+from cmk.graphing.v1.metrics import AutoPrecision, Color, DecimalNotation, Metric, Unit
+
+metric_valkey_cpu_util = Metric(
+    name="valkey_cpu_util",
+    title=Title("CPU utilization"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(2)),
+    color=Color.BLUE,
+)
+
+metric_valkey_cpu_main_thread_util = Metric(
+    name="valkey_cpu_main_thread_util",
+    title=Title("Main thread CPU utilization"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(2)),
+    color=Color.ORANGE,
+)
+
+metric_valkey_cpu_children_util = Metric(
+    name="valkey_cpu_children_util",
+    title=Title("Background processes CPU utilization"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(2)),
+    color=Color.GREEN,
+)
+
+graph_valkey_cpu_util_combined = Graph(
+    name="valkey_cpu_util_combined",
+    title=Title("CPU utilization"),
+    simple_lines=[
+        "valkey_cpu_util",
+        "valkey_cpu_main_thread_util",
+        "valkey_cpu_children_util",
+    ],
+    minimal_range=MinimalRange(0, 100),
+)
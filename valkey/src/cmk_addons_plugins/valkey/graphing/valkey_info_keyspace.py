@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.graphs import Graph, MinimalRange
+from cmk.graphing.v1.metrics import (
+    AutoPrecision,
+    Color,
+    DecimalNotation,
+    Metric,
+    StrictPrecision,
+    TimeNotation,
+    Unit,
+)
+
+metric_valkey_keys = Metric(
+    name="valkey_keys",
+    title=Title("Keys"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.BLUE,
+)
+
+metric_valkey_expires = Metric(
+    name="valkey_expires",
+    title=Title("Keys with expiration"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.ORANGE,
+)
+
+graph_valkey_keys_combined = Graph(
+    name="valkey_keys_combined",
+    title=Title("Keys and keys with expiration"),
+    simple_lines=["valkey_keys", "valkey_expires"],
+    minimal_range=MinimalRange(0, 1),
+)
+
+metric_valkey_expires_ratio = Metric(
+    name="valkey_expires_ratio",
+    title=Title("Expiring keys"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(2)),
+    color=Color.YELLOW,
+)
+
+metric_valkey_avg_ttl = Metric(
+    name="valkey_avg_ttl",
+    title=Title("Average TTL"),
+    unit=Unit(TimeNotation()),
+    color=Color.GREEN,
+)
+
+metric_valkey_keys_growth = Metric(
+    name="valkey_keys_growth",
+    title=Title("Key growth per hour"),
+    unit=Unit(DecimalNotation("/h"), AutoPrecision(1)),
+    color=Color.PURPLE,
+)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.graphs import Graph
+from cmk.graphing.v1.metrics import (
+    AutoPrecision,
+    Color,
+    DecimalNotation,
+    IECNotation,
+    Metric,
+    TimeNotation,
+    Unit,
+)
+
+metric_valkey_fork_latency = Metric(
+    name="valkey_fork_latency",
+    title=Title("Duration of the latest fork"),
+    unit=Unit(TimeNotation()),
+    color=Color.RED,
+)
+
+metric_valkey_rdb_cow_size = Metric(
+    name="valkey_rdb_cow_size",
+    title=Title("Copy-on-write memory of the last RDB save"),
+    unit=Unit(IECNotation("B")),
+    color=Color.BLUE,
+)
+
+metric_valkey_aof_cow_size = Metric(
+    name="valkey_aof_cow_size",
+    title=Title("Copy-on-write memory of the last AOF rewrite"),
+    unit=Unit(IECNotation("B")),
+    color=Color.GREEN,
+)
+
+graph_valkey_cow_size = Graph(
+    name="valkey_cow_size",
+    title=Title("Copy-on-write memory"),
+    simple_lines=["valkey_rdb_cow_size", "valkey_aof_cow_size"],
+)
+
+metric_valkey_rdb_duration = Metric(
+    name="valkey_rdb_duration",
+    title=Title("Duration of the last RDB save"),
+    unit=Unit(TimeNotation()),
+    color=Color.BLUE,
+)
+
+metric_valkey_aof_duration = Metric(
+    name="valkey_aof_duration",
+    title=Title("Duration of the last AOF rewrite"),
+    unit=Unit(TimeNotation()),
+    color=Color.GREEN,
+)
+
+metric_valkey_rdb_current_duration = Metric(
+    name="valkey_rdb_current_duration",
+    title=Title("Duration of the running RDB save"),
+    unit=Unit(TimeNotation()),
+    color=Color.LIGHT_BLUE,
+)
+
+metric_valkey_aof_current_duration = Metric(
+    name="valkey_aof_current_duration",
+    title=Title("Duration of the running AOF rewrite"),
+    unit=Unit(TimeNotation()),
+    color=Color.LIGHT_GREEN,
+)
+
+graph_valkey_persistence_duration = Graph(
+    name="valkey_persistence_duration",
+    title=Title("Duration of RDB saves and AOF rewrites"),
+    simple_lines=[
+        "valkey_rdb_duration",
+        "valkey_aof_duration",
+        "valkey_rdb_current_duration",
+        "valkey_aof_current_duration",
+    ],
+)
+
+metric_valkey_rdb_duration_growth = Metric(
+    name="valkey_rdb_duration_growth",
+    title=Title("Growth of the RDB save duration"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(1)),
+    color=Color.DARK_BLUE,
+)
+
+metric_valkey_aof_duration_growth = Metric(
+    name="valkey_aof_duration_growth",
+    title=Title("Growth of the AOF rewrite duration"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(1)),
+    color=Color.DARK_GREEN,
+)
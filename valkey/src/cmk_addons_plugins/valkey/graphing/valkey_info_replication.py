@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.metrics import (
+    AutoPrecision,
+    Color,
+    DecimalNotation,
+    IECNotation,
+    Metric,
+    StrictPrecision,
+    TimeNotation,
+    Unit,
+)
+
+metric_valkey_connected_replicas = Metric(
+    name="valkey_connected_replicas",
+    title=Title("Connected replicas"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.BLUE,
+)
+
+metric_valkey_repl_lag_bytes = Metric(
+    name="valkey_repl_lag_bytes",
+    title=Title("Replication offset lag"),
+    unit=Unit(IECNotation("B")),
+    color=Color.ORANGE,
+)
+
+metric_valkey_repl_backlog_usage = Metric(
+    name="valkey_repl_backlog_usage",
+    title=Title("Replication offset lag in percent of the backlog"),
+    unit=Unit(DecimalNotation("%"), AutoPrecision(2)),
+    color=Color.DARK_ORANGE,
+)
+
+metric_valkey_repl_lag_seconds = Metric(
+    name="valkey_repl_lag_seconds",
+    title=Title("Time since last replica acknowledgement"),
+    unit=Unit(TimeNotation()),
+    color=Color.YELLOW,
+)
+
+metric_valkey_master_last_io = Metric(
+    name="valkey_master_last_io",
+    title=Title("Time since last interaction with master"),
+    unit=Unit(TimeNotation()),
+    color=Color.GREEN,
+)
+
+metric_valkey_master_link_down = Metric(
+    name="valkey_master_link_down",
+    title=Title("Duration of master link down"),
+    unit=Unit(TimeNotation()),
+    color=Color.RED,
+)
+
+metric_valkey_repl_throughput = Metric(
+    name="valkey_repl_throughput",
+    title=Title("Replication throughput"),
+    unit=Unit(IECNotation("B/s")),
+    color=Color.PURPLE,
+)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.graphs import Graph, MinimalRange
+from cmk.graphing.v1.metrics import (
+    AutoPrecision,
+    Color,
+    DecimalNotation,
+    Metric,
+    StrictPrecision,
+    TimeNotation,
+    Unit,
+)
+
+metric_valkey_latency_p50_max = Metric(
+    name="valkey_latency_p50_max",
+    title=Title("Highest median latency of a command"),
+    unit=Unit(DecimalNotation("µs"), StrictPrecision(0)),
+    color=Color.GREEN,
+)
+
+metric_valkey_latency_p99_max = Metric(
+    name="valkey_latency_p99_max",
+    title=Title("Highest 99th percentile latency of a command"),
+    unit=Unit(DecimalNotation("µs"), StrictPrecision(0)),
+    color=Color.ORANGE,
+)
+
+graph_valkey_latency_percentiles = Graph(
+    name="valkey_latency_percentiles",
+    title=Title("Command latency percentiles"),
+    simple_lines=["valkey_latency_p99_max", "valkey_latency_p50_max"],
+    minimal_range=MinimalRange(0, 1),
+)
+
+metric_valkey_slowlog_len = Metric(
+    name="valkey_slowlog_len",
+    title=Title("Slowlog entries"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.BLUE,
+)
+
+metric_valkey_slowlog_rate = Metric(
+    name="valkey_slowlog_rate",
+    title=Title("New slowlog entries per minute"),
+    unit=Unit(DecimalNotation("/min"), AutoPrecision(2)),
+    color=Color.PURPLE,
+)
+
+metric_valkey_slowlog_duration_max = Metric(
+    name="valkey_slowlog_duration_max",
+    title=Title("Execution time of the slowest new slowlog entry"),
+    unit=Unit(TimeNotation()),
+    color=Color.RED,
+)
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+
+from cmk.graphing.v1 import Title
+from cmk.graphing.v1.metrics import Color, DecimalNotation, Metric, StrictPrecision, Unit
+
+metric_valkey_sentinel_sentinels = Metric(
+    name="valkey_sentinel_sentinels",
+    title=Title("Sentinels monitoring the master"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.BLUE,
+)
+
+metric_valkey_sentinel_replicas = Metric(
+    name="valkey_sentinel_replicas",
+    title=Title("Replicas up"),
+    unit=Unit(DecimalNotation(""), StrictPrecision(0)),
+    color=Color.GREEN,
+)
@@ -9,11 +9,15 @@ from cmk.gui.agent_bakery import RulespecGroupMonitoringAgentsAgentPlugins
 from cmk.gui.i18n import _
 from cmk.gui.plugins.wato.utils import HostRulespec, rulespec_registry
 from cmk.gui.valuespec import (
+    Age,
     Alternative,
     CascadingDropdown,
+    Checkbox,
     Dictionary,
     FixedValue,
     Hostname,
+    Integer,
+    ListChoice,
     ListOf,
     Migrate,
     NetworkPort,
@@ -38,13 +42,51 @@ def _migrate(value: object) -> Any:
     return value
 
 
-def _valuespec_agent_config_valkey() -> CascadingDropdown:
-    return CascadingDropdown(
-        title=_("Valkey databases"),
+def _migrate_config(value: object) -> Any:
+    """Older rules only configured the instances
+
+    >>> _migrate_config("autodetect")
+    ('deploy', {'instances': 'autodetect'})
+    >>> _migrate_config(("deploy", {"instances": "autodetect", "timeout": 5}))
+    ('deploy', {'instances': 'autodetect', 'timeout': 5})
+    """
+    if value is None or (isinstance(value, tuple) and value[0] == "deploy"):
+        return value
+    return ("deploy", {"instances": value})
+
+
+def _valuespec_tls(title: str) -> Dictionary:
+    return Dictionary(
+        title=title,
         help=_(
-            "If you activate this option, then the agent plug-in <tt>valkey</tt> will be deployed. "
-            "You can configure multiple instances or auto detect running instances."
+            "Connect with TLS, the paths are paths on the monitored host. The settings of an "
+            "instance take precedence over the settings for all instances, which also apply "
+            "to autodetected instances."
         ),
+        elements=[
+            ("cacert", TextInput(title=_("CA certificate file"), allow_empty=False, size=60)),
+            ("cert", TextInput(title=_("Client certificate file"), allow_empty=False, size=60)),
+            (
+                "key",
+                TextInput(title=_("Private key file of the client"), allow_empty=False, size=60),
+            ),
+            ("sni", TextInput(title=_("Server name indication (SNI)"), allow_empty=False)),
+            (
+                "verify",
+                Checkbox(
+                    title=_("Verify the server certificate"),
+                    label=_("Verify the certificate (disable only for testing)"),
+                    default_value=True,
+                ),
+            ),
+        ],
+    )
+
+
+def _valuespec_instances() -> CascadingDropdown:
+    return CascadingDropdown(
+        title=_("Instances"),
+        help=_("You can configure multiple instances or auto detect running instances."),
         choices=[
             ("autodetect", _("Autodetect instances")),
             (
@@ -86,8 +128,9 @@ def _valuespec_agent_config_valkey() -> CascadingDropdown:
                                                                 default_value=6379,
                                                             ),
                                                         ),
+                                                        ("tls", _valuespec_tls(_("Use TLS"))),
                                                     ],
-                                                    optional_keys=False,
+                                                    optional_keys=["tls"],
                                                 ),
                                             ),
                                             (
@@ -133,11 +176,138 @@ def _valuespec_agent_config_valkey() -> CascadingDropdown:
                     ),
                 ),
             ),
-            (None, _("Do not deploy the Valkey plug-in")),
         ],
     )
 
 
+def _valuespec_bigkeys() -> Dictionary:
+    return Dictionary(
+        title=_("Sample the memory usage of keys"),
+        help=_(
+            "The keys of database 0 are sampled with SCAN and MEMORY USAGE for the service "
+            "<i>Valkey Big Keys</i>. A run of the agent plug-in samples a limited number of "
+            "keys for a limited time, large databases are scanned over several runs."
+        ),
+        elements=[
+            (
+                "interval",
+                Age(
+                    title=_("Minimal time between two runs"),
+                    default_value=300,
+                ),
+            ),
+            (
+                "budget",
+                Age(
+                    title=_("Maximal duration of a run"),
+                    display=["seconds"],
+                    minvalue=1,
+                    default_value=2,
+                ),
+            ),
+            (
+                "keys",
+                Integer(
+                    title=_("Maximal number of keys sampled by a run"),
+                    minvalue=1,
+                    default_value=10000,
+                ),
+            ),
+        ],
+    )
+
+
+def _valuespec_agent_config_valkey() -> Migrate:
+    return Migrate(
+        valuespec=CascadingDropdown(
+            title=_("Valkey databases"),
+            help=_(
+                "If you activate this option, then the agent plug-in <tt>valkey</tt> will be "
+                "deployed."
+            ),
+            choices=[
+                (
+                    "deploy",
+                    _("Deploy the Valkey plug-in"),
+                    Dictionary(
+                        elements=[
+                            ("instances", _valuespec_instances()),
+                            (
+                                "timeout",
+                                Age(
+                                    title=_("Timeout of a single command"),
+                                    display=["seconds"],
+                                    minvalue=1,
+                                    default_value=3,
+                                ),
+                            ),
+                            (
+                                "parallel",
+                                Integer(
+                                    title=_("Number of instances queried in parallel"),
+                                    minvalue=1,
+                                    default_value=1,
+                                ),
+                            ),
+                            (
+                                "sections",
+                                ListChoice(
+                                    title=_("Data collected in addition to INFO"),
+                                    choices=[
+                                        ("commandstats", _("Command statistics")),
+                                        ("latency", _("Latency and slow log")),
+                                        ("clientlist", _("Client connections (CLIENT LIST)")),
+                                        ("cluster", _("Cluster state and topology")),
+                                    ],
+                                    default_value=[
+                                        "commandstats",
+                                        "latency",
+                                        "clientlist",
+                                        "cluster",
+                                    ],
+                                ),
+                            ),
+                            (
+                                "interval",
+                                Age(
+                                    title=_("Query the instances asynchronously"),
+                                    help=_(
+                                        "Every instance is queried in the background and its "
+                                        "output is cached for this time. The agent prints the "
+                                        "cached output, so slow instances do not delay the "
+                                        "agent. The age of the data is shown by the service "
+                                        "<i>Valkey Server Info</i>."
+                                    ),
+                                    minvalue=60,
+                                    default_value=300,
+                                ),
+                            ),
+                            ("tls", _valuespec_tls(_("Use TLS for all instances"))),
+                            ("bigkeys", _valuespec_bigkeys()),
+                            (
+                                "client_groups_max",
+                                Integer(
+                                    title=_("Maximal number of client groups"),
+                                    help=_(
+                                        "Client connections are grouped by address and client "
+                                        "name, only the groups with the most connections are "
+                                        "sent."
+                                    ),
+                                    minvalue=1,
+                                    default_value=50,
+                                ),
+                            ),
+                        ],
+                        required_keys=["instances"],
+                    ),
+                ),
+                (None, _("Do not deploy the Valkey plug-in")),
+            ],
+        ),
+        migrate=_migrate_config,
+    )
+
+
 rulespec_registry.register(
     HostRulespec(
         group=RulespecGroupMonitoringAgentsAgentPlugins,
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="no-untyped-def"
+
+from cmk.rulesets.v1 import Help, Title
+from cmk.rulesets.v1.form_specs import (
+    DataSize,
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    IECMagnitude,
+    LevelDirection,
+    migrate_to_float_simple_levels,
+    migrate_to_integer_simple_levels,
+    SimpleLevels,
+    TimeMagnitude,
+    TimeSpan,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _parameter_form_valkey_bigkeys():
+    return Dictionary(
+        help_text=Help(
+            "The memory usage of the keys is only sampled if this is enabled in the "
+            "configuration of the agent plug-in (VALKEY_BIGKEYS=yes)."
+        ),
+        elements={
+            "key_size_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the memory usage of the biggest key"),
+                    form_spec_template=DataSize(
+                        displayed_magnitudes=[
+                            IECMagnitude.BYTE,
+                            IECMagnitude.KIBI,
+                            IECMagnitude.MEBI,
+                            IECMagnitude.GIBI,
+                        ]
+                    ),
+                    prefill_fixed_levels=DefaultValue(value=(10485760, 104857600)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "scan_age_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the age of the last complete scan"),
+                    help_text=Help(
+                        "Large databases are scanned over several runs of the agent plug-in. "
+                        "The age grows if the scan does not complete, e.g. because the "
+                        "number of keys grows faster than they are sampled."
+                    ),
+                    form_spec_template=TimeSpan(
+                        displayed_magnitudes=[
+                            TimeMagnitude.DAY,
+                            TimeMagnitude.HOUR,
+                            TimeMagnitude.MINUTE,
+                        ]
+                    ),
+                    prefill_fixed_levels=DefaultValue(value=(86400.0, 604800.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+        },
+    )
+
+
+rule_spec_valkey_bigkeys = CheckParameters(
+    name="valkey_bigkeys",
+    title=Title("Valkey big keys"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_bigkeys,
+    condition=HostAndItemCondition(item_title=Title("Valkey server name")),
+)
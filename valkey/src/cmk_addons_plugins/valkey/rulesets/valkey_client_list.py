@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="no-untyped-def"
+
+from cmk.rulesets.v1 import Help, Title
+from cmk.rulesets.v1.form_specs import (
+    DataSize,
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    IECMagnitude,
+    Integer,
+    LevelDirection,
+    migrate_to_integer_simple_levels,
+    SimpleLevels,
+    TimeMagnitude,
+    TimeSpan,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _data_size() -> DataSize:
+    return DataSize(
+        displayed_magnitudes=[
+            IECMagnitude.BYTE,
+            IECMagnitude.KIBI,
+            IECMagnitude.MEBI,
+            IECMagnitude.GIBI,
+        ]
+    )
+
+
+def _parameter_form_valkey_client_list():
+    return Dictionary(
+        elements={
+            "idle_time": DictElement(
+                parameter_form=TimeSpan(
+                    title=Title("Idle time of idle connections"),
+                    help_text=Help(
+                        "Connections are counted as idle if they are idle for longer than this "
+                        "time. The agent plug-in only sends the number of connections per idle "
+                        "time range, the time is rounded up to 1 s, 10 s, 1 min, 5 min, 30 min "
+                        "or 1 h."
+                    ),
+                    displayed_magnitudes=[
+                        TimeMagnitude.HOUR,
+                        TimeMagnitude.MINUTE,
+                        TimeMagnitude.SECOND,
+                    ],
+                    prefill=DefaultValue(300.0),
+                ),
+            ),
+            "idle_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the number of idle connections"),
+                    form_spec_template=Integer(),
+                    prefill_fixed_levels=DefaultValue(value=(1000, 5000)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "pubsub_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the number of Pub/Sub connections"),
+                    form_spec_template=Integer(),
+                    prefill_fixed_levels=DefaultValue(value=(1000, 5000)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "blocked_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the number of blocked connections"),
+                    form_spec_template=Integer(),
+                    prefill_fixed_levels=DefaultValue(value=(100, 500)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "omem_total_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the memory of all output buffers"),
+                    form_spec_template=_data_size(),
+                    prefill_fixed_levels=DefaultValue(value=(268435456, 1073741824)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "omem_max_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the output buffer memory of a single connection"),
+                    form_spec_template=_data_size(),
+                    prefill_fixed_levels=DefaultValue(value=(16777216, 67108864)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+        }
+    )
+
+
+rule_spec_valkey_client_list = CheckParameters(
+    name="valkey_client_list",
+    title=Title("Valkey client connections"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_client_list,
+    condition=HostAndItemCondition(item_title=Title("Valkey server name")),
+)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="no-untyped-def"
+
+from cmk.rulesets.v1 import Title
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    Integer,
+    LevelDirection,
+    migrate_to_float_simple_levels,
+    migrate_to_integer_simple_levels,
+    Percentage,
+    ServiceState,
+    SimpleLevels,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _parameter_form_valkey_cluster():
+    return Dictionary(
+        elements={
+            "slots_ok_lower": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.LOWER,
+                    title=Title("Lower levels on the hash slots served by the cluster"),
+                    form_spec_template=Percentage(),
+                    prefill_fixed_levels=DefaultValue(value=(100.0, 100.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "known_nodes_lower": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.LOWER,
+                    title=Title("Lower levels on the number of known nodes"),
+                    form_spec_template=Integer(),
+                    prefill_fixed_levels=DefaultValue(value=(6, 3)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "nodes_failed_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the number of failed nodes"),
+                    form_spec_template=Integer(),
+                    prefill_fixed_levels=DefaultValue(value=(1, 2)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "pfail_state": DictElement(
+                parameter_form=ServiceState(
+                    title=Title("State when a node is possibly failing"),
+                    prefill=DefaultValue(value=ServiceState.WARN),
+                ),
+            ),
+            "no_replica_state": DictElement(
+                parameter_form=ServiceState(
+                    title=Title("State when a master has no working replica"),
+                    prefill=DefaultValue(value=ServiceState.WARN),
+                ),
+            ),
+        }
+    )
+
+
+rule_spec_valkey_cluster = CheckParameters(
+    name="valkey_cluster",
+    title=Title("Valkey cluster"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_cluster,
+    condition=HostAndItemCondition(item_title=Title("Valkey server name")),
+)
+
+
+def _parameter_form_valkey_cluster_balance():
+    return Dictionary(
+        elements={
+            "slots_deviation_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the deviation of the slots of a master"),
+                    form_spec_template=Percentage(),
+                    prefill_fixed_levels=DefaultValue(value=(10.0, 25.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "keys_deviation_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the deviation of the keys of a master"),
+                    form_spec_template=Percentage(),
+                    prefill_fixed_levels=DefaultValue(value=(50.0, 100.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+        }
+    )
+
+
+rule_spec_valkey_cluster_balance = CheckParameters(
+    name="valkey_cluster_balance",
+    title=Title("Valkey cluster balance"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_cluster_balance,
+    condition=HostAndItemCondition(item_title=Title("Valkey server name")),
+)
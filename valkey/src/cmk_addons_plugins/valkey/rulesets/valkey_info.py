@@ -5,13 +5,14 @@
 
 # mypy: disable-error-code="no-untyped-def"
 
-from cmk.rulesets.v1 import Title
+from cmk.rulesets.v1 import Help, Title
 from cmk.rulesets.v1.form_specs import (
     DefaultValue,
     DictElement,
     Dictionary,
     LevelDirection,
     migrate_to_float_simple_levels,
+    ServiceState,
     SimpleLevels,
     SingleChoice,
     SingleChoiceElement,
@@ -66,6 +67,17 @@ def _parameter_form_valkey_info():
                     migrate=migrate_to_float_simple_levels,
                 ),
             ),
+            "stale_state": DictElement(
+                parameter_form=ServiceState(
+                    title=Title("State if the cached data is outdated"),
+                    help_text=Help(
+                        "If the agent plug-in queries the instances asynchronously "
+                        "(VALKEY_CACHE_AGE), the data is outdated if it is older than twice "
+                        "the cache age, e.g. because the instance does not respond in time."
+                    ),
+                    prefill=DefaultValue(value=ServiceState.WARN),
+                ),
+            ),
         }
     )
 
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="no-untyped-def"
+
+from cmk.rulesets.v1 import Help, Label, Title
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    Float,
+    Integer,
+    LevelDirection,
+    List,
+    migrate_to_float_simple_levels,
+    SimpleLevels,
+    String,
+    validators,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _parameter_form_valkey_info_commandstats():
+    return Dictionary(
+        elements={
+            "top_n": DictElement(
+                parameter_form=Integer(
+                    title=Title("Number of commands with metrics"),
+                    help_text=Help(
+                        "Call rate and average time per call are reported for the commands "
+                        "with the highest call rate only, to keep the number of metrics bounded."
+                    ),
+                    prefill=DefaultValue(5),
+                    custom_validate=(validators.NumberInRange(min_value=0),),
+                ),
+                required=True,
+            ),
+            "calls_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the total number of commands per second"),
+                    form_spec_template=Float(unit_symbol="/s"),
+                    prefill_fixed_levels=DefaultValue(value=(0.0, 0.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "command_levels": DictElement(
+                parameter_form=List(
+                    title=Title("Levels on the average time per call of commands"),
+                    element_template=Dictionary(
+                        elements={
+                            "command": DictElement(
+                                parameter_form=String(
+                                    title=Title("Command"),
+                                    help_text=Help(
+                                        'Name of the command in lower case, subcommands are '
+                                        'separated by "|", e.g. "config|get".'
+                                    ),
+                                    custom_validate=(validators.LengthInRange(min_value=1),),
+                                ),
+                                required=True,
+                            ),
+                            "usec_per_call": DictElement(
+                                parameter_form=SimpleLevels(
+                                    level_direction=LevelDirection.UPPER,
+                                    title=Title("Upper levels on the average time per call"),
+                                    form_spec_template=Float(unit_symbol="µs"),
+                                    prefill_fixed_levels=DefaultValue(value=(100.0, 1000.0)),
+                                    migrate=migrate_to_float_simple_levels,
+                                ),
+                                required=True,
+                            ),
+                        }
+                    ),
+                    add_element_label=Label("Add command"),
+                    remove_element_label=Label("Remove command"),
+                ),
+            ),
+        }
+    )
+
+
+rule_spec_valkey_info_commandstats = CheckParameters(
+    name="valkey_info_commandstats",
+    title=Title("Valkey commands"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_info_commandstats,
+    condition=HostAndItemCondition(item_title=Title("Valkey server name")),
+)
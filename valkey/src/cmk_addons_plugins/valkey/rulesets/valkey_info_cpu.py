@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="no-untyped-def"
+
+from cmk.rulesets.v1 import Title
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    LevelDirection,
+    migrate_to_float_simple_levels,
+    Percentage,
+    SimpleLevels,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _parameter_form_valkey_info_cpu():
+    return Dictionary(
+        elements={
+            "util_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the CPU utilization of the server process"),
+                    form_spec_template=Percentage(),
+                    prefill_fixed_levels=DefaultValue(value=(80.0, 90.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "main_thread_util_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the CPU utilization of the main thread"),
+                    form_spec_template=Percentage(),
+                    prefill_fixed_levels=DefaultValue(value=(70.0, 90.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "children_util_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the CPU utilization of the background processes"),
+                    form_spec_template=Percentage(),
+                    prefill_fixed_levels=DefaultValue(value=(80.0, 90.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+        }
+    )
+
+
+rule_spec_valkey_info_cpu = CheckParameters(
+    name="valkey_info_cpu",
+    title=Title("Valkey CPU utilization"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_info_cpu,
+    condition=HostAndItemCondition(item_title=Title("Valkey server name")),
+)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="no-untyped-def"
+
+from cmk.rulesets.v1 import Title
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    Float,
+    Integer,
+    LevelDirection,
+    migrate_to_float_simple_levels,
+    migrate_to_integer_simple_levels,
+    Percentage,
+    SimpleLevels,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _parameter_form_valkey_info_keyspace():
+    return Dictionary(
+        elements={
+            "keys_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the number of keys"),
+                    form_spec_template=Integer(),
+                    prefill_fixed_levels=DefaultValue(value=(0, 0)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "growth_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the key growth per hour"),
+                    form_spec_template=Float(),
+                    prefill_fixed_levels=DefaultValue(value=(0.0, 0.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "expires_ratio_lower": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.LOWER,
+                    title=Title("Lower levels on the percentage of keys with an expiration"),
+                    form_spec_template=Percentage(),
+                    prefill_fixed_levels=DefaultValue(value=(0.0, 0.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+        }
+    )
+
+
+rule_spec_valkey_info_keyspace = CheckParameters(
+    name="valkey_info_keyspace",
+    title=Title("Valkey keyspace"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_info_keyspace,
+    condition=HostAndItemCondition(item_title=Title("Valkey server name and database")),
+)
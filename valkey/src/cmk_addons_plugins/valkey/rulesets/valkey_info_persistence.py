@@ -7,18 +7,30 @@
 
 from cmk.rulesets.v1 import Title
 from cmk.rulesets.v1.form_specs import (
+    DataSize,
     DefaultValue,
     DictElement,
     Dictionary,
+    Float,
+    IECMagnitude,
     Integer,
     LevelDirection,
+    migrate_to_float_simple_levels,
     migrate_to_integer_simple_levels,
     ServiceState,
     SimpleLevels,
+    TimeMagnitude,
+    TimeSpan,
 )
 from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
 
 
+def _time_span() -> TimeSpan:
+    return TimeSpan(
+        displayed_magnitudes=[TimeMagnitude.HOUR, TimeMagnitude.MINUTE, TimeMagnitude.SECOND]
+    )
+
+
 def _parameter_form_valkey_info_persistence():
     return Dictionary(
         elements={
@@ -43,6 +55,63 @@ def _parameter_form_valkey_info_persistence():
                     migrate=migrate_to_integer_simple_levels,
                 ),
             ),
+            "fork_latency_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the duration of the latest fork"),
+                    form_spec_template=TimeSpan(
+                        displayed_magnitudes=[TimeMagnitude.SECOND, TimeMagnitude.MILLISECOND]
+                    ),
+                    prefill_fixed_levels=DefaultValue(value=(0.1, 0.5)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "cow_size_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title(
+                        "Upper levels on the copy-on-write memory of the last RDB save or AOF rewrite"
+                    ),
+                    form_spec_template=DataSize(
+                        displayed_magnitudes=[
+                            IECMagnitude.MEBI,
+                            IECMagnitude.GIBI,
+                        ]
+                    ),
+                    prefill_fixed_levels=DefaultValue(value=(1073741824, 4294967296)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "rdb_current_duration_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the duration of a running RDB save"),
+                    form_spec_template=_time_span(),
+                    prefill_fixed_levels=DefaultValue(value=(300.0, 900.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "aof_current_duration_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the duration of a running AOF rewrite"),
+                    form_spec_template=_time_span(),
+                    prefill_fixed_levels=DefaultValue(value=(300.0, 900.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "duration_growth_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title(
+                        "Upper levels on the growth of the duration of the last RDB save or "
+                        "AOF rewrite compared to the average of the previous ones"
+                    ),
+                    form_spec_template=Float(unit_symbol="%"),
+                    prefill_fixed_levels=DefaultValue(value=(50.0, 100.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
         }
     )
 
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="no-untyped-def"
+
+from cmk.rulesets.v1 import Title
+from cmk.rulesets.v1.form_specs import (
+    DataSize,
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    IECMagnitude,
+    Integer,
+    LevelDirection,
+    migrate_to_float_simple_levels,
+    migrate_to_integer_simple_levels,
+    Percentage,
+    ServiceState,
+    SimpleLevels,
+    TimeMagnitude,
+    TimeSpan,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _time_span() -> TimeSpan:
+    return TimeSpan(
+        displayed_magnitudes=[TimeMagnitude.HOUR, TimeMagnitude.MINUTE, TimeMagnitude.SECOND]
+    )
+
+
+def _parameter_form_valkey_info_replication():
+    return Dictionary(
+        elements={
+            "replicas_lower": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.LOWER,
+                    title=Title("Lower levels on the number of connected replicas"),
+                    form_spec_template=Integer(),
+                    prefill_fixed_levels=DefaultValue(value=(1, 1)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "replica_offline_state": DictElement(
+                parameter_form=ServiceState(
+                    title=Title("State when a connected replica is not online"),
+                    prefill=DefaultValue(value=ServiceState.WARN),
+                ),
+            ),
+            "lag_bytes_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the replication offset lag of a replica"),
+                    form_spec_template=DataSize(
+                        displayed_magnitudes=[
+                            IECMagnitude.BYTE,
+                            IECMagnitude.KIBI,
+                            IECMagnitude.MEBI,
+                        ]
+                    ),
+                    prefill_fixed_levels=DefaultValue(value=(1048576, 10485760)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "backlog_usage_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title(
+                        "Upper levels on the replication offset lag in percent of the backlog size"
+                    ),
+                    form_spec_template=Percentage(),
+                    prefill_fixed_levels=DefaultValue(value=(50.0, 80.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "lag_seconds_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the time since the last acknowledgement of a replica"),
+                    form_spec_template=_time_span(),
+                    prefill_fixed_levels=DefaultValue(value=(10.0, 30.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "master_link_down_state": DictElement(
+                parameter_form=ServiceState(
+                    title=Title("State when the link of a replica to its master is down"),
+                    prefill=DefaultValue(value=ServiceState.CRIT),
+                ),
+            ),
+            "link_down_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the duration the link to the master is down"),
+                    form_spec_template=_time_span(),
+                    prefill_fixed_levels=DefaultValue(value=(60.0, 300.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "last_io_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the time since the last interaction with the master"),
+                    form_spec_template=_time_span(),
+                    prefill_fixed_levels=DefaultValue(value=(30.0, 60.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+        }
+    )
+
+
+rule_spec_valkey_info_replication = CheckParameters(
+    name="valkey_info_replication",
+    title=Title("Valkey replication"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_info_replication,
+    condition=HostAndItemCondition(item_title=Title("Valkey server name")),
+)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="no-untyped-def"
+
+from cmk.rulesets.v1 import Title
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    Float,
+    LevelDirection,
+    migrate_to_float_simple_levels,
+    SimpleLevels,
+    TimeMagnitude,
+    TimeSpan,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _parameter_form_valkey_latency():
+    return Dictionary(
+        elements={
+            "p50_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the median latency of a command"),
+                    form_spec_template=Float(unit_symbol="µs"),
+                    prefill_fixed_levels=DefaultValue(value=(100.0, 1000.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "p99_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the 99th percentile latency of a command"),
+                    form_spec_template=Float(unit_symbol="µs"),
+                    prefill_fixed_levels=DefaultValue(value=(1000.0, 10000.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "event_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on latency spikes of the latency monitor"),
+                    form_spec_template=TimeSpan(
+                        displayed_magnitudes=[TimeMagnitude.SECOND, TimeMagnitude.MILLISECOND]
+                    ),
+                    prefill_fixed_levels=DefaultValue(value=(0.1, 0.5)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "slowlog_rate_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on new slowlog entries per minute"),
+                    form_spec_template=Float(unit_symbol="/min"),
+                    prefill_fixed_levels=DefaultValue(value=(1.0, 10.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+            "slowlog_duration_upper": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.UPPER,
+                    title=Title("Upper levels on the execution time of new slowlog entries"),
+                    form_spec_template=TimeSpan(
+                        displayed_magnitudes=[TimeMagnitude.SECOND, TimeMagnitude.MILLISECOND]
+                    ),
+                    prefill_fixed_levels=DefaultValue(value=(0.1, 1.0)),
+                    migrate=migrate_to_float_simple_levels,
+                ),
+            ),
+        }
+    )
+
+
+rule_spec_valkey_latency = CheckParameters(
+    name="valkey_latency",
+    title=Title("Valkey latency"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_latency,
+    condition=HostAndItemCondition(item_title=Title("Valkey server name")),
+)
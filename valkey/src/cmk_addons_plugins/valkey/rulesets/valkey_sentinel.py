@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# Copyright (C) 2019 Checkmk GmbH - License: GNU General Public License v2
+# This file is part of Checkmk (https://checkmk.com). It is subject to the terms and
+# conditions defined in the file COPYING, which is part of this source code package.
+
+# mypy: disable-error-code="no-untyped-def"
+
+from cmk.rulesets.v1 import Title
+from cmk.rulesets.v1.form_specs import (
+    DefaultValue,
+    DictElement,
+    Dictionary,
+    Integer,
+    LevelDirection,
+    migrate_to_integer_simple_levels,
+    ServiceState,
+    SimpleLevels,
+    TimeMagnitude,
+    TimeSpan,
+)
+from cmk.rulesets.v1.rule_specs import CheckParameters, HostAndItemCondition, Topic
+
+
+def _parameter_form_valkey_sentinel():
+    return Dictionary(
+        elements={
+            "sdown_state": DictElement(
+                parameter_form=ServiceState(
+                    title=Title("State when the master is subjectively down"),
+                    prefill=DefaultValue(value=ServiceState.WARN),
+                ),
+            ),
+            "odown_state": DictElement(
+                parameter_form=ServiceState(
+                    title=Title("State when the master is objectively down"),
+                    prefill=DefaultValue(value=ServiceState.CRIT),
+                ),
+            ),
+            "sentinels_lower": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.LOWER,
+                    title=Title("Lower levels on the number of sentinels monitoring the master"),
+                    form_spec_template=Integer(),
+                    prefill_fixed_levels=DefaultValue(value=(3, 2)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "replicas_lower": DictElement(
+                parameter_form=SimpleLevels(
+                    level_direction=LevelDirection.LOWER,
+                    title=Title("Lower levels on the number of replicas which are up"),
+                    form_spec_template=Integer(),
+                    prefill_fixed_levels=DefaultValue(value=(1, 1)),
+                    migrate=migrate_to_integer_simple_levels,
+                ),
+            ),
+            "replica_down_state": DictElement(
+                parameter_form=ServiceState(
+                    title=Title("State when a replica is down"),
+                    prefill=DefaultValue(value=ServiceState.WARN),
+                ),
+            ),
+            "failover_state": DictElement(
+                parameter_form=ServiceState(
+                    title=Title("State after a failover or a restart of the master"),
+                    prefill=DefaultValue(value=ServiceState.WARN),
+                ),
+            ),
+            "failover_age": DictElement(
+                parameter_form=TimeSpan(
+                    title=Title("Time to report a failover or a restart of the master"),
+                    displayed_magnitudes=[
+                        TimeMagnitude.DAY,
+                        TimeMagnitude.HOUR,
+                        TimeMagnitude.MINUTE,
+                    ],
+                    prefill=DefaultValue(3600.0),
+                ),
+            ),
+        }
+    )
+
+
+rule_spec_valkey_sentinel = CheckParameters(
+    name="valkey_sentinel",
+    title=Title("Valkey sentinel"),
+    topic=Topic.APPLICATIONS,
+    parameter_form=_parameter_form_valkey_sentinel,
+    condition=HostAndItemCondition(item_title=Title("Valkey sentinel and master name")),
+)
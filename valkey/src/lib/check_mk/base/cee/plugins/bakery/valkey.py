@@ -5,7 +5,7 @@
 from collections.abc import Iterator, Sequence
 from pathlib import Path
 from shlex import quote
-from typing import Literal, TypedDict
+from typing import Literal, NotRequired, TypedDict
 
 from .bakery_api.v1 import (
     FileGenerator,
@@ -17,9 +17,18 @@ from .bakery_api.v1 import (
 )
 
 
+class TlsParams(TypedDict, total=False):
+    cacert: str
+    cert: str
+    key: str
+    sni: str
+    verify: bool
+
+
 class ConnectionParamsTcp(TypedDict):
     host: str
     port: int
+    tls: NotRequired[TlsParams]
 
 
 class ConnectionParamsSocket(TypedDict):
@@ -35,21 +44,76 @@ class ValkeyInstance(TypedDict):
     password: password_store.PasswordId | str | None
 
 
-ValkeyConfig = Literal["autodetect"] | tuple[Literal["static"], Sequence[ValkeyInstance]]
+ValkeyInstances = Literal["autodetect"] | tuple[Literal["static"], Sequence[ValkeyInstance]]
+
+
+class ValkeyBigkeys(TypedDict, total=False):
+    interval: int
+    budget: int
+    keys: int
+
+
+class ValkeyOptions(TypedDict, total=False):
+    instances: ValkeyInstances
+    timeout: int
+    parallel: int
+    tls: TlsParams
+    sections: Sequence[str]
+    interval: int
+    bigkeys: ValkeyBigkeys
+    client_groups_max: int
+
+
+# rules created before the options were added only configure the instances
+ValkeyConfig = ValkeyInstances | tuple[Literal["deploy"], ValkeyOptions]
+
+
+def _get_options(conf: ValkeyConfig) -> ValkeyOptions:
+    if isinstance(conf, tuple) and conf[0] == "deploy":
+        return conf[1]
+    return {"instances": conf}
 
 
 def get_valkey_files(conf: ValkeyConfig) -> FileGenerator:
+    options = _get_options(conf)
     yield Plugin(base_os=OS.LINUX, source=Path("valkey"))
 
     yield PluginConfig(
         base_os=OS.LINUX,
-        lines=list(_get_valkey_config(conf)),
+        lines=list(_get_valkey_config(options)),
         target=Path("valkey.cfg"),
         include_header=True,
     )
 
 
-def _get_valkey_config(conf: ValkeyConfig) -> Iterator[str]:
+def _get_valkey_config(options: ValkeyOptions) -> Iterator[str]:
+    yield from _get_instances_config(options["instances"])
+
+    if "timeout" in options:
+        yield f"VALKEY_TIMEOUT={options['timeout']}"
+    if "parallel" in options:
+        yield f"VALKEY_PARALLEL={options['parallel']}"
+    if "tls" in options:
+        yield from _get_tls_config("", options["tls"])
+    if "interval" in options:
+        # the plug-in caches the output of every instance itself
+        yield f"VALKEY_CACHE_AGE={options['interval']}"
+    if "sections" in options:
+        yield f"VALKEY_SECTIONS={quote(' '.join(options['sections']))}"
+    if "client_groups_max" in options:
+        yield f"VALKEY_CLIENT_GROUPS_MAX={options['client_groups_max']}"
+    if "bigkeys" in options:
+        bigkeys = options["bigkeys"]
+        yield "VALKEY_BIGKEYS=yes"
+        if "interval" in bigkeys:
+            yield f"VALKEY_BIGKEYS_INTERVAL={bigkeys['interval']}"
+        if "budget" in bigkeys:
+            yield f"VALKEY_BIGKEYS_BUDGET={bigkeys['budget']}"
+        if "keys" in bigkeys:
+            yield f"VALKEY_BIGKEYS_KEYS={bigkeys['keys']}"
+
+
+def _get_instances_config(conf: ValkeyInstances) -> Iterator[str]:
     if conf == "autodetect":
         yield "# Autodetect instances"
         return
@@ -71,10 +135,20 @@ def _get_valkey_config(conf: ValkeyConfig) -> Iterator[str]:
         yield f"VALKEY_PORT_{instance}={quote(str(port))}"
         if password is not None:
             yield f"VALKEY_PASSWORD_{instance}={quote(password_store.extract(password))}"
+        if connection[0] == "tcp" and "tls" in connection[1]:
+            yield from _get_tls_config(f"_{instance}", connection[1]["tls"])
 
     yield "VALKEY_INSTANCES=(%s)" % " ".join(e["instance"] for e in conf[1])
 
 
+def _get_tls_config(suffix: str, tls: TlsParams) -> Iterator[str]:
+    yield f"VALKEY_TLS{suffix}=yes"
+    for key in ("cacert", "cert", "key", "sni"):
+        if (value := tls.get(key)) is not None:
+            yield f"VALKEY_TLS_{key.upper()}{suffix}={quote(value)}"
+    yield f"VALKEY_TLS_VERIFY{suffix}={'yes' if tls.get('verify', True) else 'no'}"
+
+
 register.bakery_plugin(
     name="valkey",
     files_function=get_valkey_files,